@@ -1,33 +1,57 @@
 """
 Main entry point for Aviation MAS-A2A System
 """
-import asyncio
+import importlib.util
+import os
+
 import uvicorn
-from src.aviation_mas_a2a.app import app
-from src.aviation_mas_a2a.shared.config import config
+from loguru import logger
+from src.aviation_mas_a2a.shared.config import get_config
 from src.aviation_mas_a2a.shared.logging_config import setup_logging
 
 
-async def main():
+def main():
     """Main application entry point"""
+    config = get_config()
+    
     # Setup logging
     setup_logging()
     
-    print("=" * 50)
-    print("Aviation MAS-A2A System")
-    print("Multi-Agent System for Aviation Operations")
-    print(f"Server: http://{config.server_host}:{config.server_port}")
-    print(f"MCP Base Port: {config.mcp_base_port}")
-    print("=" * 50)
+    # Startup banner as one (queued) log record; only useful while developing
+    if config.debug:
+        rule = "=" * 50
+        logger.info(
+            f"\n{rule}\n"
+            "Aviation MAS-A2A System\n"
+            "Multi-Agent System for Aviation Operations\n"
+            f"Server: http://{config.server_host}:{config.server_port}\n"
+            f"MCP Base Port: {config.mcp_base_port}\n"
+            f"{rule}"
+        )
+    
+    # uvloop is not available on Windows; fall back to the stdlib loop there
+    loop = "uvloop" if importlib.util.find_spec("uvloop") else "asyncio"
+    
+    # Reload runs a single worker; otherwise use one process per core by default
+    workers = 1 if config.debug else (config.server_workers or os.cpu_count())
+    
+    # Only one process can bind the MCP ports; serve them here for multi-worker runs
+    from src.aviation_mas_a2a.mcp_servers import share_tool_servers
+    share_tool_servers(workers)
     
-    # Start the FastAPI server
+    # Start the FastAPI server; reload and workers both need the import string
     uvicorn.run(
-        app,
+        "src.aviation_mas_a2a.app:app",
         host=config.server_host,
         port=config.server_port,
-        reload=config.debug
+        reload=config.debug,
+        workers=workers,
+        loop=loop,
+        http="httptools",
+        log_level="warning",
+        access_log=False
     )
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    main()
@@ -0,0 +1,9 @@
+"""
+Environment defaults that must be in place before LiteLLM is first imported
+
+Import this module ahead of litellm or google.adk.models.
+"""
+import os
+
+# Use LiteLLM's bundled model cost map instead of fetching it on first import
+os.environ.setdefault("LITELLM_LOCAL_MODEL_COST_MAP", "True")
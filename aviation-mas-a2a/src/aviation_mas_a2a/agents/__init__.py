@@ -1,14 +1,40 @@
 """
 Aviation Agents Module for Google ADK
 """
+import os
 
-# Import the main agent for ADK discovery
-try:
-    from .aviation_agent import root_agent, AviationBaseAgent
-    
-    # Export for ADK
-    __all__ = ["root_agent", "AviationBaseAgent"]
-    
-except ImportError as e:
-    print(f"Warning: Could not import aviation agent: {e}")
-    root_agent = None
\ No newline at end of file
+from loguru import logger
+
+# Export for ADK
+__all__ = ["root_agent", "AviationBaseAgent"]
+
+
+def __getattr__(name):
+    """Import the main agent on first access for ADK discovery
+
+    Importing this package (e.g. for the agent manager) no longer pulls in
+    google.adk and litellm; they load the first time an export is requested.
+    """
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    try:
+        from . import aviation_agent
+
+        if name == "root_agent":
+            value = aviation_agent.get_root_agent()
+        else:
+            value = aviation_agent.AviationBaseAgent
+
+    except ImportError as e:
+        logger.warning(f"Could not import aviation agent: {e}")
+        value = None
+
+    globals()[name] = value
+    return value
+
+
+# Resolve everything at import time when requested (e.g. in CI)
+if os.getenv("AVIATION_EAGER_IMPORT") == "1":
+    for _name in __all__:
+        __getattr__(_name)
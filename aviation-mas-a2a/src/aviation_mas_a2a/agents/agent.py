@@ -3,9 +3,23 @@ Aviation Base Agent for ADK Web Interface
 Simple agent that ADK can discover and load
 """
 import os
+
+# LiteLLM environment defaults; must run before google.adk / litellm are imported
+try:
+    from .. import _litellm_env  # noqa: F401
+except ImportError:
+    # Loaded as a top-level module by ADK (src/ is on sys.path)
+    import aviation_mas_a2a._litellm_env  # noqa: F401
+
 from google.adk.agents import Agent
 from google.adk.models.lite_llm import LiteLlm
 
+try:
+    from .prompts import build_instruction
+except ImportError:
+    # Loaded as a top-level module by ADK
+    from prompts import build_instruction
+
 
 # Create the agent that ADK will discover
 agent = Agent(
@@ -17,32 +31,6 @@ agent = Agent(
         max_tokens=2000
     ),
     description="Aviation operations coordinator for HR, meetings, and supply chain",
-    instruction="""You are the Aviation Base Agent, a comprehensive coordinator for aviation operations.
-
-Your primary responsibilities:
-1. HR Operations: Handle employee management, crew scheduling, training, certifications
-2. Meeting Coordination: Schedule meetings, manage calendars, coordinate team communications  
-3. Supply Chain: Manage inventory, parts procurement, vendor relationships, maintenance supplies
-4. General Coordination: Route complex requests to appropriate specialized functions
-
-Aviation Departments: Flight Operations, Maintenance, Ground Services, Air Traffic Control, Safety & Security, Customer Service, Cargo Operations, Engineering, Quality Assurance, Training, Human Resources, Finance
-
-When users ask for help with:
-- Employee/crew/pilot/staff management, training, certifications → Provide HR guidance
-- Scheduling meetings/appointments/conferences, calendar management → Provide meeting coordination
-- Inventory/parts/procurement/maintenance supplies, vendor management → Provide supply chain guidance
-- Complex multi-department requests → Provide comprehensive coordination
-
-Always provide clear, professional responses. If you need to perform specific actions, explain what you would do and what information you would need.
-
-Maintain aviation industry standards and terminology in all communications.
-Be concise but thorough in your responses.
-
-Example responses:
-- For HR requests: "I can help you with crew scheduling. What specific dates and positions do you need to schedule?"
-- For meeting requests: "I can coordinate that meeting. What's the preferred date, time, and attendees?"
-- For supply chain requests: "I can assist with inventory management. What parts or supplies do you need to track?"
-
-Always acknowledge the request and provide actionable next steps.""",
+    instruction=build_instruction(with_examples=True),
     tools=[],  # No tools for now, just focus on getting responses working
 )
\ No newline at end of file
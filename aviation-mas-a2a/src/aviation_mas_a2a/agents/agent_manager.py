@@ -2,11 +2,53 @@
 Agent manager for coordinating multiple aviation agents using Google ADK
 """
 import asyncio
-from typing import Dict, List, Any, Optional
+import re
+import time
+from typing import Dict, List, Any, Mapping, Optional, Tuple
 from loguru import logger
 
-from ..shared.config import config
+from ..shared.batching import MicroBatcher
+from ..shared.config import get_config
+from ..shared.conversation_store import Conversation, create_conversation_store
+from ..shared.logging_config import debug_enabled
+from ..shared.metadata_cache import get_model_meta, get_api_key_status
 from .base_agent import BaseAgent, AviationBaseAgent, HRAgent, MeetingAgent, SupplyChainAgent
+from .results import EMPTY, RouteResult, ConversationResult, BroadcastResult, SystemStatus
+
+
+# Specialized agent classes by type
+_AGENT_CLASSES = {
+    "base": AviationBaseAgent,
+    "hr": HRAgent,
+    "meeting": MeetingAgent,
+    "supply_chain": SupplyChainAgent,
+}
+
+# Routing keywords per agent, in priority order
+_ROUTING_KEYWORDS = (
+    ("hr", ("crew", "pilot", "staff", "training", "certification", "schedule")),
+    ("meeting", ("meeting", "schedule", "calendar", "appointment", "conference")),
+    ("supply_chain", ("inventory", "parts", "supply", "order", "vendor", "procurement")),
+)
+
+# One precompiled matcher for all keyword sets: each alternative looks ahead
+# for any of its agent's keywords from the start of the message, so the first
+# matching group in priority order wins (same result as the sequential scans).
+# The patterns run on message.lower() like the substring checks they replace,
+# so Unicode case folding can't match text that lower() leaves alone
+_ROUTER = re.compile(
+    "|".join(
+        f"(?=.*?(?:{'|'.join(map(re.escape, keywords))}))(?P<{agent_type}>)"
+        for agent_type, keywords in _ROUTING_KEYWORDS
+    ),
+    re.DOTALL
+)
+
+# Per-agent substring matchers, in the same priority order
+_AGENT_PATTERNS = tuple(
+    re.compile("|".join(map(re.escape, keywords)))
+    for _, keywords in _ROUTING_KEYWORDS
+)
 
 
 class AgentManager:
@@ -14,20 +56,27 @@ class AgentManager:
     
     def __init__(self):
         self.agents: Dict[str, BaseAgent] = {}
-        self.active_conversations: Dict[str, Dict[str, Any]] = {}
+        # Conversations are bounded (oldest evicted first) and, with Redis
+        # configured, shared across server workers
+        config = get_config()
+        self.conversations = create_conversation_store(config.redis_url, config.max_active_conversations)
+        
+        # Keyword -> (priority, agent type) for whole-word lookups
+        self._kw_index: Dict[str, Tuple[int, str]] = {}
+        for priority, (agent_type, keywords) in enumerate(_ROUTING_KEYWORDS):
+            for keyword in keywords:
+                self._kw_index.setdefault(keyword, (priority, agent_type))
+        
+        # Coalesces concurrent submit_message callers into route_batch calls
+        self._batcher = MicroBatcher(self.route_batch, max_batch_size=16, max_wait_ms=10)
         
     async def register_agent(self, agent_type: str, agent_config: Dict[str, Any] = None) -> BaseAgent:
         """Register a new agent in the system"""
         try:
             # Create specialized agents based on type
-            if agent_type == "base":
-                agent = AviationBaseAgent()
-            elif agent_type == "hr":
-                agent = HRAgent()
-            elif agent_type == "meeting":
-                agent = MeetingAgent()
-            elif agent_type == "supply_chain":
-                agent = SupplyChainAgent()
+            agent_class = _AGENT_CLASSES.get(agent_type)
+            if agent_class:
+                agent = agent_class()
             else:
                 # Fallback to generic agent
                 agent_config = agent_config or {}
@@ -38,6 +87,9 @@ class AgentManager:
                 })
                 agent = BaseAgent(agent_config)
             
+            # Model metadata comes from the local cache; refreshed in the background
+            agent.model_meta = get_model_meta(getattr(agent, "llm_model", None) or get_config().litellm_model)
+            
             self.agents[agent_type] = agent
             
             logger.info(f"Registered {agent_type} agent: {agent.name}")
@@ -52,9 +104,17 @@ class AgentManager:
         try:
             agent_types = ["base", "hr", "meeting", "supply_chain"]
             
-            for agent_type in agent_types:
-                if agent_type not in self.agents:
-                    await self.register_agent(agent_type)
+            # Never blocks on the provider; the opt-in key check runs once in the background
+            config = get_config()
+            if get_api_key_status(config.litellm_model, config.litellm_api_key, check=config.llm_key_check) is False:
+                logger.warning("LiteLLM API key missing, agents will run in demo mode")
+            
+            # Register missing agents concurrently
+            await asyncio.gather(*(
+                self.register_agent(agent_type)
+                for agent_type in agent_types
+                if agent_type not in self.agents
+            ))
             
             logger.info(f"Initialized {len(self.agents)} agents")
             return self.agents
@@ -67,10 +127,10 @@ class AgentManager:
         """Get an agent by type"""
         return self.agents.get(agent_type)
     
-    async def route_message(self, message: str, target_agent: str = None, context: Dict[str, Any] = None) -> Dict[str, Any]:
+    async def route_message(self, message: str, target_agent: str = None, context: Optional[Mapping[str, Any]] = None) -> RouteResult:
         """Route a message to the appropriate agent"""
         try:
-            context = context or {}
+            context = context or EMPTY
             
             # If no target specified, determine best agent
             if not target_agent:
@@ -79,135 +139,138 @@ class AgentManager:
             # Get the target agent
             agent = await self.get_agent(target_agent)
             if not agent:
-                return {
-                    "status": "error",
-                    "message": f"Agent '{target_agent}' not found",
-                    "available_agents": list(self.agents.keys())
-                }
+                return RouteResult(
+                    status="error",
+                    message=f"Agent '{target_agent}' not found",
+                    available_agents=list(self.agents.keys())
+                )
             
             # Process the message
             response = await agent.process_message(message, context)
             
             logger.info(f"Routed message to {target_agent} agent")
-            return {
-                "status": "success",
-                "agent": target_agent,
-                "response": response,
-                "context": context
-            }
+            return RouteResult(
+                status="success",
+                agent=target_agent,
+                response=response,
+                context=dict(context) if context else EMPTY
+            )
             
         except Exception as e:
             logger.error(f"Failed to route message: {e}")
-            return {
-                "status": "error",
-                "message": f"Failed to route message: {str(e)}"
-            }
+            return RouteResult(status="error", message=f"Failed to route message: {str(e)}")
+    
+    async def route_batch(
+        self,
+        messages: List[Tuple[str, Optional[str], Optional[Mapping[str, Any]]]],
+        concurrency: int = 16
+    ) -> List[RouteResult | BaseException]:
+        """Route several (message, target_agent, context) tuples concurrently"""
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def _route_one(message, target_agent=None, context=None):
+            async with semaphore:
+                return await self.route_message(message, target_agent, context)
+        
+        return await asyncio.gather(*(_route_one(*item) for item in messages), return_exceptions=True)
     
-    async def _determine_target_agent(self, message: str, context: Dict[str, Any]) -> str:
+    async def submit_message(self, message: str, target_agent: str = None, context: Optional[Mapping[str, Any]] = None) -> RouteResult:
+        """Route a message through the micro-batcher (opt-in)
+        
+        route_batch gains nothing per message over route_message, and every call
+        can wait up to the batch window, so request handlers use route_message.
+        """
+        return await self._batcher.submit((message, target_agent, context))
+    
+    async def _determine_target_agent(self, message: str, context: Mapping[str, Any]) -> str:
         """Determine which agent should handle the message"""
+        # Fast path: a whole-word keyword hit wins unless a higher-priority
+        # agent's keyword occurs somewhere as a substring
         message_lower = message.lower()
+        hits = [self._kw_index[token] for token in message_lower.split() if token in self._kw_index]
+        if hits:
+            priority, agent_type = min(hits)
+            if not any(pattern.search(message_lower) for pattern in _AGENT_PATTERNS[:priority]):
+                return agent_type
         
-        # HR keywords
-        if any(keyword in message_lower for keyword in ["crew", "pilot", "staff", "training", "certification", "schedule"]):
-            return "hr"
-        
-        # Meeting keywords
-        if any(keyword in message_lower for keyword in ["meeting", "schedule", "calendar", "appointment", "conference"]):
-            return "meeting"
+        match = _ROUTER.match(message_lower)
         
-        # Supply chain keywords
-        if any(keyword in message_lower for keyword in ["inventory", "parts", "supply", "order", "vendor", "procurement"]):
-            return "supply_chain"
+        if debug_enabled():
+            logger.debug(f"Routing match for {message[:80]!r}: {match.lastgroup if match else None}")
         
         # Default to base agent
-        return "base"
+        return match.lastgroup if match else "base"
     
-    async def start_conversation(self, conversation_id: str, participants: List[str]) -> Dict[str, Any]:
+    async def start_conversation(self, conversation_id: str, participants: List[str]) -> ConversationResult:
         """Start a multi-agent conversation"""
-        try:
-            self.active_conversations[conversation_id] = {
-                "id": conversation_id,
-                "participants": participants,
-                "messages": [],
-                "started_at": asyncio.get_event_loop().time(),
-                "status": "active"
-            }
-            
-            logger.info(f"Started conversation {conversation_id} with agents: {participants}")
-            return {
-                "status": "success",
-                "conversation_id": conversation_id,
-                "participants": participants
-            }
-            
-        except Exception as e:
-            logger.error(f"Failed to start conversation: {e}")
-            return {"status": "error", "message": str(e)}
+        await self.conversations.put(Conversation(
+            id=conversation_id,
+            participants=tuple(participants),
+            started_at=time.time()
+        ))
+        
+        logger.info(f"Started conversation {conversation_id} with agents: {participants}")
+        return ConversationResult(status="success", conversation_id=conversation_id, participants=participants)
     
-    async def broadcast_message(self, message: str, exclude_agents: List[str] = None) -> Dict[str, Any]:
+    async def broadcast_message(self, message: str, exclude_agents: List[str] = None) -> BroadcastResult:
         """Broadcast a message to all agents"""
+        exclude_agents = set(exclude_agents or ())
+        
+        # Fan out to all agents at once; one failure doesn't cancel the others
+        tasks = {
+            agent_type: asyncio.create_task(self._safe_process_message(agent, message))
+            for agent_type, agent in self.agents.items()
+            if agent_type not in exclude_agents
+        }
+        results = await asyncio.gather(*tasks.values())
+        responses = dict(zip(tasks, results))
+        
+        logger.info(f"Broadcasted message to {len(responses)} agents")
+        return BroadcastResult(status="success", message="Message broadcasted", responses=responses)
+    
+    @staticmethod
+    async def _safe_process_message(agent: BaseAgent, message: str) -> Dict[str, Any]:
+        """Process a message, turning failures into an error response"""
         try:
-            exclude_agents = exclude_agents or []
-            responses = {}
-            
-            for agent_type, agent in self.agents.items():
-                if agent_type not in exclude_agents:
-                    try:
-                        response = await agent.process_message(message)
-                        responses[agent_type] = response
-                    except Exception as e:
-                        responses[agent_type] = {"status": "error", "message": str(e)}
-            
-            logger.info(f"Broadcasted message to {len(responses)} agents")
-            return {
-                "status": "success",
-                "message": "Message broadcasted",
-                "responses": responses
-            }
-            
+            return await agent.process_message(message)
         except Exception as e:
-            logger.error(f"Failed to broadcast message: {e}")
             return {"status": "error", "message": str(e)}
     
-    async def get_system_status(self) -> Dict[str, Any]:
-        """Get status of all agents and the system"""
+    @staticmethod
+    async def _safe_get_status(agent: BaseAgent) -> Dict[str, Any]:
+        """Get an agent's status, turning failures into an error entry"""
         try:
-            agent_status = {}
-            
-            for agent_type, agent in self.agents.items():
-                try:
-                    status = await agent.get_status()
-                    agent_status[agent_type] = status
-                except Exception as e:
-                    agent_status[agent_type] = {"status": "error", "message": str(e)}
-            
-            return {
-                "status": "success",
-                "system_status": "operational",
-                "total_agents": len(self.agents),
-                "active_conversations": len(self.active_conversations),
-                "agents": agent_status
-            }
-            
+            return await agent.get_status()
         except Exception as e:
-            logger.error(f"Failed to get system status: {e}")
             return {"status": "error", "message": str(e)}
     
+    async def get_system_status(self) -> SystemStatus:
+        """Get status of all agents and the system"""
+        # Query all agents concurrently
+        statuses = await asyncio.gather(
+            *(self._safe_get_status(agent) for agent in self.agents.values())
+        )
+        agent_status = dict(zip(self.agents, statuses))
+        
+        return SystemStatus(
+            status="success",
+            system_status="operational",
+            total_agents=len(self.agents),
+            active_conversations=await self.conversations.count(),
+            agents=agent_status
+        )
+    
     async def shutdown(self):
         """Shutdown all agents and cleanup resources"""
-        try:
-            for agent_type, agent in self.agents.items():
-                try:
-                    if hasattr(agent, 'shutdown'):
-                        await agent.shutdown()
-                    logger.info(f"Shutdown {agent_type} agent")
-                except Exception as e:
-                    logger.error(f"Error shutting down {agent_type} agent: {e}")
-            
-            self.agents.clear()
-            self.active_conversations.clear()
-            logger.info("Agent manager shutdown complete")
-            
-        except Exception as e:
-            logger.error(f"Error during shutdown: {e}")
-            raise
\ No newline at end of file
+        for agent_type, agent in self.agents.items():
+            try:
+                if hasattr(agent, 'shutdown'):
+                    await agent.shutdown()
+                logger.info(f"Shutdown {agent_type} agent")
+            except Exception as e:
+                logger.error(f"Error shutting down {agent_type} agent: {e}")
+        
+        await self._batcher.close()
+        self.agents.clear()
+        await self.conversations.close()
+        logger.info("Agent manager shutdown complete")
@@ -4,11 +4,19 @@ Standalone file without relative imports to work with ADK
 """
 import os
 import sys
-from typing import Dict, Any, List, Optional
-from google.adk.agents import Agent
-from google.adk.models.lite_llm import LiteLlm
+from typing import Dict, Any, List
 from loguru import logger
 
+try:
+    from .. import _litellm_env  # noqa: F401  (LiteLLM env defaults, set before litellm loads)
+    from ..shared.llm import get_lite_llm
+    from .prompts import build_instruction
+except ImportError:
+    # Loaded as a top-level module by ADK (src/ is on sys.path)
+    import aviation_mas_a2a._litellm_env  # noqa: F401
+    from aviation_mas_a2a.shared.llm import get_lite_llm
+    from prompts import build_instruction
+
 
 # Simple configuration instead of relative imports
 class SimpleConfig:
@@ -26,16 +34,19 @@ class AviationBaseAgent:
     """Aviation Base Agent using Google ADK with web interface"""
     
     def __init__(self):
+        # ADK/LiteLLM are heavy; only load them once an agent is actually built
+        from google.adk.agents import Agent
+        
         self.name = "Aviation Base Agent"
         
         # Create Google ADK agent with LiteLLM
         self.agent = Agent(
             name="aviation_base_agent",
-            model=LiteLlm(
-                model=config.default_model,
-                api_key=config.litellm_api_key,
-                temperature=config.temperature,
-                max_tokens=config.max_tokens
+            model=get_lite_llm(
+                config.default_model,
+                config.litellm_api_key,
+                config.temperature,
+                config.max_tokens
             ),
             description="Aviation operations coordinator for HR, meetings, and supply chain",
             instruction=self._get_agent_instruction(),
@@ -46,26 +57,7 @@ class AviationBaseAgent:
     
     def _get_agent_instruction(self) -> str:
         """Get the comprehensive instruction for the aviation agent"""
-        return """You are the Aviation Base Agent, a comprehensive coordinator for aviation operations.
-
-Your primary responsibilities:
-1. HR Operations: Handle employee management, crew scheduling, training, certifications
-2. Meeting Coordination: Schedule meetings, manage calendars, coordinate team communications  
-3. Supply Chain: Manage inventory, parts procurement, vendor relationships, maintenance supplies
-4. General Coordination: Route complex requests to appropriate specialized functions
-
-Aviation Departments: Flight Operations, Maintenance, Ground Services, Air Traffic Control, Safety & Security, Customer Service, Cargo Operations, Engineering, Quality Assurance, Training, Human Resources, Finance
-
-When users ask for help with:
-- Employee/crew/pilot/staff management, training, certifications → Provide HR guidance
-- Scheduling meetings/appointments/conferences, calendar management → Provide meeting coordination
-- Inventory/parts/procurement/maintenance supplies, vendor management → Provide supply chain guidance
-- Complex multi-department requests → Provide comprehensive coordination
-
-Always provide clear, professional responses. If you need to perform specific actions, explain what you would do and what information you would need.
-
-Maintain aviation industry standards and terminology in all communications.
-Be concise but thorough in your responses."""
+        return build_instruction()
     
     def _get_agent_tools(self) -> List[Any]:
         """Get all available tools for the agent"""
@@ -128,15 +120,36 @@ How can I assist you with your aviation operations today?"""
             return f"❌ Error processing your request: {str(e)}"
 
 
-# Create the root_agent instance for ADK discovery
-# This is the key - ADK looks for this specific variable name
-root_agent = AviationBaseAgent()
+# The root_agent instance for ADK discovery is created on first access
+_root_agent = None
+
+
+def get_root_agent() -> AviationBaseAgent:
+    """Get the shared root agent, creating it on first use"""
+    global _root_agent
+    if _root_agent is None:
+        _root_agent = AviationBaseAgent()
+        logger.info(f"Root agent created: {_root_agent.name}")
+    return _root_agent
+
+
+def __getattr__(name):
+    """Resolve ADK discovery attributes lazily"""
+    # This is the key - ADK looks for this specific variable name
+    if name == "root_agent":
+        return get_root_agent()
+    
+    # Alternative approach - also export the agent directly
+    if name == "agent":
+        root_agent = get_root_agent()
+        return root_agent.agent if hasattr(root_agent, 'agent') else root_agent
+    
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
-# Alternative approach - also export the agent directly
-agent = root_agent.agent if hasattr(root_agent, 'agent') else root_agent
+if os.getenv("AVIATION_EAGER_IMPORT") == "1":
+    get_root_agent()
 
 
 # For debugging - log when this module is imported
 logger.info("Aviation Base Agent module loaded successfully")
-logger.info(f"Root agent created: {root_agent.name}")
\ No newline at end of file
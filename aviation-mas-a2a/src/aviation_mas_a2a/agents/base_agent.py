@@ -1,39 +1,67 @@
 """
-Aviation Base Agent using Google ADK with web interface
+Base agent classes for the aviation MAS-A2A system
 """
-from typing import Dict, Any, List, Optional
+from functools import cached_property
+from importlib import import_module
+from typing import Dict, Any, List, Optional, Tuple
 import asyncio
-from google.adk.agents import Agent
-from google.adk.models.lite_llm import LiteLlm
 from loguru import logger
 
-from ..shared.config import config
-from ..mcp_servers.hr_tools import HRTools
-from ..mcp_servers.meeting_tools import MeetingTools
-from ..mcp_servers.supply_chain_tools import SupplyChainTools
+from ..shared.config import get_config
 
 
-class AviationBaseAgent:
-    """Aviation Base Agent using Google ADK with web interface"""
+def _load_tool_server(key: str) -> Any:
+    """Get the shared MCP tool server, importing only its module on first use"""
+    return import_module("..mcp_servers", __package__).get_tool_server(key)
+
+
+class BaseAgent:
+    """Base class for aviation agents backed by LiteLLM"""
     
-    def __init__(self):
-        self.name = "Aviation Base Agent"
+    # MCP tool servers this agent works with
+    _needed_tools: Tuple[str, ...] = ()
+    
+    def __init__(self, agent_config: Dict[str, Any]):
+        config = get_config()
         
-        # Initialize MCP tool servers
-        self.hr_tools = HRTools()
-        self.meeting_tools = MeetingTools()
-        self.supply_chain_tools = SupplyChainTools()
+        self.name = agent_config.get("name", "Aviation Agent")
+        self.agent_type = agent_config.get("agent_type", "base")
+        self.description = agent_config.get("description", "")
+        self.instructions = agent_config.get("instructions", "")
         
-        # Create Google ADK agent with LiteLLM
-        self.agent = Agent(
-            name="aviation_base_agent",
-            model=LiteLlm(model=config.litellm_model or "gpt-3.5-turbo"),
-            description="Aviation multi-agent coordinator for HR, meetings, and supply chain operations",
-            instruction=self._get_agent_instruction(),
-            tools=self._get_agent_tools(),
-        )
+        # LLM settings; per-agent values override the global config
+        self.llm_model = agent_config.get("model") or config.litellm_model or "gpt-3.5-turbo"
+        self.llm_config = {
+            "model": self.llm_model,
+            "api_key": agent_config.get("api_key", config.litellm_api_key),
+            "api_base": agent_config.get("api_base", config.litellm_base_url),
+            "temperature": agent_config.get("temperature", config.temperature),
+            "max_tokens": agent_config.get("max_tokens", config.max_tokens),
+        }
+        self.available_tools: List[Any] = []
         
-        logger.info(f"Aviation Base Agent initialized with ADK web interface")
+        logger.info(f"Initialized {self.name}")
+    
+    # MCP tool servers are created on first access
+    @cached_property
+    def tool_servers(self) -> List[Any]:
+        """The MCP tool servers this agent works with"""
+        return [getattr(self, f"{key}_tools") for key in self._needed_tools]
+    
+    @cached_property
+    def hr_tools(self):
+        """HR MCP tool server"""
+        return _load_tool_server("hr")
+    
+    @cached_property
+    def meeting_tools(self):
+        """Meeting MCP tool server"""
+        return _load_tool_server("meeting")
+    
+    @cached_property
+    def supply_chain_tools(self):
+        """Supply chain MCP tool server"""
+        return _load_tool_server("supply_chain")
     
     def add_mcp_tools(self, tools: List[Any]):
         """Add MCP tools to the agent"""
@@ -82,6 +110,8 @@ class AviationBaseAgent:
             
             # Call LiteLLM with proper configuration
             try:
+                import litellm
+                
                 response = await litellm.acompletion(
                     model=self.llm_model,
                     messages=messages,
@@ -148,6 +178,8 @@ class AviationBaseAgent:
 class AviationBaseAgent(BaseAgent):
     """Main aviation coordination agent"""
     
+    _needed_tools = ("hr", "meeting", "supply_chain")
+    
     def __init__(self):
         super().__init__({
             "name": "Aviation Base Agent",
@@ -160,6 +192,8 @@ class AviationBaseAgent(BaseAgent):
 class HRAgent(BaseAgent):
     """HR operations agent"""
     
+    _needed_tools = ("hr",)
+    
     def __init__(self):
         super().__init__({
             "name": "Aviation HR Agent", 
@@ -172,6 +206,8 @@ class HRAgent(BaseAgent):
 class MeetingAgent(BaseAgent):
     """Meeting coordination agent"""
     
+    _needed_tools = ("meeting",)
+    
     def __init__(self):
         super().__init__({
             "name": "Aviation Meeting Agent",
@@ -184,6 +220,8 @@ class MeetingAgent(BaseAgent):
 class SupplyChainAgent(BaseAgent):
     """Supply chain management agent"""
     
+    _needed_tools = ("supply_chain",)
+    
     def __init__(self):
         super().__init__({
             "name": "Aviation Supply Chain Agent",
@@ -1,65 +1,132 @@
 """
 Aviation Base Agent using Google ADK with web interface
 """
-from typing import Dict, Any, List
+import asyncio
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, List, Optional
 from google.adk.agents import Agent
-from google.adk.models.lite_llm import LiteLlm
+from google.adk.runners import InMemoryRunner
+from google.genai import types
 from loguru import logger
 
-from ..shared.config import config
-from ..mcp_servers.hr_tools import HRTools
-from ..mcp_servers.meeting_tools import MeetingTools
-from ..mcp_servers.supply_chain_tools import SupplyChainTools
+from ..shared.batching import MicroBatcher
+from ..shared.config import get_config, get_config_snapshot
+from ..shared.llm import get_lite_llm
+from ..mcp_servers import (
+    HRTools, MeetingTools, SupplyChainTools, get_tool_server
+)
+from .prompts import build_instruction, static_instruction
+
+
+# Fixed instruction prefix shared by every instance (and by the provider's prefix cache)
+_STATIC_INSTRUCTION = static_instruction(use_tools=True)
+
+
+@lru_cache(maxsize=1)
+def _instruction() -> str:
+    """Full instruction, built on first use; the configuration doesn't change at runtime"""
+    return build_instruction(departments=tuple(get_config().aviation_departments), use_tools=True)
+
+
+@lru_cache(maxsize=1)
+def _success_meta() -> MappingProxyType:
+    """Response metadata shared by all successful execute() results (read-only)"""
+    return MappingProxyType({
+        "agent": "aviation_base_agent",
+        "model": get_config().litellm_model or "gpt-3.5-turbo",
+        "status": "success"
+    })
+
+
+_APP_NAME = "aviation_base_agent"
+_USER_ID = "aviation_mas"
+
+_ERROR_META = MappingProxyType({
+    "agent": "aviation_base_agent",
+    "status": "error"
+})
+
+# Keep references to fire-and-forget warm-up tasks
+_background_tasks = set()
+
+
+def _llm_options(config, **overrides) -> Dict[str, Any]:
+    """LiteLLM connection and sampling options from the config (unset ones omitted)"""
+    options = {
+        "api_key": config.litellm_api_key,
+        "api_base": config.litellm_base_url,
+        "temperature": config.temperature,
+        "max_tokens": config.max_tokens,
+        **overrides
+    }
+    return {k: v for k, v in options.items() if v is not None}
 
 
 class AviationBaseAgent:
     """Aviation Base Agent using Google ADK with web interface"""
     
-    def __init__(self):
+    __slots__ = (
+        "name", "hr_tools", "meeting_tools", "supply_chain_tools", "_tools", "agent", "_runner", "_batcher"
+    )
+    
+    def __init__(
+        self,
+        hr: Optional[HRTools] = None,
+        meeting: Optional[MeetingTools] = None,
+        supply_chain: Optional[SupplyChainTools] = None
+    ):
         self.name = "Aviation Base Agent"
+        config = get_config()
         
-        # Initialize MCP tool servers
-        self.hr_tools = HRTools()
-        self.meeting_tools = MeetingTools()
-        self.supply_chain_tools = SupplyChainTools()
+        # Use the process-wide MCP tool servers unless others are passed in
+        self.hr_tools = hr or get_tool_server("hr")
+        self.meeting_tools = meeting or get_tool_server("meeting")
+        self.supply_chain_tools = supply_chain or get_tool_server("supply_chain")
+        
+        # Tool list is fixed for the agent's lifetime
+        self._tools = self._build_agent_tools()
         
         # Create Google ADK agent with LiteLLM
         self.agent = Agent(
             name="aviation_base_agent",
-            model=LiteLlm(model=config.litellm_model or "gpt-3.5-turbo"),
+            model=get_lite_llm(config.litellm_model or "gpt-3.5-turbo"),
             description="Aviation multi-agent coordinator for HR, meetings, and supply chain operations",
-            instruction=self._get_agent_instruction(),
-            tools=self._get_agent_tools(),
+            instruction=_instruction(),
+            tools=self._tools,
+        )
+        # Runs the agent's tool-calling loop; ADK's LiteLlm calls litellm.acompletion
+        self._runner = InMemoryRunner(agent=self.agent, app_name=_APP_NAME)
+        
+        # Concurrent execute() calls are collected and run as one concurrent batch
+        self._batcher = MicroBatcher(
+            self._execute_batch,
+            max_batch_size=config.llm_batch_max_size,
+            max_wait_ms=config.llm_batch_window_ms
         )
         
+        # Populate the provider's prompt cache with the static prefix
+        if config.llm_prefix_warmup:
+            try:
+                task = asyncio.get_running_loop().create_task(self.warm_up())
+                _background_tasks.add(task)
+                task.add_done_callback(_background_tasks.discard)
+            except RuntimeError:
+                # No running loop (e.g. ADK web import); callers can await warm_up()
+                pass
+        
         logger.info(f"Aviation Base Agent initialized with ADK web interface")
     
     def _get_agent_instruction(self) -> str:
         """Get the comprehensive instruction for the aviation agent"""
-        return f"""You are the Aviation Base Agent, a comprehensive coordinator for aviation operations.
-
-Your primary responsibilities:
-1. HR Operations: Handle employee management, crew scheduling, training, certifications
-2. Meeting Coordination: Schedule meetings, manage calendars, coordinate team communications  
-3. Supply Chain: Manage inventory, parts procurement, vendor relationships, maintenance supplies
-4. General Coordination: Route complex requests to appropriate specialized functions
-
-Aviation Departments: {', '.join(config.aviation_departments)}
-
-When users ask for help with:
-- Employee/crew/pilot/staff management, training, certifications → Use HR tools
-- Scheduling meetings/appointments/conferences, calendar management → Use meeting tools  
-- Inventory/parts/procurement/maintenance supplies, vendor management → Use supply chain tools
-- Complex multi-department requests → Coordinate across multiple tool sets
-
-Always use the appropriate tools for each request. Analyze tool responses and provide clear, 
-professional feedback to users. If a tool returns an error, explain it clearly and suggest alternatives.
-
-Maintain aviation industry standards and terminology in all communications.
-Be concise but thorough in your responses."""
+        return _instruction()
     
     def _get_agent_tools(self) -> List[Any]:
         """Get all available MCP tools for the agent"""
+        return self._tools
+    
+    def _build_agent_tools(self) -> List[Any]:
+        """Collect the MCP tools from all tool servers"""
         tools = []
         
         # Add HR tools
@@ -79,44 +146,85 @@ Be concise but thorough in your responses."""
         try:
             logger.info(f"Aviation Base Agent processing: {message}")
             
-            # Use the ADK agent to process the request
-            response = await self.agent.execute(message)
+            # Use the ADK agent to process the request (batched with concurrent callers)
+            response = await self._batcher.submit(message)
             
-            return {
-                "response": response,
-                "metadata": {
-                    "agent": "aviation_base_agent",
-                    "model": config.litellm_model or "gpt-3.5-turbo",
-                    "status": "success"
-                }
-            }
+            return {"response": response, "metadata": _success_meta()}
             
         except Exception as e:
             logger.error(f"Error in Aviation Base Agent: {e}")
-            return {
-                "response": f"❌ Aviation System Error: {str(e)}",
-                "metadata": {
-                    "agent": "aviation_base_agent",
-                    "status": "error"
-                }
-            }
+            return {"response": f"❌ Aviation System Error: {str(e)}", "metadata": _ERROR_META}
 
+    async def _execute_batch(self, messages: List[str]) -> List[Any]:
+        """Run a batch of messages through the agent concurrently
+        
+        Each message gets its own tool-calling turn and session, even when the text
+        repeats: the tools have side effects (records, meetings, orders).
+        """
+        return await asyncio.gather(
+            *(self._complete(message) for message in messages),
+            return_exceptions=True
+        )
+    
+    async def _complete(self, message: str) -> str:
+        """Run one message through the ADK agent, tools included, and return its final reply
+        
+        The model is called through litellm.acompletion, so this never blocks the event loop.
+        Each message gets its own throwaway session.
+        """
+        sessions = self._runner.session_service
+        session = await sessions.create_session(app_name=_APP_NAME, user_id=_USER_ID)
+        content = types.Content(role="user", parts=[types.Part(text=message)])
+        
+        reply = ""
+        try:
+            async for event in self._runner.run_async(
+                user_id=_USER_ID, session_id=session.id, new_message=content
+            ):
+                if event.is_final_response() and event.content and event.content.parts:
+                    reply = "".join(part.text or "" for part in event.content.parts)
+        finally:
+            await sessions.delete_session(app_name=_APP_NAME, user_id=_USER_ID, session_id=session.id)
+        return reply
+    
+    async def warm_up(self):
+        """Send one tiny request so the backend caches the instruction prefix"""
+        try:
+            import litellm
+            
+            config = get_config_snapshot()
+            await litellm.acompletion(
+                model=config.litellm_model or "gpt-3.5-turbo",
+                messages=[
+                    {"role": "system", "content": _STATIC_INSTRUCTION},
+                    {"role": "user", "content": "ping"}
+                ],
+                **_llm_options(config, max_tokens=1)
+            )
+            logger.info("Prompt prefix cache warmed up")
+        except Exception as e:
+            logger.warning(f"Prompt prefix warm-up failed: {e}")
+    
     async def get_status(self) -> Dict[str, Any]:
         """Get agent status"""
         return {
             "name": self.name,
             "agent_type": "base",
             "status": "active",
-            "model": config.litellm_model or "gpt-3.5-turbo",
+            "model": get_config_snapshot().litellm_model or "gpt-3.5-turbo",
             "description": "Aviation multi-agent coordinator",
-            "tools_count": len(self._get_agent_tools())
+            "tools_count": len(self._tools)
         }
     
     async def shutdown(self):
         """Shutdown the agent"""
         logger.info(f"Shutting down {self.name}")
-        # Cleanup resources if needed
+        await self._batcher.close()
 
 
-# Create the root_agent instance for ADK discovery
-root_agent = AviationBaseAgent()
\ No newline at end of file
+def __getattr__(name):
+    """Create the root_agent instance for ADK discovery on first access"""
+    if name == "root_agent":
+        agent = globals()["root_agent"] = AviationBaseAgent()
+        return agent
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
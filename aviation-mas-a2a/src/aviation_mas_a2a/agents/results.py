@@ -0,0 +1,47 @@
+"""
+Result types returned by the agent manager
+"""
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional
+
+
+# Shared read-only empty context (avoids a new dict per request)
+EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+
+@dataclass(slots=True)
+class RouteResult:
+    """Outcome of routing a message to an agent"""
+    status: str
+    agent: Optional[str] = None
+    response: Any = None
+    context: Optional[Mapping[str, Any]] = None
+    message: Optional[str] = None
+    available_agents: Optional[List[str]] = None
+
+
+@dataclass(slots=True)
+class ConversationResult:
+    """Outcome of starting a conversation"""
+    status: str
+    conversation_id: str
+    participants: List[str]
+
+
+@dataclass(slots=True)
+class BroadcastResult:
+    """Responses from a broadcast, by agent type"""
+    status: str
+    message: str
+    responses: Dict[str, Any]
+
+
+@dataclass(slots=True)
+class SystemStatus:
+    """Status of the agent manager and its agents"""
+    status: str
+    system_status: str
+    total_agents: int
+    active_conversations: int
+    agents: Dict[str, Any]
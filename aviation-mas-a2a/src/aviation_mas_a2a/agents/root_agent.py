@@ -2,43 +2,57 @@
 Root agent for ADK discovery
 """
 import os
+
+# LiteLLM environment defaults; must run before google.adk / litellm are imported
+try:
+    from .. import _litellm_env  # noqa: F401
+except ImportError:
+    # Loaded as a top-level module by ADK (src/ is on sys.path)
+    import aviation_mas_a2a._litellm_env  # noqa: F401
+
 from google.adk.agents import Agent
 from google.adk.models.lite_llm import LiteLlm
 
+try:
+    from .prompts import build_instruction
+except ImportError:
+    # Loaded as a top-level module by ADK
+    from prompts import build_instruction
+
+
+# Model settings shared by the ADK agent and the async adapter below
+_MODEL = "gpt-3.5-turbo"
+_LLM_OPTIONS = {
+    "api_key": os.getenv("LITELLM_API_KEY", "demo-key"),
+    "temperature": 0.1,
+    "max_tokens": 2000
+}
+_INSTRUCTION = build_instruction(variant="coordinator")
 
 # Create the root agent that ADK will discover
 root_agent = Agent(
     name="aviation_root_agent",
-    model=LiteLlm(
-        model="gpt-3.5-turbo",
-        api_key=os.getenv("LITELLM_API_KEY", "demo-key"),
-        temperature=0.1,
-        max_tokens=2000
-    ),
+    model=LiteLlm(model=_MODEL, **_LLM_OPTIONS),
     description="Aviation operations coordinator for HR, meetings, and supply chain",
-    instruction="""You are the Aviation Base Agent, a comprehensive coordinator for aviation operations.
-
-Your primary responsibilities:
-1. HR Operations: Handle employee management, crew scheduling, training, certifications
-2. Meeting Coordination: Schedule meetings, manage calendars, coordinate team communications  
-3. Supply Chain: Manage inventory, parts procurement, vendor relationships, maintenance supplies
-4. General Coordination: Route complex requests to appropriate specialized functions
-
-Aviation Departments: Flight Operations, Maintenance, Ground Services, Air Traffic Control, Safety & Security, Customer Service, Cargo Operations, Engineering, Quality Assurance, Training, Human Resources, Finance
-
-When users ask for help with:
-- Employee/crew/pilot/staff management, training, certifications → Provide HR guidance and actionable steps
-- Scheduling meetings/appointments/conferences, calendar management → Provide meeting coordination assistance
-- Inventory/parts/procurement/maintenance supplies, vendor management → Provide supply chain guidance
-- Complex multi-department requests → Provide comprehensive coordination across departments
-
-Always provide clear, professional responses with specific next steps. 
-
-Example responses:
-- "I can help you schedule that crew rotation. To proceed, I'll need the specific dates, aircraft assignments, and crew member preferences. Would you like me to check current crew availability first?"
-- "For that maintenance inventory request, I can assist with tracking parts. Which aircraft type and what specific components are you looking to manage?"
-- "I can coordinate that safety meeting. Let me suggest some optimal times based on when key personnel are typically available. What's the urgency level?"
-
-Always acknowledge the request, ask clarifying questions when needed, and provide actionable next steps.""",
+    instruction=_INSTRUCTION,
     tools=[],  # No tools for now, just focus on getting responses working
-)
\ No newline at end of file
+)
+
+
+async def create_response(message: str) -> str:
+    """Answer a message as the root agent through litellm.acompletion
+    
+    The agent has no tools, so one async completion is the whole turn; unlike
+    LiteLlm's sync path this never blocks the event loop.
+    """
+    import litellm
+    
+    response = await litellm.acompletion(
+        model=_MODEL,
+        messages=[
+            {"role": "system", "content": _INSTRUCTION},
+            {"role": "user", "content": message}
+        ],
+        **_LLM_OPTIONS
+    )
+    return response.choices[0].message.content
@@ -5,14 +5,15 @@ import asyncio
 from typing import Dict, Any, List, Optional
 from fastapi import FastAPI, HTTPException, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from pydantic import BaseModel
 from loguru import logger
 
-from .shared.config import config
+from .shared.config import get_config
+from .shared.llm import prewarm
+from .shared.responses import AviationJSONResponse
 from .agents.agent_manager import AgentManager
-from .mcp_servers.hr_tools import HRTools
-from .mcp_servers.meeting_tools import MeetingTools
-from .mcp_servers.supply_chain_tools import SupplyChainTools
+from .mcp_servers import get_tool_server, run_tool_servers, share_tool_servers
 
 
 # Pydantic models for API requests
@@ -36,7 +37,8 @@ class BroadcastRequest(BaseModel):
 app = FastAPI(
     title="Aviation MAS-A2A System",
     description="Multi-Agent System for Aviation Operations",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=AviationJSONResponse
 )
 
 # Add CORS middleware
@@ -48,15 +50,24 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress larger responses (agent replies carry LLM text)
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 # Global instances
 agent_manager: Optional[AgentManager] = None
 mcp_servers: Dict[str, Any] = {}
 
+# Tool names per MCP server; tools are only registered at server creation
+mcp_tool_names: Dict[str, List[str]] = {}
+
+# Keep references to fire-and-forget startup tasks
+_background_tasks = set()
+
 
 @app.on_event("startup")
 async def startup_event():
     """Initialize the application on startup"""
-    global agent_manager, mcp_servers
+    global agent_manager, mcp_servers, mcp_tool_names
     
     try:
         logger.info("Starting Aviation MAS-A2A System...")
@@ -65,15 +76,22 @@ async def startup_event():
         agent_manager = AgentManager()
         await agent_manager.initialize_agents()
         
-        # Initialize MCP servers
+        # Shared MCP servers (the same instances the agents use)
         mcp_servers = {
-            "hr": HRTools(),
-            "meeting": MeetingTools(),
-            "supply_chain": SupplyChainTools()
+            key: get_tool_server(key) for key in ("hr", "meeting", "supply_chain")
         }
+        mcp_tool_names = _collect_tool_names(mcp_servers)
+        
+        # Start MCP servers in background, unless another process serves them
+        if get_config().mcp_in_process:
+            servers_task = asyncio.create_task(start_mcp_servers())
+            _background_tasks.add(servers_task)
+            servers_task.add_done_callback(_background_tasks.discard)
         
-        # Start MCP servers in background
-        asyncio.create_task(start_mcp_servers())
+        # Warm up LiteLLM off the request path
+        prewarm_task = asyncio.create_task(prewarm_llm())
+        _background_tasks.add(prewarm_task)
+        prewarm_task.add_done_callback(_background_tasks.discard)
         
         logger.info("Aviation MAS-A2A System started successfully")
         
@@ -99,34 +117,33 @@ async def shutdown_event():
         logger.error(f"Error during shutdown: {e}")
 
 
+async def prewarm_llm():
+    """Load the LLM client and tokenizer in a worker thread"""
+    try:
+        model = get_config().litellm_model or "gpt-3.5-turbo"
+        await asyncio.to_thread(prewarm, model)
+        logger.info(f"LiteLLM prewarmed for {model}")
+    except Exception as e:
+        logger.warning(f"LiteLLM prewarm failed: {e}")
+
+
+def _collect_tool_names(servers: Dict[str, Any]) -> Dict[str, List[str]]:
+    """Names of the tools registered on each MCP server"""
+    tools = {}
+    
+    for server_name, server in servers.items():
+        if hasattr(server, 'get_tools'):
+            server_tools = server.get_tools()
+            tools[server_name] = [tool.__name__ if hasattr(tool, '__name__') else str(tool) for tool in server_tools]
+    
+    return tools
+
+
 async def start_mcp_servers():
     """Start all MCP servers"""
     try:
-        tasks = []
-        
-        # Start HR tools server
-        tasks.append(
-            asyncio.create_task(
-                mcp_servers["hr"].start_server(config.mcp_base_port + 1)
-            )
-        )
-        
-        # Start Meeting tools server
-        tasks.append(
-            asyncio.create_task(
-                mcp_servers["meeting"].start_server(config.mcp_base_port + 2)
-            )
-        )
-        
-        # Start Supply Chain tools server
-        tasks.append(
-            asyncio.create_task(
-                mcp_servers["supply_chain"].start_server(config.mcp_base_port + 3)
-            )
-        )
-        
-        # Wait for all servers to start
-        await asyncio.gather(*tasks)
+        # HR, meeting and supply chain servers on consecutive ports
+        await run_tool_servers(get_config().mcp_base_port)
         
     except Exception as e:
         logger.error(f"Failed to start MCP servers: {e}")
@@ -152,13 +169,13 @@ async def health_check():
     
     try:
         status = await agent_manager.get_system_status()
-        return status
+        return AviationJSONResponse(status)
     except Exception as e:
         logger.error(f"Health check failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.post("/message")
+@app.post("/message", response_model=None)
 async def send_message(request: MessageRequest):
     """Send a message to an agent"""
     if not agent_manager:
@@ -170,13 +187,13 @@ async def send_message(request: MessageRequest):
             target_agent=request.target_agent,
             context=request.context
         )
-        return response
+        return AviationJSONResponse(response)
     except Exception as e:
         logger.error(f"Failed to send message: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.post("/conversation")
+@app.post("/conversation", response_model=None)
 async def start_conversation(request: ConversationRequest):
     """Start a new conversation between agents"""
     if not agent_manager:
@@ -187,13 +204,13 @@ async def start_conversation(request: ConversationRequest):
             conversation_id=request.conversation_id,
             participants=request.participants
         )
-        return response
+        return AviationJSONResponse(response)
     except Exception as e:
         logger.error(f"Failed to start conversation: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.post("/broadcast")
+@app.post("/broadcast", response_model=None)
 async def broadcast_message(request: BroadcastRequest):
     """Broadcast a message to all agents"""
     if not agent_manager:
@@ -204,7 +221,7 @@ async def broadcast_message(request: BroadcastRequest):
             message=request.message,
             exclude_agents=request.exclude_agents
         )
-        return response
+        return AviationJSONResponse(response)
     except Exception as e:
         logger.error(f"Failed to broadcast message: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -252,27 +269,32 @@ async def get_agent_status(agent_type: str):
 async def list_mcp_tools():
     """List all available MCP tools"""
     try:
-        tools = {}
-        
-        for server_name, server in mcp_servers.items():
-            if hasattr(server, 'get_tools'):
-                server_tools = server.get_tools()
-                tools[server_name] = [tool.__name__ if hasattr(tool, '__name__') else str(tool) for tool in server_tools]
-        
-        return {
+        return AviationJSONResponse({
             "status": "success",
-            "mcp_servers": tools
-        }
+            "mcp_servers": mcp_tool_names
+        })
     except Exception as e:
         logger.error(f"Failed to list MCP tools: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
 if __name__ == "__main__":
+    import importlib.util
+    import os
     import uvicorn
+    config = get_config()
+    
+    # Reload runs a single worker; otherwise use one process per core by default
+    workers = 1 if config.debug else (config.server_workers or os.cpu_count())
+    # Only one process can bind the MCP ports; serve them here for multi-worker runs
+    share_tool_servers(workers)
+    
     uvicorn.run(
         "aviation_mas_a2a.app:app",
         host=config.server_host,
         port=config.server_port,
-        reload=config.debug
+        reload=config.debug,
+        workers=workers,
+        loop="uvloop" if importlib.util.find_spec("uvloop") else "asyncio",
+        http="httptools"
     )
\ No newline at end of file
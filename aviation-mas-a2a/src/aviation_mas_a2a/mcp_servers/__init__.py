@@ -1,8 +1,88 @@
 """
 MCP Servers initialization and exports
+
+The ``*_instance`` names are process-wide tool servers created on first access,
+so the app and every agent share one FastMCP server and one in-memory DB each.
+Each tool server's module (and FastMCP) is only imported when it is first needed.
 """
-from .hr_tools import HRTools
-from .meeting_tools import MeetingTools
-from .supply_chain_tools import SupplyChainTools
+import asyncio
+import os
+import threading
+from importlib import import_module
+
+from loguru import logger
+
+from ..shared.config import get_config
+
+__all__ = [
+    "HRTools", "MeetingTools", "SupplyChainTools",
+    "hr_tools_instance", "meeting_tools_instance", "supply_chain_tools_instance",
+    "get_tool_server", "run_tool_servers", "share_tool_servers",
+]
+
+# Tool server key -> (module, class name)
+_TOOL_CLASSES = {
+    "hr": (".hr_tools", "HRTools"),
+    "meeting": (".meeting_tools", "MeetingTools"),
+    "supply_chain": (".supply_chain_tools", "SupplyChainTools"),
+}
+_KEY_OF_CLASS = {name: key for key, (_, name) in _TOOL_CLASSES.items()}
+
+_instances = {}
+
+
+def get_tool_server(key: str):
+    """Get the shared tool server for a key ("hr", "meeting" or "supply_chain")"""
+    server = _instances.get(key)
+    if server is None:
+        server = _instances[key] = _tool_class(key)()
+    return server
+
+
+def _tool_class(key: str):
+    """Import a tool server's module and return its class"""
+    module, name = _TOOL_CLASSES[key]
+    return getattr(import_module(module, __name__), name)
+
+
+async def run_tool_servers(base_port: int):
+    """Serve the HR, meeting and supply chain MCP servers on base_port+1..3
+    
+    If one server fails to start the others are cancelled instead of left running.
+    """
+    async with asyncio.TaskGroup() as tg:
+        for offset, key in enumerate(_TOOL_CLASSES, 1):
+            tg.create_task(get_tool_server(key).start_server(base_port + offset))
+
+
+def _serve_tool_servers(base_port: int):
+    """Run the MCP servers on their own event loop (supervisor thread)"""
+    try:
+        asyncio.run(run_tool_servers(base_port))
+    except Exception as e:
+        logger.error(f"Failed to start MCP servers: {e}")
+
+
+def share_tool_servers(workers: int):
+    """Serve the MCP servers once for a multi-worker run, before the workers start
+    
+    Every worker runs the app's startup hook, and only one process can bind the
+    MCP ports: serve them from this (parent) process and keep the workers from
+    starting their own. Does nothing for a single worker.
+    """
+    config = get_config()
+    if workers <= 1 or not config.mcp_in_process:
+        return
+    os.environ["MCP_IN_PROCESS"] = "false"
+    threading.Thread(
+        target=_serve_tool_servers, args=(config.mcp_base_port,), name="mcp-servers", daemon=True
+    ).start()
+
 
-__all__ = ["HRTools", "MeetingTools", "SupplyChainTools"]
\ No newline at end of file
+def __getattr__(name):
+    """Import the tool classes and create the shared ``<key>_tools_instance`` servers on first access"""
+    if name in _KEY_OF_CLASS:
+        return _tool_class(_KEY_OF_CLASS[name])
+    if name.endswith("_tools_instance") and name[:-len("_tools_instance")] in _TOOL_CLASSES:
+        return get_tool_server(name[:-len("_tools_instance")])
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,13 +1,79 @@
 """
 HR Tools for Aviation System using FastMCP
 """
-import uuid
+import secrets
+from collections import defaultdict
+from itertools import islice
 from datetime import datetime, date, timedelta
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from fastmcp import FastMCP
 from loguru import logger
 
-from ..shared.config import config
+from ..shared.config import get_config
+
+
+class _EmployeeTable:
+    """Column-oriented employee store: one list per field plus row indexes"""
+    
+    FIELDS = (
+        "employee_id", "name", "position", "department",
+        "hire_date", "certifications", "status", "created_at"
+    )
+    
+    def __init__(self):
+        self.columns: Dict[str, List[Any]] = {field: [] for field in self.FIELDS}
+        self._column_list = tuple(self.columns[field] for field in self.FIELDS)
+        self._rows: Dict[str, int] = {}
+        # Lowercased department -> row numbers (in insertion order)
+        self._dept_rows: Dict[str, List[int]] = defaultdict(list)
+    
+    def __len__(self) -> int:
+        return len(self._rows)
+    
+    def __contains__(self, employee_id: str) -> bool:
+        return employee_id in self._rows
+    
+    def __getitem__(self, employee_id: str) -> Dict[str, Any]:
+        return self.row(self._rows[employee_id])
+    
+    def append(self, employee: Dict[str, Any]):
+        """Add an employee record (replacing one with the same id)"""
+        employee_id = employee["employee_id"]
+        row = self._rows.get(employee_id)
+        
+        if row is None:
+            self._rows[employee_id] = len(self._column_list[0])
+            for field, column in zip(self.FIELDS, self._column_list):
+                column.append(employee[field])
+            self._dept_rows[employee["department"].lower()].append(self._rows[employee_id])
+            return
+        
+        old_dept = self.columns["department"][row].lower()
+        for field, column in zip(self.FIELDS, self._column_list):
+            column[row] = employee[field]
+        new_dept = employee["department"].lower()
+        if new_dept != old_dept:
+            self._dept_rows[old_dept].remove(row)
+            self._dept_rows[new_dept].append(row)
+    
+    def row(self, row: int) -> Dict[str, Any]:
+        """Materialize one row as a record dict"""
+        return {field: column[row] for field, column in zip(self.FIELDS, self._column_list)}
+    
+    def department_size(self, department: str) -> int:
+        """Number of employees in a department (case-insensitive)"""
+        return len(self._dept_rows.get(department.lower(), ()))
+    
+    def in_department(
+        self,
+        department: str,
+        offset: int = 0,
+        limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """One page of a department's employees (case-insensitive)"""
+        rows = self._dept_rows.get(department.lower(), ())
+        stop = None if limit is None else offset + limit
+        return [self.row(row) for row in islice(rows, offset, stop)]
 
 
 class HRTools:
@@ -15,18 +81,85 @@ class HRTools:
     
     def __init__(self):
         self.mcp = FastMCP("Aviation HR Server")
-        self.employees_db: Dict[str, Dict[str, Any]] = {}
+        self.employees_db = _EmployeeTable()
         self.trainings_db: Dict[str, List[Dict[str, Any]]] = {}
         self.certifications_db: Dict[str, List[Dict[str, Any]]] = {}
         
-        # Register MCP tools
+        # Register MCP tools, keeping their callables; the tool set is fixed from here on
+        self._tools: List[Any] = []
         self._register_tools()
         logger.info("HR Tools initialized")
     
+    @staticmethod
+    def _timestamps() -> Tuple[str, str]:
+        """Today's date and the current time, read from the clock once"""
+        now = datetime.now()
+        return now.date().isoformat(), now.isoformat()
+    
+    def _add_employee(
+        self,
+        name: str,
+        position: str,
+        department: str,
+        hire_date: Optional[str],
+        certifications: Optional[List[str]],
+        today: str,
+        created_at: str
+    ) -> Dict[str, Any]:
+        """Build and store an employee record"""
+        employee_id = f"EMP_{secrets.token_hex(4)}"
+        
+        employee = {
+            "employee_id": employee_id,
+            "name": name,
+            "position": position,
+            "department": department,
+            "hire_date": hire_date or today,
+            "certifications": certifications or [],
+            "status": "active",
+            "created_at": created_at
+        }
+        
+        self.employees_db.append(employee)
+        return employee
+    
+    def _add_training(
+        self,
+        employee_id: str,
+        training_type: str,
+        scheduled_date: str,
+        duration_hours: int,
+        instructor: Optional[str],
+        created_at: str
+    ) -> Dict[str, Any]:
+        """Build and store a training record"""
+        training_id = f"TRN_{secrets.token_hex(4)}"
+        training = {
+            "training_id": training_id,
+            "employee_id": employee_id,
+            "training_type": training_type,
+            "scheduled_date": scheduled_date,
+            "duration_hours": duration_hours,
+            "instructor": instructor,
+            "status": "scheduled",
+            "created_at": created_at
+        }
+        
+        if employee_id not in self.trainings_db:
+            self.trainings_db[employee_id] = []
+        self.trainings_db[employee_id].append(training)
+        return training
+    
+    def _tool(self, fn):
+        """Register fn as an MCP tool and keep the plain callable for the agents"""
+        self.mcp.tool()(fn)
+        self._tools.append(fn)
+        return fn
+    
     def _register_tools(self):
         """Register all HR tools with FastMCP"""
         
-        @self.mcp.tool()
+        @self._tool
         async def create_employee_record(
             name: str,
             position: str,
@@ -36,21 +169,12 @@ class HRTools:
         ) -> Dict[str, Any]:
             """Create a new employee record for aviation personnel"""
             try:
-                employee_id = f"EMP_{str(uuid.uuid4())[:8]}"
-                
-                employee = {
-                    "employee_id": employee_id,
-                    "name": name,
-                    "position": position,
-                    "department": department,
-                    "hire_date": hire_date or datetime.now().strftime("%Y-%m-%d"),
-                    "certifications": certifications or [],
-                    "status": "active",
-                    "created_at": datetime.now().isoformat()
-                }
-                
-                self.employees_db[employee_id] = employee
-                logger.info(f"Created employee record: {employee_id}")
+                today, created_at = self._timestamps()
+                employee = self._add_employee(
+                    name, position, department, hire_date, certifications, today, created_at
+                )
+                employee_id = employee["employee_id"]
+                logger.debug("Created employee record: {}", employee_id)
                 
                 return {
                     "status": "success",
@@ -63,7 +187,7 @@ class HRTools:
                 logger.error(f"Error creating employee: {e}")
                 return {"status": "error", "message": f"Failed to create employee: {str(e)}"}
         
-        @self.mcp.tool()
+        @self._tool
         async def schedule_training(
             employee_id: str,
             training_type: str,
@@ -76,23 +200,13 @@ class HRTools:
                 if employee_id not in self.employees_db:
                     return {"status": "error", "message": "Employee not found"}
                 
-                training_id = f"TRN_{str(uuid.uuid4())[:8]}"
-                training = {
-                    "training_id": training_id,
-                    "employee_id": employee_id,
-                    "training_type": training_type,
-                    "scheduled_date": scheduled_date,
-                    "duration_hours": duration_hours,
-                    "instructor": instructor,
-                    "status": "scheduled",
-                    "created_at": datetime.now().isoformat()
-                }
+                training = self._add_training(
+                    employee_id, training_type, scheduled_date, duration_hours, instructor,
+                    datetime.now().isoformat()
+                )
+                training_id = training["training_id"]
                 
-                if employee_id not in self.trainings_db:
-                    self.trainings_db[employee_id] = []
-                self.trainings_db[employee_id].append(training)
-                
-                logger.info(f"Scheduled training: {training_id}")
+                logger.debug("Scheduled training: {}", training_id)
                 return {
                     "status": "success",
                     "message": f"Training {training_type} scheduled successfully",
@@ -104,7 +218,78 @@ class HRTools:
                 logger.error(f"Error scheduling training: {e}")
                 return {"status": "error", "message": f"Failed to schedule training: {str(e)}"}
         
-        @self.mcp.tool()
+        @self._tool
+        async def create_employees_bulk(records: List[Dict[str, Any]]) -> Dict[str, Any]:
+            """Create many employee records in one call (name, position, department required)"""
+            try:
+                today, created_at = self._timestamps()
+                created = []
+                errors = []
+                
+                for index, record in enumerate(records):
+                    try:
+                        created.append(self._add_employee(
+                            record["name"],
+                            record["position"],
+                            record["department"],
+                            record.get("hire_date"),
+                            record.get("certifications"),
+                            today,
+                            created_at
+                        ))
+                    except KeyError as e:
+                        errors.append({"index": index, "message": f"Missing field: {e.args[0]}"})
+                
+                logger.info("Created {} employee records ({} rejected)", len(created), len(errors))
+                return {
+                    "status": "success" if not errors else "partial",
+                    "message": f"Created {len(created)} of {len(records)} employees",
+                    "employee_ids": [employee["employee_id"] for employee in created],
+                    "errors": errors
+                }
+                
+            except Exception as e:
+                logger.error(f"Error creating employees in bulk: {e}")
+                return {"status": "error", "message": f"Failed to create employees: {str(e)}"}
+        
+        @self._tool
+        async def schedule_trainings_bulk(trainings: List[Dict[str, Any]]) -> Dict[str, Any]:
+            """Schedule many trainings in one call (employee_id, training_type, scheduled_date required)"""
+            try:
+                _, created_at = self._timestamps()
+                scheduled = []
+                errors = []
+                
+                for index, item in enumerate(trainings):
+                    try:
+                        if item["employee_id"] not in self.employees_db:
+                            errors.append({"index": index, "message": "Employee not found"})
+                            continue
+                        
+                        scheduled.append(self._add_training(
+                            item["employee_id"],
+                            item["training_type"],
+                            item["scheduled_date"],
+                            item.get("duration_hours", 8),
+                            item.get("instructor"),
+                            created_at
+                        ))
+                    except KeyError as e:
+                        errors.append({"index": index, "message": f"Missing field: {e.args[0]}"})
+                
+                logger.info("Scheduled {} trainings ({} rejected)", len(scheduled), len(errors))
+                return {
+                    "status": "success" if not errors else "partial",
+                    "message": f"Scheduled {len(scheduled)} of {len(trainings)} trainings",
+                    "training_ids": [training["training_id"] for training in scheduled],
+                    "errors": errors
+                }
+                
+            except Exception as e:
+                logger.error(f"Error scheduling trainings in bulk: {e}")
+                return {"status": "error", "message": f"Failed to schedule trainings: {str(e)}"}
+        
+        @self._tool
         async def get_employee_info(employee_id: str) -> Dict[str, Any]:
             """Get detailed information about an aviation employee"""
             try:
@@ -115,32 +300,39 @@ class HRTools:
                 trainings = self.trainings_db.get(employee_id, [])
                 certifications = self.certifications_db.get(employee_id, [])
                 
-                return {
+                result = {
                     "status": "success",
                     "employee": employee,
                     "trainings": trainings,
                     "certifications": certifications
                 }
+                return result
                 
             except Exception as e:
                 logger.error(f"Error getting employee info: {e}")
                 return {"status": "error", "message": f"Failed to get employee info: {str(e)}"}
         
-        @self.mcp.tool()
-        async def list_employees_by_department(department: str) -> Dict[str, Any]:
-            """List all employees in a specific aviation department"""
+        @self._tool
+        async def list_employees_by_department(
+            department: str,
+            limit: int = 100,
+            offset: int = 0
+        ) -> Dict[str, Any]:
+            """List employees in a specific aviation department (paginated with limit/offset)"""
             try:
-                employees = [
-                    emp for emp in self.employees_db.values()
-                    if emp["department"].lower() == department.lower()
-                ]
+                limit = max(limit, 0)
+                offset = max(offset, 0)
+                employees = self.employees_db.in_department(department, offset, limit)
                 
-                return {
+                result = {
                     "status": "success",
                     "department": department,
-                    "employee_count": len(employees),
+                    "employee_count": self.employees_db.department_size(department),
+                    "offset": offset,
+                    "limit": limit,
                     "employees": employees
                 }
+                return result
                 
             except Exception as e:
                 logger.error(f"Error listing employees: {e}")
@@ -148,10 +340,11 @@ class HRTools:
     
     def get_tools(self) -> List[Any]:
         """Get all registered HR tools"""
-        return list(self.mcp.get_tools().values())
+        return self._tools
     
     async def start_server(self, port: int = None):
         """Start the HR MCP server"""
+        config = get_config()
         server_port = port or config.mcp_base_port + 1
         logger.info(f"Starting HR MCP server on port {server_port}")
         await self.mcp.run(host=config.mcp_host, port=server_port)
\ No newline at end of file
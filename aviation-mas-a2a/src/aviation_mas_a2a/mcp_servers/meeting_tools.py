@@ -1,13 +1,22 @@
 """
 Meeting Tools for Aviation System using FastMCP
 """
-import uuid
-from datetime import datetime, timedelta
-from typing import Dict, Any, List, Optional
+import bisect
+import secrets
+from collections import defaultdict
+from datetime import timedelta
+from typing import Dict, Any, List, Optional, Tuple
 from fastmcp import FastMCP
 from loguru import logger
 
-from ..shared.config import config
+from ..shared.config import get_config
+from ..shared.timeutil import now_iso
+from .records import Meeting
+
+
+# Meeting statuses accepted by update_meeting_status
+_STATUS_CHOICES = ("scheduled", "in-progress", "completed", "cancelled")
+_VALID_STATUSES = frozenset(_STATUS_CHOICES)
 
 
 class MeetingTools:
@@ -15,17 +24,27 @@ class MeetingTools:
     
     def __init__(self):
         self.mcp = FastMCP("Aviation Meeting Server")
-        self.meetings_db: Dict[str, Dict[str, Any]] = {}
-        self.calendars_db: Dict[str, List[str]] = {}  # user_id -> meeting_ids
+        self.meetings_db: Dict[str, Meeting] = {}
+        # user_id -> (date, meeting_id) entries, kept sorted for range queries
+        self.calendars_db: Dict[str, List[Tuple[str, str]]] = {}
+        # Lowercased meeting type -> meeting ids (in insertion order)
+        self.meetings_by_type: Dict[str, List[str]] = defaultdict(list)
         
-        # Register MCP tools
+        # Register MCP tools, keeping their callables; the tool set is fixed from here on
+        self._tools: List[Any] = []
         self._register_tools()
         logger.info("Meeting Tools initialized")
     
+    def _tool(self, fn):
+        """Register fn as an MCP tool and keep the plain callable for the agents"""
+        self.mcp.tool()(fn)
+        self._tools.append(fn)
+        return fn
+    
     def _register_tools(self):
         """Register all meeting tools with FastMCP"""
         
-        @self.mcp.tool()
+        @self._tool
         async def schedule_meeting(
             title: str,
             date: str,
@@ -37,43 +56,41 @@ class MeetingTools:
         ) -> Dict[str, Any]:
             """Schedule a meeting for aviation operations"""
             try:
-                meeting_id = f"MTG_{str(uuid.uuid4())[:8]}"
-                
-                meeting = {
-                    "meeting_id": meeting_id,
-                    "title": title,
-                    "date": date,
-                    "time": time,
-                    "duration_minutes": duration_minutes,
-                    "attendees": attendees or [],
-                    "location": location,
-                    "meeting_type": meeting_type,
-                    "status": "scheduled",
-                    "created_at": datetime.now().isoformat(),
-                    "created_by": "aviation_system"
-                }
+                meeting_id = f"MTG_{secrets.token_hex(4)}"
+                attendees = attendees or []
+                
+                meeting = Meeting(
+                    meeting_id=meeting_id,
+                    title=title,
+                    date=date,
+                    time=time,
+                    duration_minutes=duration_minutes,
+                    attendees=attendees,
+                    location=location,
+                    meeting_type=meeting_type,
+                    created_at=now_iso()
+                )
                 
                 self.meetings_db[meeting_id] = meeting
+                self.meetings_by_type[meeting_type.lower()].append(meeting_id)
                 
                 # Add to attendees' calendars
-                for attendee in (attendees or []):
-                    if attendee not in self.calendars_db:
-                        self.calendars_db[attendee] = []
-                    self.calendars_db[attendee].append(meeting_id)
+                for attendee in attendees:
+                    bisect.insort(self.calendars_db.setdefault(attendee, []), (date, meeting_id))
                 
-                logger.info(f"Scheduled meeting: {meeting_id}")
+                logger.debug("Scheduled meeting: {}", meeting_id)
                 return {
                     "status": "success",
                     "message": f"Meeting '{title}' scheduled successfully",
                     "meeting_id": meeting_id,
-                    "details": meeting
+                    "details": meeting.to_dict()
                 }
                 
             except Exception as e:
                 logger.error(f"Error scheduling meeting: {e}")
                 return {"status": "error", "message": f"Failed to schedule meeting: {str(e)}"}
         
-        @self.mcp.tool()
+        @self._tool
         async def get_meeting_details(meeting_id: str) -> Dict[str, Any]:
             """Get detailed information about a scheduled meeting"""
             try:
@@ -81,16 +98,17 @@ class MeetingTools:
                     return {"status": "error", "message": "Meeting not found"}
                 
                 meeting = self.meetings_db[meeting_id]
-                return {
+                result = {
                     "status": "success",
-                    "meeting": meeting
+                    "meeting": meeting.to_dict()
                 }
+                return result
                 
             except Exception as e:
                 logger.error(f"Error getting meeting details: {e}")
                 return {"status": "error", "message": f"Failed to get meeting details: {str(e)}"}
         
-        @self.mcp.tool()
+        @self._tool
         async def update_meeting_status(
             meeting_id: str,
             status: str,
@@ -101,31 +119,31 @@ class MeetingTools:
                 if meeting_id not in self.meetings_db:
                     return {"status": "error", "message": "Meeting not found"}
                 
-                valid_statuses = ["scheduled", "in-progress", "completed", "cancelled"]
-                if status not in valid_statuses:
+                if status not in _VALID_STATUSES:
                     return {
                         "status": "error", 
-                        "message": f"Invalid status. Must be one of: {', '.join(valid_statuses)}"
+                        "message": f"Invalid status. Must be one of: {', '.join(_STATUS_CHOICES)}"
                     }
                 
-                self.meetings_db[meeting_id]["status"] = status
-                self.meetings_db[meeting_id]["updated_at"] = datetime.now().isoformat()
+                meeting = self.meetings_db[meeting_id]
+                meeting.status = status
+                meeting.updated_at = now_iso()
                 
                 if notes:
-                    self.meetings_db[meeting_id]["notes"] = notes
+                    meeting.notes = notes
                 
-                logger.info(f"Updated meeting {meeting_id} status to {status}")
+                logger.debug("Updated meeting {} status to {}", meeting_id, status)
                 return {
                     "status": "success",
                     "message": f"Meeting status updated to {status}",
-                    "meeting": self.meetings_db[meeting_id]
+                    "meeting": meeting.to_dict()
                 }
                 
             except Exception as e:
                 logger.error(f"Error updating meeting status: {e}")
                 return {"status": "error", "message": f"Failed to update meeting status: {str(e)}"}
         
-        @self.mcp.tool()
+        @self._tool
         async def get_calendar_events(
             user_id: str,
             date_from: Optional[str] = None,
@@ -141,40 +159,33 @@ class MeetingTools:
                         "message": "No events found for user"
                     }
                 
-                meeting_ids = self.calendars_db[user_id]
-                meetings = [self.meetings_db[mid] for mid in meeting_ids if mid in self.meetings_db]
-                
-                # Filter by date range if provided
-                if date_from or date_to:
-                    filtered_meetings = []
-                    for meeting in meetings:
-                        meeting_date = meeting["date"]
-                        if date_from and meeting_date < date_from:
-                            continue
-                        if date_to and meeting_date > date_to:
-                            continue
-                        filtered_meetings.append(meeting)
-                    meetings = filtered_meetings
+                entries = self.calendars_db[user_id]
                 
-                return {
+                # Select the date range (inclusive) by bisecting the sorted entries
+                lo = bisect.bisect_left(entries, (date_from,)) if date_from else 0
+                hi = bisect.bisect_right(entries, (date_to, "\uffff")) if date_to else len(entries)
+                meetings = [
+                    self.meetings_db[mid].to_dict() for _, mid in entries[lo:hi] if mid in self.meetings_db
+                ]
+                
+                result = {
                     "status": "success",
                     "user_id": user_id,
                     "events": meetings,
                     "event_count": len(meetings)
                 }
+                return result
                 
             except Exception as e:
                 logger.error(f"Error getting calendar events: {e}")
                 return {"status": "error", "message": f"Failed to get calendar events: {str(e)}"}
         
-        @self.mcp.tool()
+        @self._tool
         async def list_meetings_by_type(meeting_type: str) -> Dict[str, Any]:
             """List all meetings of a specific type (safety, maintenance, operations, etc.)"""
             try:
-                meetings = [
-                    meeting for meeting in self.meetings_db.values()
-                    if meeting["meeting_type"].lower() == meeting_type.lower()
-                ]
+                meeting_ids = self.meetings_by_type.get(meeting_type.lower(), ())
+                meetings = [self.meetings_db[meeting_id].to_dict() for meeting_id in meeting_ids]
                 
                 return {
                     "status": "success",
@@ -189,10 +200,11 @@ class MeetingTools:
     
     def get_tools(self) -> List[Any]:
         """Get all registered meeting tools"""
-        return list(self.mcp.get_tools().values())
+        return self._tools
     
     async def start_server(self, port: int = None):
         """Start the Meeting MCP server"""
+        config = get_config()
         server_port = port or config.mcp_base_port + 2
         logger.info(f"Starting Meeting MCP server on port {server_port}")
         await self.mcp.run(host=config.mcp_host, port=server_port)
\ No newline at end of file
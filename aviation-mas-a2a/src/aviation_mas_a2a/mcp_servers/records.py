@@ -0,0 +1,56 @@
+"""
+Record types stored by the meeting and supply chain tool servers
+"""
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Optional
+
+
+def _without_unset(record: Dict[str, Any], *optional: str) -> Dict[str, Any]:
+    """Drop optional fields that were never set (they weren't keys in the old dicts)"""
+    for name in optional:
+        if record[name] is None:
+            del record[name]
+    return record
+
+
+@dataclass(slots=True)
+class Meeting:
+    """A scheduled meeting"""
+    meeting_id: str
+    title: str
+    date: str
+    time: str
+    duration_minutes: int
+    attendees: List[str] = field(default_factory=list)
+    location: Optional[str] = None
+    meeting_type: str = "general"
+    status: str = "scheduled"
+    created_at: str = ""
+    created_by: str = "aviation_system"
+    updated_at: Optional[str] = None
+    notes: Optional[str] = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """The meeting as returned by the tools"""
+        return _without_unset(asdict(self), "updated_at", "notes")
+
+
+@dataclass(slots=True)
+class InventoryItem:
+    """An aviation part or supply in stock"""
+    item_id: str
+    item_name: str
+    part_number: str
+    category: str
+    quantity: int
+    unit_price: float
+    supplier: Optional[str] = None
+    critical_level: int = 10
+    status: str = "active"
+    last_updated: str = ""
+    created_at: str = ""
+    last_update_notes: Optional[str] = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """The item as returned by the tools"""
+        return _without_unset(asdict(self), "last_update_notes")
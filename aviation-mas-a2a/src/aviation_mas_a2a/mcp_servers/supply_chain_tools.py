@@ -1,13 +1,17 @@
 """
 Supply Chain Tools for Aviation System using FastMCP
 """
-import uuid
+import math
+import secrets
+from collections import defaultdict
 from datetime import datetime, timedelta
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Set, Tuple
 from fastmcp import FastMCP
 from loguru import logger
 
-from ..shared.config import config
+from ..shared.config import get_config
+from ..shared.timeutil import now_iso
+from .records import InventoryItem
 
 
 class SupplyChainTools:
@@ -15,18 +19,83 @@ class SupplyChainTools:
     
     def __init__(self):
         self.mcp = FastMCP("Aviation Supply Chain Server")
-        self.inventory_db: Dict[str, Dict[str, Any]] = {}
+        self.inventory_db: Dict[str, InventoryItem] = {}
         self.vendors_db: Dict[str, Dict[str, Any]] = {}
         self.orders_db: Dict[str, Dict[str, Any]] = {}
         
-        # Register MCP tools
+        # Inventory indexes, updated when items are created
+        self.items_by_category: Dict[str, List[str]] = defaultdict(list)
+        self.item_trigrams: Dict[str, Set[str]] = defaultdict(set)
+        self._item_order: Dict[str, int] = {}
+        # item_id -> (lowercased name, lowercased part number) for substring search
+        self._search_text: Dict[str, Tuple[str, str]] = {}
+        # Items at or below their critical level, and the out-of-stock ones among them
+        self.low_stock_ids: Set[str] = set()
+        self.out_of_stock_ids: Set[str] = set()
+        
+        # Register MCP tools, keeping their callables; the tool set is fixed from here on
+        self._tools: List[Any] = []
         self._register_tools()
         logger.info("Supply Chain Tools initialized")
     
+    @staticmethod
+    def _trigrams(text: str) -> Set[str]:
+        """All 3-character substrings of a string"""
+        return {text[i:i + 3] for i in range(len(text) - 2)}
+    
+    def _index_item(self, item: InventoryItem):
+        """Add an inventory item to the category and search indexes"""
+        item_id = item.item_id
+        self._item_order[item_id] = len(self._item_order)
+        self.items_by_category[item.category.lower()].append(item_id)
+        
+        name, part_number = self._search_text[item_id] = (
+            item.item_name.lower(), item.part_number.lower()
+        )
+        grams = self._trigrams(name) | self._trigrams(part_number)
+        for gram in grams:
+            self.item_trigrams[gram].add(item_id)
+    
+    def _update_stock_flags(self, item: InventoryItem):
+        """Keep the low/out-of-stock sets in line with an item's quantity"""
+        item_id = item.item_id
+        
+        if item.quantity <= item.critical_level:
+            self.low_stock_ids.add(item_id)
+        else:
+            self.low_stock_ids.discard(item_id)
+        
+        if item.quantity == 0:
+            self.out_of_stock_ids.add(item_id)
+        else:
+            self.out_of_stock_ids.discard(item_id)
+    
+    def _in_item_order(self, item_ids) -> List[str]:
+        """Sort item ids by creation order"""
+        return sorted(item_ids, key=self._item_order.__getitem__)
+    
+    def _search_candidates(self, term: str) -> Optional[Set[str]]:
+        """Ids of items whose name or part number may contain a (lowercased) term
+        
+        Returns None when the term is too short for the trigram index.
+        """
+        grams = self._trigrams(term)
+        if not grams:
+            return None
+        
+        postings = sorted((self.item_trigrams.get(gram, set()) for gram in grams), key=len)
+        return postings[0].intersection(*postings[1:])
+    
+    def _tool(self, fn):
+        """Register fn as an MCP tool and keep the plain callable for the agents"""
+        self.mcp.tool()(fn)
+        self._tools.append(fn)
+        return fn
+    
     def _register_tools(self):
         """Register all supply chain tools with FastMCP"""
         
-        @self.mcp.tool()
+        @self._tool
         async def create_inventory_item(
             item_name: str,
             part_number: str,
@@ -38,37 +107,39 @@ class SupplyChainTools:
         ) -> Dict[str, Any]:
             """Create a new inventory item for aviation parts/supplies"""
             try:
-                item_id = f"INV_{str(uuid.uuid4())[:8]}"
+                item_id = f"INV_{secrets.token_hex(4)}"
                 
-                item = {
-                    "item_id": item_id,
-                    "item_name": item_name,
-                    "part_number": part_number,
-                    "category": category,
-                    "quantity": quantity,
-                    "unit_price": unit_price,
-                    "supplier": supplier,
-                    "critical_level": critical_level,
-                    "status": "active",
-                    "last_updated": datetime.now().isoformat(),
-                    "created_at": datetime.now().isoformat()
-                }
+                created_at = now_iso()
+                item = InventoryItem(
+                    item_id=item_id,
+                    item_name=item_name,
+                    part_number=part_number,
+                    category=category,
+                    quantity=quantity,
+                    unit_price=unit_price,
+                    supplier=supplier,
+                    critical_level=critical_level,
+                    last_updated=created_at,
+                    created_at=created_at
+                )
                 
                 self.inventory_db[item_id] = item
-                logger.info(f"Created inventory item: {item_id}")
+                self._index_item(item)
+                self._update_stock_flags(item)
+                logger.debug("Created inventory item: {}", item_id)
                 
                 return {
                     "status": "success",
                     "message": f"Inventory item '{item_name}' created successfully",
                     "item_id": item_id,
-                    "details": item
+                    "details": item.to_dict()
                 }
                 
             except Exception as e:
                 logger.error(f"Error creating inventory item: {e}")
                 return {"status": "error", "message": f"Failed to create inventory item: {str(e)}"}
         
-        @self.mcp.tool()
+        @self._tool
         async def check_inventory(
             search_term: Optional[str] = None,
             category: Optional[str] = None,
@@ -76,31 +147,28 @@ class SupplyChainTools:
         ) -> Dict[str, Any]:
             """Check inventory levels for aviation parts and supplies"""
             try:
-                items = list(self.inventory_db.values())
-                
-                # Filter by search term
-                if search_term:
-                    items = [
-                        item for item in items
-                        if search_term.lower() in item["item_name"].lower() or
-                           search_term.lower() in item["part_number"].lower()
-                    ]
-                
-                # Filter by category
+                # Narrow down with the indexes: category ids and search term trigrams
+                term = search_term.lower() if search_term else None
+                candidates = self._search_candidates(term) if term else None
                 if category:
-                    items = [
-                        item for item in items
-                        if item["category"].lower() == category.lower()
-                    ]
-                
-                # Filter by low stock
-                if low_stock_only:
-                    items = [
-                        item for item in items
-                        if item["quantity"] <= item["critical_level"]
-                    ]
+                    item_ids = self.items_by_category.get(category.lower(), ())
+                elif candidates is not None:
+                    item_ids = self._in_item_order(candidates)
+                else:
+                    item_ids = self.inventory_db
                 
-                return {
+                # One fused pass: trigram candidates, substring check (trigrams
+                # only select candidates) and the low stock filter
+                search_text = self._search_text
+                low_stock_ids = self.low_stock_ids
+                items = [
+                    self.inventory_db[item_id].to_dict() for item_id in item_ids
+                    if (candidates is None or item_id in candidates)
+                    and (term is None or term in search_text[item_id][0] or term in search_text[item_id][1])
+                    and (not low_stock_only or item_id in low_stock_ids)
+                ]
+                
+                result = {
                     "status": "success",
                     "items_found": len(items),
                     "items": items,
@@ -110,12 +178,13 @@ class SupplyChainTools:
                         "low_stock_only": low_stock_only
                     }
                 }
+                return result
                 
             except Exception as e:
                 logger.error(f"Error checking inventory: {e}")
                 return {"status": "error", "message": f"Failed to check inventory: {str(e)}"}
         
-        @self.mcp.tool()
+        @self._tool
         async def update_inventory_quantity(
             item_id: str,
             quantity_change: int,
@@ -128,36 +197,37 @@ class SupplyChainTools:
                     return {"status": "error", "message": "Inventory item not found"}
                 
                 item = self.inventory_db[item_id]
-                old_quantity = item["quantity"]
+                old_quantity = item.quantity
                 
                 if operation == "add":
-                    item["quantity"] += quantity_change
+                    item.quantity += quantity_change
                 elif operation == "subtract":
-                    item["quantity"] = max(0, item["quantity"] - quantity_change)
+                    item.quantity = max(0, item.quantity - quantity_change)
                 elif operation == "set":
-                    item["quantity"] = max(0, quantity_change)
+                    item.quantity = max(0, quantity_change)
                 else:
                     return {"status": "error", "message": "Invalid operation. Use 'add', 'subtract', or 'set'"}
                 
-                item["last_updated"] = datetime.now().isoformat()
+                self._update_stock_flags(item)
+                item.last_updated = now_iso()
                 if notes:
-                    item["last_update_notes"] = notes
+                    item.last_update_notes = notes
                 
-                logger.info(f"Updated inventory {item_id}: {old_quantity} -> {item['quantity']}")
+                logger.debug("Updated inventory {}: {} -> {}", item_id, old_quantity, item.quantity)
                 
                 return {
                     "status": "success",
-                    "message": f"Inventory updated for {item['item_name']}",
+                    "message": f"Inventory updated for {item.item_name}",
                     "old_quantity": old_quantity,
-                    "new_quantity": item["quantity"],
-                    "item": item
+                    "new_quantity": item.quantity,
+                    "item": item.to_dict()
                 }
                 
             except Exception as e:
                 logger.error(f"Error updating inventory: {e}")
                 return {"status": "error", "message": f"Failed to update inventory: {str(e)}"}
         
-        @self.mcp.tool()
+        @self._tool
         async def create_purchase_order(
             vendor_id: str,
             items: List[Dict[str, Any]],
@@ -166,9 +236,13 @@ class SupplyChainTools:
         ) -> Dict[str, Any]:
             """Create a purchase order for aviation parts/supplies"""
             try:
-                order_id = f"PO_{str(uuid.uuid4())[:8]}"
+                order_id = f"PO_{secrets.token_hex(4)}"
                 
-                total_amount = sum(item.get("quantity", 0) * item.get("unit_price", 0) for item in items)
+                # Single C-level multiply-accumulate over the line items
+                total_amount = math.sumprod(
+                    [item.get("quantity", 0) for item in items],
+                    [item.get("unit_price", 0) for item in items]
+                )
                 
                 order = {
                     "order_id": order_id,
@@ -178,12 +252,12 @@ class SupplyChainTools:
                     "priority": priority,
                     "status": "pending",
                     "notes": notes,
-                    "created_at": datetime.now().isoformat(),
+                    "created_at": now_iso(),
                     "expected_delivery": (datetime.now() + timedelta(days=7)).isoformat()
                 }
                 
                 self.orders_db[order_id] = order
-                logger.info(f"Created purchase order: {order_id}")
+                logger.debug("Created purchase order: {}", order_id)
                 
                 return {
                     "status": "success",
@@ -196,27 +270,22 @@ class SupplyChainTools:
                 logger.error(f"Error creating purchase order: {e}")
                 return {"status": "error", "message": f"Failed to create purchase order: {str(e)}"}
         
-        @self.mcp.tool()
+        @self._tool
         async def get_low_stock_alerts() -> Dict[str, Any]:
             """Get alerts for items with low stock levels"""
             try:
                 low_stock_items = [
-                    item for item in self.inventory_db.values()
-                    if item["quantity"] <= item["critical_level"]
+                    self.inventory_db[item_id].to_dict() for item_id in self._in_item_order(self.low_stock_ids)
                 ]
                 
-                critical_items = [
-                    item for item in low_stock_items
-                    if item["quantity"] == 0
-                ]
-                
-                return {
+                result = {
                     "status": "success",
                     "total_low_stock": len(low_stock_items),
-                    "critical_items": len(critical_items),
+                    "critical_items": len(self.out_of_stock_ids),
                     "low_stock_items": low_stock_items,
-                    "generated_at": datetime.now().isoformat()
+                    "generated_at": now_iso()
                 }
+                return result
                 
             except Exception as e:
                 logger.error(f"Error getting low stock alerts: {e}")
@@ -224,10 +293,11 @@ class SupplyChainTools:
     
     def get_tools(self) -> List[Any]:
         """Get all registered supply chain tools"""
-        return list(self.mcp.get_tools().values())
+        return self._tools
     
     async def start_server(self, port: int = None):
         """Start the Supply Chain MCP server"""
+        config = get_config()
         server_port = port or config.mcp_base_port + 3
         logger.info(f"Starting Supply Chain MCP server on port {server_port}")
         await self.mcp.run(host=config.mcp_host, port=server_port)
\ No newline at end of file
@@ -1,5 +1,12 @@
 # Shared utilities package
-from .config import Config, config
+from .config import Config, get_config, get_config_snapshot
 from .logging_config import setup_logging
 
-__all__ = ["Config", "config", "setup_logging"]
\ No newline at end of file
+__all__ = ["Config", "get_config", "get_config_snapshot", "config", "setup_logging"]
+
+
+def __getattr__(name):
+    """Resolve the global config lazily"""
+    if name == "config":
+        return get_config()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,114 @@
+"""
+Micro-batching helper for coalescing concurrent async requests
+"""
+import asyncio
+from typing import Any, Awaitable, Callable, List, Optional, Set, Tuple
+
+
+def _fail_closed(batch: List[Tuple[Any, asyncio.Future]]):
+    """Fail the still-pending futures of items the batcher will not handle"""
+    for _, future in batch:
+        if not future.done():
+            future.set_exception(RuntimeError("batcher closed"))
+
+
+class MicroBatcher:
+    """Collects submitted items and hands them to a batch handler
+    
+    A batch is flushed as soon as it holds max_batch_size items or the first
+    item has waited max_wait_ms, whichever comes first.
+    """
+    
+    def __init__(
+        self,
+        handler: Callable[[List[Any]], Awaitable[List[Any]]],
+        max_batch_size: int = 16,
+        max_wait_ms: float = 10
+    ):
+        self.handler = handler
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        # The loop only keeps weak references to tasks, so hold the dispatches here
+        self._inflight: Set[asyncio.Task] = set()
+        self._closed = False
+    
+    async def submit(self, item: Any) -> Any:
+        """Queue an item and wait for its result"""
+        if self._closed:
+            raise RuntimeError("batcher closed")
+        if self._worker is None or self._worker.done():
+            # Start on first use so the queue binds to the running loop
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.create_task(self._run_loop())
+        
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((item, future))
+        return await future
+    
+    async def _run_loop(self):
+        """Collect items into batches and dispatch them"""
+        loop = asyncio.get_running_loop()
+        
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_wait
+            
+            try:
+                while len(batch) < self.max_batch_size:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                    except asyncio.TimeoutError:
+                        break
+            except asyncio.CancelledError:
+                # Closed while collecting; this batch was already taken off the queue
+                _fail_closed(batch)
+                raise
+            
+            # Don't block collection of the next batch on this one
+            task = asyncio.create_task(self._dispatch(batch))
+            self._inflight.add(task)
+            task.add_done_callback(self._inflight.discard)
+    
+    async def _dispatch(self, batch: List[Tuple[Any, asyncio.Future]]):
+        """Run the handler for one batch and resolve its futures"""
+        try:
+            results = await self.handler([item for item, _ in batch])
+        except asyncio.CancelledError:
+            _fail_closed(batch)
+            raise
+        except Exception as e:
+            results = [e] * len(batch)
+        
+        for (_, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+    
+    async def close(self):
+        """Stop the background worker and fail everything not yet answered
+        
+        Later submit() calls raise RuntimeError.
+        """
+        self._closed = True
+        if self._worker is not None:
+            self._worker.cancel()
+            await asyncio.gather(self._worker, return_exceptions=True)
+            self._worker = None
+        
+        # Items still queued never reached a batch
+        while self._queue is not None and not self._queue.empty():
+            _fail_closed([self._queue.get_nowait()])
+        
+        # Cancelling a dispatch leaves its futures pending, so fail them too
+        inflight = list(self._inflight)
+        for task in inflight:
+            task.cancel()
+        await asyncio.gather(*inflight, return_exceptions=True)
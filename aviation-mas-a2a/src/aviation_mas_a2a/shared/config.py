@@ -1,11 +1,14 @@
 """
 Shared configuration for Aviation MAS-A2A system
 """
-import os
+from functools import lru_cache
+from types import SimpleNamespace
 from typing import Optional
 from pydantic_settings import BaseSettings
 from pydantic import Field
 
+from .. import _litellm_env  # noqa: F401  (LiteLLM env defaults, set before litellm loads)
+
 
 class Config(BaseSettings):
     """Global configuration for the aviation system"""
@@ -24,15 +27,32 @@ class Config(BaseSettings):
     litellm_model: str = Field(default="gpt-3.5-turbo", env="LITELLM_MODEL")
     litellm_api_key: Optional[str] = Field(default=None, env="LITELLM_API_KEY")
     litellm_base_url: Optional[str] = Field(default=None, env="LITELLM_BASE_URL")
+    # Micro-batching of concurrent agent runs
+    llm_batch_max_size: int = Field(default=32, env="LLM_BATCH_MAX_SIZE")
+    llm_batch_window_ms: float = Field(default=20, env="LLM_BATCH_WINDOW_MS")
+    # Send one warm-up request at startup to fill the provider's prompt cache
+    llm_prefix_warmup: bool = Field(default=False, env="LLM_PREFIX_WARMUP")
+    # Validate the API key once at startup (costs one real completion request)
+    llm_key_check: bool = Field(default=False, env="LLM_KEY_CHECK")
     
     # Server Configuration
     server_host: str = Field(default="0.0.0.0", env="SERVER_HOST")
     server_port: int = Field(default=8000, env="SERVER_PORT")
     debug: bool = Field(default=True, env="DEBUG")
+    # Number of worker processes (0 = one per CPU)
+    server_workers: int = Field(default=1, env="SERVER_WORKERS")
     
     # MCP Server Configuration
     mcp_host: str = Field(default="localhost", env="MCP_HOST")
     mcp_base_port: int = Field(default=9000, env="MCP_BASE_PORT")
+    # Start the MCP servers from the app's startup hook (main.py turns this off
+    # for its worker processes and runs them once in the supervisor instead)
+    mcp_in_process: bool = Field(default=True, env="MCP_IN_PROCESS")
+    
+    # Agent Manager Configuration
+    max_active_conversations: int = Field(default=10_000, env="MAX_ACTIVE_CONVERSATIONS")
+    # Shared conversation store for multi-worker deployments (in-memory if unset)
+    redis_url: Optional[str] = Field(default=None, env="REDIS_URL")
     
     # Aviation Business Configuration
     aviation_departments: list[str] = Field(default=[
@@ -50,5 +70,24 @@ class Config(BaseSettings):
         case_sensitive = False
 
 
-# Global config instance
-config = Config()
\ No newline at end of file
+@lru_cache(maxsize=1)
+def get_config() -> Config:
+    """Get the global config, loading env/.env on first call"""
+    return Config()
+
+
+@lru_cache(maxsize=1)
+def get_config_snapshot() -> SimpleNamespace:
+    """Plain-attribute copy of the global config for per-request reads
+    
+    The settings don't change after startup, so hot paths can read this
+    instead of going through the pydantic model on every access.
+    """
+    return SimpleNamespace(**get_config().model_dump())
+
+
+def __getattr__(name):
+    """Keep `from ...config import config` working, loaded on first access"""
+    if name == "config":
+        return get_config()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,103 @@
+"""
+Conversation storage for Aviation MAS-A2A system
+
+The in-memory store is process-local. Use the Redis store when running several
+server workers so every worker sees the same conversations.
+"""
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+import orjson
+
+
+@dataclass(slots=True, frozen=True)
+class Conversation:
+    """An active multi-agent conversation"""
+    id: str
+    participants: Tuple[str, ...]
+    started_at: float  # wall-clock (time.time()); shared with other workers via Redis
+    messages: List[Dict[str, Any]] = field(default_factory=list)
+    status: str = "active"
+
+
+class InMemoryConversationStore:
+    """Bounded LRU of conversations held by this process"""
+    
+    def __init__(self, max_conversations: int):
+        self.max_conversations = max_conversations
+        self._conversations: OrderedDict[str, Conversation] = OrderedDict()
+    
+    async def put(self, conversation: Conversation):
+        """Store a conversation, evicting the oldest ones beyond the limit"""
+        self._conversations[conversation.id] = conversation
+        self._conversations.move_to_end(conversation.id)
+        
+        while len(self._conversations) > self.max_conversations:
+            self._conversations.popitem(last=False)
+    
+    async def get(self, conversation_id: str) -> Optional[Conversation]:
+        """Get a conversation by id"""
+        return self._conversations.get(conversation_id)
+    
+    async def count(self) -> int:
+        """Number of stored conversations"""
+        return len(self._conversations)
+    
+    async def close(self):
+        """Drop all conversations"""
+        self._conversations.clear()
+
+
+class RedisConversationStore:
+    """Conversations shared by all workers through Redis"""
+    
+    _INDEX_KEY = "aviation:conversations"
+    _KEY_PREFIX = "aviation:conversation:"
+    
+    def __init__(self, redis_url: str, max_conversations: int):
+        import redis.asyncio as redis
+        
+        self.max_conversations = max_conversations
+        self._redis = redis.from_url(redis_url)
+    
+    async def put(self, conversation: Conversation):
+        """Store a conversation, evicting the oldest ones beyond the limit"""
+        key = self._KEY_PREFIX + conversation.id
+        
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.set(key, orjson.dumps(asdict(conversation)))
+            # Wall-clock score: monotonic clocks differ between processes
+            pipe.zadd(self._INDEX_KEY, {conversation.id: time.time()})
+            await pipe.execute()
+        
+        overflow = await self._redis.zcard(self._INDEX_KEY) - self.max_conversations
+        if overflow > 0:
+            evicted = await self._redis.zpopmin(self._INDEX_KEY, overflow)
+            await self._redis.delete(*(self._KEY_PREFIX + cid.decode() for cid, _ in evicted))
+    
+    async def get(self, conversation_id: str) -> Optional[Conversation]:
+        """Get a conversation by id"""
+        data = await self._redis.get(self._KEY_PREFIX + conversation_id)
+        if data is None:
+            return None
+        
+        record = orjson.loads(data)
+        record["participants"] = tuple(record["participants"])
+        return Conversation(**record)
+    
+    async def count(self) -> int:
+        """Number of stored conversations"""
+        return await self._redis.zcard(self._INDEX_KEY)
+    
+    async def close(self):
+        """Close the Redis connection (conversations stay for other workers)"""
+        await self._redis.aclose()
+
+
+def create_conversation_store(redis_url: Optional[str], max_conversations: int):
+    """Use Redis when configured, otherwise keep conversations in memory"""
+    if redis_url:
+        return RedisConversationStore(redis_url, max_conversations)
+    return InMemoryConversationStore(max_conversations)
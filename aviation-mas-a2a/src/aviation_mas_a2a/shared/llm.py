@@ -0,0 +1,27 @@
+"""
+Shared LiteLLM model clients for Aviation MAS-A2A system
+"""
+from functools import lru_cache
+from typing import Optional
+
+
+@lru_cache(maxsize=None)
+def get_lite_llm(
+    model: str,
+    api_key: Optional[str] = None,
+    temperature: Optional[float] = None,
+    max_tokens: Optional[int] = None
+):
+    """Get a LiteLlm client, shared by all agents using the same settings"""
+    from google.adk.models.lite_llm import LiteLlm
+    
+    kwargs = {"api_key": api_key, "temperature": temperature, "max_tokens": max_tokens}
+    return LiteLlm(model=model, **{k: v for k, v in kwargs.items() if v is not None})
+
+
+def prewarm(model: str):
+    """Load LiteLLM, the model client and its tokenizer ahead of the first request"""
+    import litellm
+    
+    get_lite_llm(model)
+    litellm.encode(model=model, text="warm-up")
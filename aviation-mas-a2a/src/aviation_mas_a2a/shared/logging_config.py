@@ -2,12 +2,43 @@
 Logging configuration for Aviation MAS-A2A system
 """
 import sys
+import orjson
 from loguru import logger
-from .config import config
+from .config import get_config
+
+
+# loguru's numeric level for DEBUG
+_DEBUG_LEVEL = 10
+
+
+def _json_sink(message):
+    """Write a log record as one orjson-encoded line"""
+    record = message.record
+    payload = {
+        "time": record["time"].isoformat(),
+        "level": record["level"].name,
+        "name": record["name"],
+        "function": record["function"],
+        "line": record["line"],
+        "message": record["message"],
+    }
+    if record["extra"]:
+        payload["extra"] = record["extra"]
+    if record["exception"]:
+        payload["exception"] = str(record["exception"].value)
+    
+    sys.stdout.buffer.write(orjson.dumps(payload, default=str) + b"\n")
+    sys.stdout.flush()
+
+
+def debug_enabled() -> bool:
+    """Whether any handler accepts DEBUG records (to guard costly log messages)"""
+    return logger._core.min_level <= _DEBUG_LEVEL
 
 
 def setup_logging():
     """Configure logging for the aviation system"""
+    config = get_config()
     
     # Remove default handler
     logger.remove()
@@ -18,15 +49,26 @@ def setup_logging():
     else:
         log_format = "<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> | <level>{message}</level>"
     
-    # Add console handler
-    logger.add(
-        sys.stdout,
-        format=log_format,
-        level=config.log_level,
-        colorize=True if config.log_format != "json" else False,
-        backtrace=True,
-        diagnose=True,
-    )
+    # Add console handler; enqueue moves formatting and I/O to a background thread.
+    # Extended tracebacks (variable values) are costly, so only while debugging
+    if config.log_format == "json":
+        logger.add(
+            _json_sink,
+            level=config.log_level,
+            enqueue=True,
+            backtrace=config.debug,
+            diagnose=config.debug,
+        )
+    else:
+        logger.add(
+            sys.stdout,
+            format=log_format,
+            level=config.log_level,
+            colorize=config.debug,
+            enqueue=True,
+            backtrace=config.debug,
+            diagnose=config.debug,
+        )
     
     # Add file handler for errors
     logger.add(
@@ -36,6 +78,9 @@ def setup_logging():
         rotation="10 MB",
         retention="30 days",
         compression="zip",
+        enqueue=True,
+        backtrace=config.debug,
+        diagnose=config.debug,
     )
     
     logger.info("Logging configured for Aviation MAS-A2A system")
@@ -0,0 +1,159 @@
+"""
+Stale-while-revalidate cache for LiteLLM model metadata, and a one-off API key check
+"""
+import asyncio
+import hashlib
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+from loguru import logger
+
+
+CACHE_DIR = Path.home() / ".cache" / "aviation_mas"
+
+# Model info fields worth keeping (the full LiteLLM entry has many more)
+_MODEL_META_FIELDS = (
+    "litellm_provider", "max_tokens", "max_input_tokens", "max_output_tokens",
+    "input_cost_per_token", "output_cost_per_token", "supports_function_calling"
+)
+
+
+class StaleWhileRevalidateCache:
+    """JSON-file backed cache that answers immediately and refreshes in the background"""
+    
+    def __init__(self, path: Path, ttl_seconds: float, fetch: Callable[[str], Any]):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.fetch = fetch
+        self._entries: Optional[Dict[str, Dict[str, Any]]] = None
+        self._refresh_tasks: Dict[str, asyncio.Task] = {}
+        # Writes finish in the order their snapshots were taken
+        self._save_lock = asyncio.Lock()
+    
+    def get(self, key: str, fetch_arg: Any = None) -> Any:
+        """Return the cached value (possibly stale, None if unknown) and schedule a refresh if needed"""
+        entry = self._load().get(key)
+        
+        if entry is None or time.time() - entry["fetched_at"] > self.ttl_seconds:
+            self._schedule_refresh(key, key if fetch_arg is None else fetch_arg)
+        
+        return entry["value"] if entry else None
+    
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        """Read the cache file once per process"""
+        if self._entries is None:
+            try:
+                self._entries = json.loads(self.path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                self._entries = {}
+        return self._entries
+    
+    def _schedule_refresh(self, key: str, fetch_arg: Any):
+        """Start a background refresh unless one is already running"""
+        if key in self._refresh_tasks:
+            return
+        
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No event loop (e.g. CLI usage); keep serving what we have
+            return
+        
+        task = loop.create_task(self._refresh(key, fetch_arg))
+        self._refresh_tasks[key] = task
+        task.add_done_callback(lambda _: self._refresh_tasks.pop(key, None))
+    
+    async def _refresh(self, key: str, fetch_arg: Any):
+        """Fetch a fresh value and persist it; on failure keep the stale one"""
+        try:
+            value = await asyncio.to_thread(self.fetch, fetch_arg)
+            self._load()[key] = {"value": value, "fetched_at": time.time()}
+            async with self._save_lock:
+                # Serialize on the loop, where no other refresh can change the dict meanwhile
+                payload = json.dumps(self._entries)
+                await asyncio.to_thread(self._write, payload)
+        except Exception as e:
+            logger.warning(f"Failed to refresh {self.path.name} entry {key}: {e}")
+    
+    def _write(self, payload: str):
+        """Atomically replace the cache file with payload
+        
+        Each write gets its own temp file, so concurrent saves (other refreshes
+        or other worker processes) never share one.
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            "w", encoding="utf-8", dir=self.path.parent, prefix=self.path.stem, suffix=".tmp", delete=False
+        ) as tmp:
+            tmp.write(payload)
+        try:
+            os.replace(tmp.name, self.path)
+        except OSError:
+            os.unlink(tmp.name)
+            raise
+
+
+def _fetch_model_meta(model_name: str) -> Dict[str, Any]:
+    """Look up model metadata through LiteLLM"""
+    import litellm
+    
+    info = litellm.get_model_info(model_name)
+    return {field: info.get(field) for field in _MODEL_META_FIELDS}
+
+
+def _check_api_key(model_name: str, api_key: str) -> bool:
+    """Validate an API key against the model provider (sends a real, billed completion)"""
+    import litellm
+    
+    return bool(litellm.check_valid_key(model=model_name, api_key=api_key))
+
+
+_model_meta_cache = StaleWhileRevalidateCache(
+    CACHE_DIR / "model_meta.json", ttl_seconds=24 * 3600, fetch=_fetch_model_meta
+)
+
+# Key check results for this process, by digest of model and key (never persisted)
+_api_key_status: Dict[str, bool] = {}
+_api_key_checks: Dict[str, asyncio.Task] = {}
+
+
+def get_model_meta(model_name: str) -> Dict[str, Any]:
+    """Get cached metadata (context limits, pricing) for a model without blocking"""
+    return _model_meta_cache.get(model_name) or {}
+
+
+def get_api_key_status(model_name: str, api_key: Optional[str], check: bool = False) -> Optional[bool]:
+    """Get the known validity of an API key without blocking (None if not known)
+    
+    Checking a key costs a provider request, so it only happens with check=True,
+    at most once per process and in the background; the result is logged and
+    returned by later calls.
+    """
+    if not api_key:
+        return False
+    
+    # Never keep the key itself, only a digest of it
+    key_digest = hashlib.sha256(f"{model_name}:{api_key}".encode()).hexdigest()
+    if check and key_digest not in _api_key_checks:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No event loop (e.g. CLI usage); leave the key unchecked
+            return _api_key_status.get(key_digest)
+        _api_key_checks[key_digest] = loop.create_task(_run_key_check(key_digest, model_name, api_key))
+    return _api_key_status.get(key_digest)
+
+
+async def _run_key_check(key_digest: str, model_name: str, api_key: str):
+    """Check a key once and remember the result; a failed check leaves it unknown"""
+    try:
+        valid = await asyncio.to_thread(_check_api_key, model_name, api_key)
+    except Exception as e:
+        logger.warning(f"Failed to check the LiteLLM API key: {e}")
+        return
+    _api_key_status[key_digest] = valid
+    if not valid:
+        logger.warning("LiteLLM API key is invalid, LLM calls will fail")
@@ -0,0 +1,32 @@
+"""
+JSON response class for the Aviation MAS-A2A API
+"""
+from types import MappingProxyType
+from typing import Any
+
+import orjson
+from fastapi.responses import ORJSONResponse
+
+
+def _json_default(obj: Any) -> Any:
+    """Serialize read-only mappings and slotted result objects"""
+    if isinstance(obj, MappingProxyType):
+        return dict(obj)
+    
+    # Result dataclasses: unset (None) fields are left out, matching the old dicts
+    slots = getattr(type(obj), "__slots__", None)
+    if slots is not None:
+        return {name: value for name in slots if (value := getattr(obj, name)) is not None}
+    
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+class AviationJSONResponse(ORJSONResponse):
+    """ORJSONResponse that also understands the agent manager's result types"""
+    
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content,
+            default=_json_default,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_PASSTHROUGH_DATACLASS
+        )
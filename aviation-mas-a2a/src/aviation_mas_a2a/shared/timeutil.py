@@ -0,0 +1,23 @@
+"""
+Timestamp helpers for the MCP tool servers
+"""
+import time
+from datetime import datetime
+
+
+# Calls within this many seconds of each other share one timestamp string
+_RESOLUTION = 0.001
+
+_last_iso = ""
+_last_at = float("-inf")
+
+
+def now_iso() -> str:
+    """Current local time as an ISO string, reused for up to a millisecond"""
+    global _last_iso, _last_at
+    
+    now = time.monotonic()
+    if now - _last_at >= _RESOLUTION:
+        _last_iso = datetime.now().isoformat()
+        _last_at = now
+    return _last_iso
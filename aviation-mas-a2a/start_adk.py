@@ -13,31 +13,24 @@ src_path = project_root / "src"
 sys.path.insert(0, str(src_path))
 
 from aviation_mas_a2a.shared.logging_config import setup_logging
-from aviation_mas_a2a.mcp_servers.hr_tools import HRTools
-from aviation_mas_a2a.mcp_servers.meeting_tools import MeetingTools
-from aviation_mas_a2a.mcp_servers.supply_chain_tools import SupplyChainTools
+from aviation_mas_a2a.mcp_servers import get_tool_server
+
+try:
+    import uvloop
+except ImportError:  # not available on Windows
+    uvloop = None
 
 
 async def start_mcp_servers():
-    """Start all MCP servers in background"""
+    """Run all MCP servers until cancelled"""
     print("Starting MCP servers...")
     
-    # Start HR tools server
-    hr_tools = HRTools()
-    asyncio.create_task(hr_tools.start_server(8001))
-    
-    # Start Meeting tools server
-    meeting_tools = MeetingTools()
-    asyncio.create_task(meeting_tools.start_server(8002))
-    
-    # Start Supply Chain tools server
-    supply_chain_tools = SupplyChainTools()
-    asyncio.create_task(supply_chain_tools.start_server(8003))
-    
-    print("MCP servers started on ports 8001-8003")
-    
-    # Give servers time to start
-    await asyncio.sleep(2)
+    # HR, Meeting and Supply Chain servers; if one fails the others are stopped
+    async with asyncio.TaskGroup() as tg:
+        for port, key in ((8001, "hr"), (8002, "meeting"), (8003, "supply_chain")):
+            tg.create_task(get_tool_server(key).start_server(port))
+        
+        print("MCP servers started on ports 8001-8003")
 
 
 def start_adk_web():
@@ -85,17 +78,19 @@ async def main():
     setup_logging()
     
     try:
-        # Start MCP servers first
-        await start_mcp_servers()
-        
-        print("\n✅ MCP servers are running")
-        print("🌐 Starting ADK web interface...")
-        print("📱 Open http://localhost:8000 in your browser")
-        print("🔧 MCP Tools available on ports 8001-8003")
-        print("\nPress Ctrl+C to stop\n")
-        
-        # Start ADK web interface (this will block)
-        start_adk_web()
+        async with asyncio.TaskGroup() as tg:
+            # Start MCP servers first
+            servers = tg.create_task(start_mcp_servers())
+            
+            print("\n✅ MCP servers are running")
+            print("🌐 Starting ADK web interface...")
+            print("📱 Open http://localhost:8000 in your browser")
+            print("🔧 MCP Tools available on ports 8001-8003")
+            print("\nPress Ctrl+C to stop\n")
+            
+            # ADK web blocks until it exits; run it in a thread so the loop keeps serving MCP
+            await asyncio.to_thread(start_adk_web)
+            servers.cancel()
         
     except KeyboardInterrupt:
         print("\n🛑 Shutting down Aviation MAS-A2A system...")
@@ -104,4 +99,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    (uvloop.run if uvloop else asyncio.run)(main())
\ No newline at end of file
@@ -0,0 +1,31 @@
+"""
+Routing tests for the agent manager
+"""
+import asyncio
+
+import pytest
+
+from aviation_mas_a2a.agents.agent_manager import AgentManager, _ROUTING_KEYWORDS
+
+
+def _reference(message):
+    """The original sequential substring checks"""
+    message_lower = message.lower()
+    for agent_type, keywords in _ROUTING_KEYWORDS:
+        if any(keyword in message_lower for keyword in keywords):
+            return agent_type
+    return "base"
+
+
+@pytest.mark.parametrize("message", [
+    "Schedule a crew rotation",
+    "Book a CONFERENCE room",
+    "Order new brake parts",
+    "Need ſupply levels",
+    "İnventory check",
+    "Hello there",
+])
+def test_routing_matches_substring_checks(message):
+    manager = AgentManager()
+    
+    assert asyncio.run(manager._determine_target_agent(message, {})) == _reference(message)
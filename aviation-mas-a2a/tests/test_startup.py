@@ -0,0 +1,32 @@
+"""
+Startup tests for the tool servers and the FastAPI app
+"""
+import pytest
+from fastapi.testclient import TestClient
+
+from aviation_mas_a2a.mcp_servers import HRTools, MeetingTools, SupplyChainTools
+from aviation_mas_a2a.shared.config import get_config
+
+
+@pytest.mark.parametrize("server_class", [HRTools, MeetingTools, SupplyChainTools])
+def test_tool_servers_build_their_tool_list(server_class):
+    tools = server_class().get_tools()
+    
+    assert tools
+    assert all(callable(tool) for tool in tools)
+
+
+def test_app_starts_with_all_agents(monkeypatch):
+    # Don't bind the MCP ports from the test process
+    monkeypatch.setenv("MCP_IN_PROCESS", "false")
+    get_config.cache_clear()
+    from aviation_mas_a2a import app as app_module
+    
+    try:
+        with TestClient(app_module.app) as client:
+            assert set(app_module.agent_manager.agents) == {"base", "hr", "meeting", "supply_chain"}
+            response = client.get("/mcp/tools")
+            assert response.status_code == 200
+            assert set(response.json()["mcp_servers"]) == {"hr", "meeting", "supply_chain"}
+    finally:
+        get_config.cache_clear()
@@ -3,6 +3,8 @@ import logging
 import asyncio
 from typing import Dict, Any
 
+from .routing import RESPONSE_LABELS, classify
+
 logger = logging.getLogger(__name__)
 
 class RootAgent:
@@ -17,21 +19,9 @@ class RootAgent:
         try:
             logger.info(f"Aviation Base Agent received: {message}")
             
-            # Simple routing based on keywords
-            message_lower = message.lower()
-            
-            if any(word in message_lower for word in ['hr', 'employee', 'staff', 'crew', 'pilot', 'training']):
-                response = f"🏢 HR Operations: Processing request - {message}"
-                agent_type = "hr"
-            elif any(word in message_lower for word in ['meeting', 'schedule', 'calendar', 'appointment']):
-                response = f"📅 Meeting Coordination: Processing request - {message}"  
-                agent_type = "meeting"
-            elif any(word in message_lower for word in ['supply', 'inventory', 'parts', 'maintenance', 'procurement']):
-                response = f"📦 Supply Chain: Processing request - {message}"
-                agent_type = "supply_chain"
-            else:
-                response = f"✈️ Aviation Operations: General coordination - {message}"
-                agent_type = "general"
+            # Simple routing based on keywords (one scan over the message)
+            agent_type = classify(message.lower())
+            response = f"{RESPONSE_LABELS[agent_type]} - {message}"
             
             return {
                 "response": response,
@@ -0,0 +1,95 @@
+# Keyword routing shared by the ADK root agents
+import re
+from typing import Dict, Tuple
+
+try:
+    import hyperscan
+except ImportError:  # optional; the stdlib matcher below is used instead
+    hyperscan = None
+
+# Keywords per category, most frequent first
+HR_KW = ('hr', 'crew', 'pilot', 'staff', 'employee', 'training')
+MEETING_KW = ('meeting', 'schedule', 'calendar', 'appointment')
+SUPPLY_KW = ('parts', 'inventory', 'maintenance', 'supply', 'procurement')
+
+# Categories in priority order
+ROUTING_KEYWORDS: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    ("hr", HR_KW),
+    ("meeting", MEETING_KW),
+    ("supply_chain", SUPPLY_KW),
+)
+
+# Response prefix per category
+RESPONSE_LABELS: Dict[str, str] = {
+    "hr": "🏢 HR Operations: Processing request",
+    "meeting": "📅 Meeting Coordination: Processing request",
+    "supply_chain": "📦 Supply Chain: Processing request",
+    "general": "✈️ Aviation Operations: General coordination",
+}
+
+# HR is checked separately (see classify); the rest share one pattern
+_CATEGORY_OF = {word: category for category, words in ROUTING_KEYWORDS[1:] for word in words}
+_PRIORITY = {category: rank for rank, (category, _) in enumerate(ROUTING_KEYWORDS[1:])}
+
+# All remaining keywords in one pattern; the lookahead also reports overlapping keywords
+_KEYWORD_RE = re.compile("(?=(" + "|".join(map(re.escape, _CATEGORY_OF)) + "))")
+
+
+def _compile_hyperscan():
+    """One Hyperscan database with a pattern per category (id = priority)"""
+    database = hyperscan.Database()
+    database.compile(
+        expressions=[
+            "|".join(map(re.escape, words)).encode() for _, words in ROUTING_KEYWORDS
+        ],
+        ids=list(range(len(ROUTING_KEYWORDS))),
+        elements=len(ROUTING_KEYWORDS),
+        flags=[hyperscan.HS_FLAG_SINGLEMATCH] * len(ROUTING_KEYWORDS),
+    )
+    return database
+
+
+_HS_DATABASE = _compile_hyperscan() if hyperscan is not None else None
+
+
+def _classify_hyperscan(message_lower: str) -> str:
+    """Single DFA scan of the message; the lowest matching id wins"""
+    hits = []
+    
+    def on_match(pattern_id, start, end, flags, context):
+        hits.append(pattern_id)
+        # Nothing outranks the first category, stop scanning
+        return pattern_id == 0
+    
+    try:
+        _HS_DATABASE.scan(message_lower.encode(), match_event_handler=on_match)
+    except hyperscan.ScanTerminated:
+        pass
+    return ROUTING_KEYWORDS[min(hits)][0] if hits else "general"
+
+
+def classify(message_lower: str) -> str:
+    """Route a lowercased message to "hr", "meeting", "supply_chain" or "general"
+    
+    Gives the same result as checking each category's keywords in priority
+    order, but scans the message at most once after the HR check (or exactly
+    once with Hyperscan installed).
+    """
+    if _HS_DATABASE is not None:
+        return _classify_hyperscan(message_lower)
+    
+    # Highest priority and most common: chained `in` tests short-circuit
+    # without any regex or generator setup (same words as HR_KW)
+    if ('hr' in message_lower or 'crew' in message_lower or 'pilot' in message_lower
+            or 'staff' in message_lower or 'employee' in message_lower
+            or 'training' in message_lower):
+        return "hr"
+    
+    best = None
+    for match in _KEYWORD_RE.finditer(message_lower):
+        category = _CATEGORY_OF[match.group(1)]
+        if best is None or _PRIORITY[category] < _PRIORITY[best]:
+            best = category
+            if _PRIORITY[best] == 0:
+                break
+    return best or "general"
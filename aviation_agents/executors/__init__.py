@@ -4,11 +4,13 @@ from .hr_executor import HRAgentExecutor
 from .meeting_executor import MeetingAgentExecutor
 from .supply_chain_executor import SupplyChainAgentExecutor
 from .orchestrator_executor import OrchestratorAgentExecutor
+from .registry import get_executor
 
 __all__ = [
     "BaseAgentExecutor",
     "HRAgentExecutor", 
     "MeetingAgentExecutor",
     "SupplyChainAgentExecutor",
-    "OrchestratorAgentExecutor"
+    "OrchestratorAgentExecutor",
+    "get_executor"
 ]
\ No newline at end of file
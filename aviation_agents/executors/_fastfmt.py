@@ -0,0 +1,29 @@
+# executors/_fastfmt.py - tool result formatting for _combine_responses
+#
+# Plain, fully annotated Python so it can be compiled ahead of time with
+# `mypyc executors/_fastfmt.py`; the built extension is then imported in place of
+# this file, and this file remains the fallback when it isn't built.
+from functools import lru_cache
+from typing import List
+
+from .tool_result import ToolResult
+
+
+@lru_cache(maxsize=512)
+def _pretty(name: str) -> str:
+    """Display form of a tool or field name ("tool_name" -> "Tool Name"); names come from a small fixed set"""
+    return name.replace('_', ' ').title()
+
+
+def format_tool_results(tool_results: List[ToolResult]) -> str:
+    """Markdown lines for each tool result, one blank line after every entry"""
+    parts: List[str] = []
+    for tool_result in tool_results:
+        if tool_result.error is None:
+            parts.append(f"✅ **{_pretty(tool_result.tool)}:**")
+            for key, value in tool_result.fields.items():
+                parts.append(f"   - {_pretty(key)}: {value}")
+        else:
+            parts.append(f"❌ **Error:** {tool_result.error}")
+        parts.append("")
+    return "\n".join(parts)
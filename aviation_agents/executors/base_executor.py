@@ -1,22 +1,65 @@
 # executors/base_executor.py
 import asyncio
+import inspect
 import logging
+import os
+import time
 from abc import ABC, abstractmethod
-from typing import Any, Dict, AsyncGenerator, AsyncIterable, Optional, List
+from collections import OrderedDict
+from contextvars import ContextVar
+from typing import Any, Awaitable, Dict, AsyncGenerator, AsyncIterable, FrozenSet, Optional, List
 from uuid import uuid4
 import json
 from datetime import datetime
 
 # Import LiteLLM for Ollama integration
+import httpx
 import litellm
 
+from ._fastfmt import format_tool_results
+from .tool_result import ToolResult
+
+try:
+    import orjson
+except ImportError:  # optional; the stdlib encoder is used instead
+    orjson = None
+
 # Configure logging
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.DEBUG)
 
+# Tenant and task of the request being executed (inherited by tasks it spawns)
+current_tenant: ContextVar[str] = ContextVar("tenant", default="-")
+current_task: ContextVar[str] = ContextVar("task", default="-")
+
+
+class TenantLogFilter(logging.Filter):
+    """Adds `tenant_id` and `task_id` from the current request to every log record"""
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.tenant_id = current_tenant.get()
+        record.task_id = current_task.get()
+        return True
+
 # Configure LiteLLM
 litellm.set_verbose = False
 
+# Tool calls in flight across all executors in this process
+_TOOL_SEM = asyncio.Semaphore(int(os.getenv("ORCH_MAX_TOOL_CALLS", "32")))
+
+# Exact-match LLM response cache shared by all executors (size 0 disables it);
+# entries are keyed by tenant so one tenant's answers are never served to another
+LLM_CACHE_SIZE = int(os.getenv("LLM_CACHE_SIZE", "1024"))
+LLM_CACHE_TTL = float(os.getenv("LLM_CACHE_TTL", "300"))
+_llm_cache: "OrderedDict[tuple, tuple]" = OrderedDict()  # key -> (expires_at, response)
+
+
+def _dumps(value: Any) -> str:
+    """JSON text for prompt context (orjson when installed)"""
+    if orjson is not None:
+        return orjson.dumps(value, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(value, default=str)
+
 
 class TaskState:
     """Task states for the agent execution"""
@@ -51,12 +94,15 @@ class RequestContext:
                  context_id: str, 
                  user_message: str,
                  tenant_id: str = "default",
-                 user_id: str = "system"):
+                 user_id: str = "system",
+                 detected_intents: Optional[FrozenSet[str]] = None):
         self.task_id = task_id
         self.context_id = context_id
         self.user_message = user_message
         self.tenant_id = tenant_id
         self.user_id = user_id
+        # Agent/tool keyword groups already found by the orchestrator (None = not scanned)
+        self.detected_intents = detected_intents
         self.created_at = datetime.now()
 
 
@@ -72,13 +118,13 @@ class TaskUpdater:
         """Update task status"""
         status = TaskStatus(state, message, progress)
         self.status_history.append(status)
-        logger.debug(f"Task {self.task_id} status updated: {state} - {message}")
+        logger.debug("Task %s status updated: %s - %s", self.task_id, state, message)
         
     def add_artifact(self, content: Any, artifact_type: str = "text", metadata: Dict[str, Any] = None):
         """Add artifact to task"""
         artifact = Artifact(content, artifact_type, metadata)
         self.artifacts.append(artifact)
-        logger.debug(f"Artifact added to task {self.task_id}: {artifact_type}")
+        logger.debug("Artifact added to task %s: %s", self.task_id, artifact_type)
         
     def complete(self):
         """Mark task as completed"""
@@ -92,10 +138,15 @@ class TaskUpdater:
 class BaseAgentExecutor(ABC):
     """Base abstract class for all agent executors following mas-a2a pattern"""
     
-    def __init__(self, agent_name: str, agent_type: str, system_prompt: str, model: str = "llama3.2"):
+    # One HTTP connection pool shared by every executor's LLM calls
+    _http: Optional[httpx.AsyncClient] = None
+    
+    def __init__(self, agent_name: str, agent_type: str, system_prompt: str, model: str = "llama3.2",
+                 actions_header: str = "## System Actions Performed:"):
         self.agent_name = agent_name
         self.agent_type = agent_type  
         self.system_prompt = system_prompt
+        self.actions_header = actions_header  # Heading for tool results in _combine_responses
         self.model = f"ollama/{model}"
         self.sessions = {}  # In-memory session storage
         
@@ -106,8 +157,23 @@ class BaseAgentExecutor(ABC):
         
     async def execute(self, context: RequestContext) -> Dict[str, Any]:
         """Main execution method that coordinates the agent's work"""
+        result = None
+        async for item in self.execute_stream(context):
+            result = item
+        return result
+    
+    async def execute_stream(self, context: RequestContext) -> AsyncIterable[Artifact | Dict[str, Any]]:
+        """Run the task, yielding each artifact as soon as it is produced
+        
+        The last item is the result dict that execute() returns.
+        """
         task_updater = TaskUpdater(context.task_id, context.context_id)
         
+        # Tag this request's log records once instead of formatting ids into each message;
+        # reset afterwards so the ids don't stick to whatever the caller logs next
+        tenant_token = current_tenant.set(context.tenant_id)
+        task_token = current_task.set(context.task_id)
+        
         try:
             # Start the task
             task_updater.update_status(TaskState.WORKING, f"Starting {self.agent_name} execution")
@@ -115,12 +181,13 @@ class BaseAgentExecutor(ABC):
             # Execute the specific agent task
             async for result in self.execute_task(context, task_updater):
                 if isinstance(result, TaskStatus):
-                    logger.debug(f"Status update for {self.agent_name}: {result.message}")
+                    logger.debug("Status update for %s: %s", self.agent_name, result.message)
                 elif isinstance(result, Artifact):
-                    logger.debug(f"Artifact generated by {self.agent_name}: {result.artifact_type}")
+                    logger.debug("Artifact generated by %s: %s", self.agent_name, result.artifact_type)
+                    yield result
                     
             # Return the final result
-            return {
+            yield {
                 "task_id": context.task_id,
                 "agent_name": self.agent_name,
                 "status": "completed",
@@ -130,27 +197,71 @@ class BaseAgentExecutor(ABC):
             }
             
         except Exception as e:
-            logger.error(f"Error in {self.agent_name} execution: {str(e)}")
+            logger.error("Error in %s execution: %s", self.agent_name, e)
             task_updater.fail(f"Execution failed: {str(e)}")
-            return {
+            yield {
                 "task_id": context.task_id,
                 "agent_name": self.agent_name,
                 "status": "failed",
                 "error": str(e),
                 "execution_time": (datetime.now() - context.created_at).total_seconds()
             }
+        
+        finally:
+            current_tenant.reset(tenant_token)
+            current_task.reset(task_token)
+    
+    @classmethod
+    def http_client(cls) -> httpx.AsyncClient:
+        """The shared HTTP client (created on first use and handed to LiteLLM)"""
+        client = BaseAgentExecutor._http
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                timeout=httpx.Timeout(120.0, connect=10.0),
+                limits=httpx.Limits(max_connections=64, max_keepalive_connections=32)
+            )
+            BaseAgentExecutor._http = client
+            litellm.aclient_session = client
+        return client
+    
+    @classmethod
+    async def aclose(cls):
+        """Close the shared HTTP client on application shutdown"""
+        client = BaseAgentExecutor._http
+        BaseAgentExecutor._http = None
+        if client is not None:
+            litellm.aclient_session = None
+            await client.aclose()
     
     async def _call_llm(self, user_message: str, context: Dict[str, Any] = None) -> str:
-        """Call the LLM with the agent's system prompt"""
+        """Call the LLM with the agent's system prompt
+        
+        Identical prompts from the same tenant within LLM_CACHE_TTL seconds get
+        the cached response.
+        """
+        # The stripped message is both sent and cached, so a hit always matches a real request
+        user_message = user_message.strip()
+        context_str = f"Additional context: {_dumps(context)}" if context else None
+        cache_key = (current_tenant.get(), self.model, self.system_prompt, user_message, context_str)
+        
+        cached = _llm_cache.get(cache_key)
+        if cached is not None:
+            if cached[0] > time.monotonic():
+                _llm_cache.move_to_end(cache_key)
+                return cached[1]
+            del _llm_cache[cache_key]
+        
         try:
+            # Reuse pooled connections to the model server
+            self.http_client()
+            
             messages = [
                 {"role": "system", "content": self.system_prompt},
                 {"role": "user", "content": user_message}
             ]
             
             # Add context if provided
-            if context:
-                context_str = f"Additional context: {json.dumps(context, default=str)}"
+            if context_str:
                 messages.insert(-1, {"role": "assistant", "content": context_str})
             
             response = await litellm.acompletion(
@@ -160,12 +271,105 @@ class BaseAgentExecutor(ABC):
                 max_tokens=1500
             )
             
-            return response.choices[0].message.content
+            content = response.choices[0].message.content
+            
+            # Only successful responses are cached
+            if LLM_CACHE_SIZE > 0:
+                _llm_cache[cache_key] = (time.monotonic() + LLM_CACHE_TTL, content)
+                _llm_cache.move_to_end(cache_key)
+                while len(_llm_cache) > LLM_CACHE_SIZE:
+                    _llm_cache.popitem(last=False)
+            
+            return content
             
         except Exception as e:
-            logger.error(f"LLM call failed for {self.agent_name}: {str(e)}")
+            logger.error("LLM call failed for %s: %s", self.agent_name, e)
             return f"I apologize, but I'm experiencing technical difficulties. Error: {str(e)}"
     
+    def _llm_error_response(self, error: BaseException) -> str:
+        """Apology text used in place of a failed LLM call"""
+        logger.error("LLM call failed for %s: %s", self.agent_name, error)
+        return f"I apologize, but I'm experiencing technical difficulties. Error: {str(error)}"
+    
+    @staticmethod
+    def _tool_error_results(error: BaseException) -> List[ToolResult]:
+        """Tool results used in place of a failed tool run"""
+        logger.error("Tool execution failed: %s", error)
+        return [ToolResult.failed(f"Tool execution failed: {str(error)}")]
+    
+    async def _call_llm_with_tools(self, user_message: str, tools_call) -> tuple:
+        """Run the LLM call and the tool processing concurrently
+        
+        Returns (llm_response, tool_results); a failure in one doesn't cancel the other.
+        """
+        llm_response, tool_results = await asyncio.gather(
+            self._call_llm(user_message), tools_call, return_exceptions=True
+        )
+        
+        if isinstance(llm_response, Exception):
+            llm_response = self._llm_error_response(llm_response)
+        if isinstance(tool_results, Exception):
+            tool_results = self._tool_error_results(tool_results)
+        
+        return llm_response, tool_results
+    
+    async def _stream_llm_with_tools(self, user_message: str, tools_call) -> AsyncIterable[tuple]:
+        """Like _call_llm_with_tools, but yields ("llm", response) and ("tools", results) as each finishes"""
+        llm_task = asyncio.create_task(self._call_llm(user_message))
+        tools_task = asyncio.create_task(tools_call)
+        pending = {llm_task, tools_task}
+        
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                if llm_task in done:
+                    error = llm_task.exception()
+                    yield "llm", self._llm_error_response(error) if error else llm_task.result()
+                if tools_task in done:
+                    error = tools_task.exception()
+                    yield "tools", self._tool_error_results(error) if error else tools_task.result()
+        finally:
+            # Consumer stopped early: don't leave the other call running
+            for task in pending:
+                task.cancel()
+    
+    @staticmethod
+    def _call_tool(tool, *args) -> Awaitable[Any]:
+        """Awaitable for one tool call; synchronous (blocking) tools run in a worker thread"""
+        if inspect.iscoroutinefunction(tool):
+            return tool(*args)
+        return asyncio.to_thread(tool, *args)
+    
+    @staticmethod
+    async def _bounded(call: Awaitable[Any]) -> Any:
+        """Await a tool call once a slot is free (see ORCH_MAX_TOOL_CALLS)"""
+        async with _TOOL_SEM:
+            return await call
+    
+    async def _run_tools(self, pending: List[tuple]) -> List[ToolResult]:
+        """Run (tool_name, awaitable) pairs concurrently, keeping their order
+        
+        A failing tool becomes an error entry instead of aborting the others.
+        """
+        results = await asyncio.gather(*(self._bounded(call) for _, call in pending), return_exceptions=True)
+        
+        tool_results = []
+        for (tool_name, _), result in zip(pending, results):
+            if isinstance(result, Exception):
+                logger.error("Tool execution failed: %s", result)
+                tool_results.append(ToolResult.failed(f"Tool execution failed: {str(result)}"))
+            else:
+                tool_results.append(ToolResult.from_result(tool_name, result))
+        return tool_results
+    
+    async def _combine_responses(self, llm_response: str, tool_results: List[ToolResult], user_message: str) -> str:
+        """Combine LLM response with tool results"""
+        if not tool_results:
+            return llm_response
+        
+        # Create a comprehensive response; the tool section ends with its own blank line
+        return "\n".join((llm_response, "", self.actions_header, "", format_tool_results(tool_results), ""))
+    
     async def _get_session(self, session_id: str) -> Dict[str, Any]:
         """Get or create session"""
         if session_id not in self.sessions:
@@ -179,5 +383,5 @@ class BaseAgentExecutor(ABC):
     
     async def _use_tools(self, tool_calls: List[Dict[str, Any]], context: RequestContext) -> List[Dict[str, Any]]:
         """Execute tool calls - to be overridden by specific agents with tools"""
-        logger.warning(f"Agent {self.agent_name} does not implement tool usage")
+        logger.warning("Agent %s does not implement tool usage", self.agent_name)
         return []
\ No newline at end of file
@@ -1,10 +1,11 @@
 # executors/hr_executor.py
 import asyncio
 import logging
-from typing import Any, Dict, AsyncIterable, List
-import json
+from typing import Any, AsyncIterable, List
 
 from .base_executor import BaseAgentExecutor, RequestContext, TaskUpdater, TaskState, Artifact
+from .keywords import KeywordMatcher
+from .tool_result import ToolResult
 from mcp_servers.hr_server.tools import (
     create_employee_record,
     schedule_training,
@@ -14,12 +15,18 @@ from mcp_servers.hr_server.tools import (
 
 logger = logging.getLogger(__name__)
 
+_HR_HEADER = "## HR System Actions Performed:"
 
-class HRAgentExecutor(BaseAgentExecutor):
-    """HR Agent executor following mas-a2a pattern with tool integration"""
-    
-    def __init__(self):
-        system_prompt = """You are an expert Aviation HR assistant specializing in human resources management for aviation organizations.
+# Keywords that trigger each HR tool
+HR_TOOL_KEYWORDS = {
+    "create_employee_record": ["create employee", "add employee", "new hire", "onboard"],
+    "schedule_training": ["training", "schedule", "course"],
+    "track_certification": ["certification", "license", "track", "expiry"],
+    "generate_hr_report": ["report", "generate", "summary"]
+}
+_TOOL_MATCHER = KeywordMatcher(HR_TOOL_KEYWORDS)
+
+_HR_SYSTEM_PROMPT = """You are an expert Aviation HR assistant specializing in human resources management for aviation organizations.
 
 Your expertise includes:
 - Employee lifecycle management (hiring, onboarding, performance, offboarding)
@@ -50,10 +57,16 @@ Available tools:
 
 Always use the appropriate tools to perform HR tasks. Provide clear, professional responses."""
 
+
+class HRAgentExecutor(BaseAgentExecutor):
+    """HR Agent executor following mas-a2a pattern with tool integration"""
+    
+    def __init__(self):
         super().__init__(
             agent_name="Aviation HR Agent",
             agent_type="hr_specialist", 
-            system_prompt=system_prompt
+            system_prompt=_HR_SYSTEM_PROMPT,
+            actions_header=_HR_HEADER
         )
     
     async def execute_task(self, context: RequestContext, task_updater: TaskUpdater) -> AsyncIterable[Any]:
@@ -62,11 +75,21 @@ Always use the appropriate tools to perform HR tasks. Provide clear, professiona
             # Update status
             task_updater.update_status(TaskState.WORKING, "Analyzing HR request", 25.0)
             
-            # Get LLM response to understand the request
-            llm_response = await self._call_llm(context.user_message)
-            
-            # Check if we need to use tools
-            tool_results = await self._process_hr_tools(context.user_message, context)
+            # Run the LLM call and any needed tools at the same time, yielding each part as it is ready
+            llm_response, tool_results = "", []
+            async for source, result in self._stream_llm_with_tools(
+                context.user_message,
+                self._process_hr_tools(context.user_message, context)
+            ):
+                if source == "llm":
+                    llm_response = result
+                else:
+                    tool_results = result
+                yield Artifact(
+                    content=result,
+                    artifact_type="hr_partial",
+                    metadata={"agent_type": "hr", "source": source, "tenant_id": context.tenant_id}
+                )
             
             # Update progress
             task_updater.update_status(TaskState.WORKING, "Processing HR data", 75.0)
@@ -91,87 +114,62 @@ Always use the appropriate tools to perform HR tasks. Provide clear, professiona
             yield task_updater.artifacts[-1]
             
         except Exception as e:
-            logger.error(f"HR Agent execution failed: {str(e)}")
+            logger.error("HR Agent execution failed: %s", e)
             task_updater.fail(f"HR task failed: {str(e)}")
             raise
     
-    async def _process_hr_tools(self, user_message: str, context: RequestContext) -> List[Dict[str, Any]]:
+    async def _process_hr_tools(self, user_message: str, context: RequestContext) -> List[ToolResult]:
         """Process HR-related tool calls based on user message"""
-        tool_results = []
-        message_lower = user_message.lower()
+        pending = []
+        # Placeholder id shared by every tool call for this request
+        employee_id = f"EMP_{context.task_id[:8]}"
+        matched = context.detected_intents
+        if matched is None:
+            matched = _TOOL_MATCHER.match(user_message)
         
         try:
-            # Detect tool usage needs based on keywords
-            if any(keyword in message_lower for keyword in ["create employee", "add employee", "new hire", "onboard"]):
+            # Detect tool usage needs based on keywords; matched tools run together below
+            if "create_employee_record" in matched:
                 # Example employee creation - in real scenario, extract from message
-                result = await create_employee_record({
+                pending.append(("create_employee_record", self._call_tool(create_employee_record, {
                     "name": "Sample Employee",
-                    "employee_id": f"EMP_{context.task_id[:8]}",
+                    "employee_id": employee_id,
                     "position": "Aviation Specialist",
                     "department": "Operations",
                     "hire_date": "2024-01-01",
                     "certifications": []
-                })
-                tool_results.append({"tool": "create_employee_record", "result": result})
+                })))
             
-            if any(keyword in message_lower for keyword in ["training", "schedule", "course"]):
-                result = await schedule_training({
-                    "employee_id": f"EMP_{context.task_id[:8]}",
+            if "schedule_training" in matched:
+                pending.append(("schedule_training", self._call_tool(schedule_training, {
+                    "employee_id": employee_id,
                     "training_type": "Safety Training",
                     "scheduled_date": "2024-02-01",
                     "instructor": "Safety Officer",
                     "duration_hours": 8
-                })
-                tool_results.append({"tool": "schedule_training", "result": result})
+                })))
             
-            if any(keyword in message_lower for keyword in ["certification", "license", "track", "expiry"]):
-                result = await track_certification({
-                    "employee_id": f"EMP_{context.task_id[:8]}",
+            if "track_certification" in matched:
+                pending.append(("track_certification", self._call_tool(track_certification, {
+                    "employee_id": employee_id,
                     "certification_type": "Pilot License",
                     "certification_number": "PPL123456",
                     "issue_date": "2023-01-01",
                     "expiry_date": "2025-01-01",
                     "status": "active"
-                })
-                tool_results.append({"tool": "track_certification", "result": result})
+                })))
             
-            if any(keyword in message_lower for keyword in ["report", "generate", "summary"]):
-                result = await generate_hr_report({
+            if "generate_hr_report" in matched:
+                pending.append(("generate_hr_report", self._call_tool(generate_hr_report, {
                     "report_type": "employee_summary",
                     "department": "Operations",
                     "date_range": "2024-01-01_2024-12-31"
-                })
-                tool_results.append({"tool": "generate_hr_report", "result": result})
+                })))
                 
         except Exception as e:
-            logger.error(f"Tool execution failed: {str(e)}")
-            tool_results.append({"tool": "error", "result": f"Tool execution failed: {str(e)}"})
-        
-        return tool_results
-    
-    async def _combine_responses(self, llm_response: str, tool_results: List[Dict[str, Any]], user_message: str) -> str:
-        """Combine LLM response with tool results"""
-        if not tool_results:
-            return llm_response
-        
-        # Create a comprehensive response
-        combined_response = f"{llm_response}\n\n"
-        
-        if tool_results:
-            combined_response += "## HR System Actions Performed:\n\n"
-            for tool_result in tool_results:
-                tool_name = tool_result.get("tool", "unknown")
-                result = tool_result.get("result", {})
-                
-                if tool_name != "error":
-                    combined_response += f"✅ **{tool_name.replace('_', ' ').title()}:**\n"
-                    if isinstance(result, dict):
-                        for key, value in result.items():
-                            combined_response += f"   - {key.replace('_', ' ').title()}: {value}\n"
-                    else:
-                        combined_response += f"   - Result: {result}\n"
-                    combined_response += "\n"
-                else:
-                    combined_response += f"❌ **Error:** {result}\n\n"
+            logger.error("Tool execution failed: %s", e)
+            for _, call in pending:
+                call.close()
+            return [ToolResult.failed(f"Tool execution failed: {str(e)}")]
         
-        return combined_response
\ No newline at end of file
+        return await self._run_tools(pending)
@@ -0,0 +1,78 @@
+# executors/keywords.py
+import re
+from typing import Dict, FrozenSet, Iterable, Tuple
+
+try:
+    import hyperscan
+except ImportError:  # optional; the regex scan below is used instead
+    hyperscan = None
+
+
+class KeywordMatcher:
+    """Finds which keyword groups occur in a message with one scan
+    
+    Matches plain substrings case-insensitively, exactly like
+    `any(keyword in message.lower() ...)` per group, without lowercasing the message.
+    A keyword may belong to several groups. Uses a Hyperscan database when
+    hyperscan is installed, otherwise one precompiled regex.
+    """
+    
+    def __init__(self, groups: Dict[str, Iterable[str]]):
+        self._groups_of: Dict[str, Tuple[str, ...]] = {}
+        for group, keywords in groups.items():
+            for keyword in keywords:
+                self._groups_of[keyword] = self._groups_of.get(keyword, ()) + (group,)
+        # Longest first so a phrase wins over a shorter keyword at the same position;
+        # the lookahead also reports keywords that overlap an earlier match
+        alternatives = sorted(self._groups_of, key=len, reverse=True)
+        # Any other keyword found at the same position is a prefix of the winner, so
+        # each keyword also reports the groups of its prefixes ("schedule meeting"
+        # carries "schedule")
+        self._groups_at: Tuple[Tuple[str, ...], ...] = tuple(
+            tuple(dict.fromkeys(
+                group
+                for other in alternatives
+                if keyword.lower().startswith(other.lower())
+                for group in self._groups_of[other]
+            ))
+            for keyword in alternatives
+        )
+        # One group per keyword so a match maps back by index (m.lastindex), not by
+        # its text; ASCII folding keeps e.g. "ſ" from matching "s" where lower() would not
+        self._pattern = re.compile(
+            "(?=(?:" + "|".join("(" + re.escape(k) + ")" for k in alternatives) + "))",
+            re.IGNORECASE | re.ASCII,
+        )
+        self._keywords = tuple(alternatives)
+        self._database = self._compile_hyperscan() if hyperscan is not None else None
+    
+    def _compile_hyperscan(self):
+        """One Hyperscan database with a pattern per keyword (id = index in _keywords)"""
+        database = hyperscan.Database()
+        database.compile(
+            expressions=[re.escape(keyword).encode() for keyword in self._keywords],
+            ids=list(range(len(self._keywords))),
+            elements=len(self._keywords),
+            flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH] * len(self._keywords),
+        )
+        return database
+    
+    def match(self, message: str) -> FrozenSet[str]:
+        """Names of the groups with at least one keyword in the message"""
+        if self._database is not None:
+            return self._match_hyperscan(message)
+        return frozenset(
+            group
+            for m in self._pattern.finditer(message)
+            for group in self._groups_at[m.lastindex - 1]
+        )
+    
+    def _match_hyperscan(self, message: str) -> FrozenSet[str]:
+        """Single DFA scan of the encoded message; each keyword reports at most once"""
+        groups = set()
+        
+        def on_match(keyword_id, start, end, flags, context):
+            groups.update(self._groups_of[self._keywords[keyword_id]])
+        
+        self._database.scan(message.encode(), match_event_handler=on_match)
+        return frozenset(groups)
@@ -1,10 +1,11 @@
 # executors/meeting_executor.py
 import asyncio
 import logging
-from typing import Any, Dict, AsyncIterable, List
-import json
+from typing import Any, AsyncIterable, List
 
 from .base_executor import BaseAgentExecutor, RequestContext, TaskUpdater, TaskState, Artifact
+from .keywords import KeywordMatcher
+from .tool_result import ToolResult
 from mcp_servers.meeting_server.tools import (
     book_meeting_room,
     check_room_availability,
@@ -14,12 +15,18 @@ from mcp_servers.meeting_server.tools import (
 
 logger = logging.getLogger(__name__)
 
+_MEETING_HEADER = "## Meeting System Actions Performed:"
 
-class MeetingAgentExecutor(BaseAgentExecutor):
-    """Meeting Agent executor following mas-a2a pattern with tool integration"""
-    
-    def __init__(self):
-        system_prompt = """You are an expert Aviation Meeting Room Management assistant specializing in conference room booking and meeting coordination for aviation organizations.
+# Keywords that trigger each meeting tool
+MEETING_TOOL_KEYWORDS = {
+    "book_meeting_room": ["book", "reserve", "schedule meeting", "room booking"],
+    "check_room_availability": ["availability", "check", "available", "free"],
+    "cancel_booking": ["cancel", "delete", "remove booking"],
+    "generate_meeting_report": ["report", "summary", "meeting stats"]
+}
+_TOOL_MATCHER = KeywordMatcher(MEETING_TOOL_KEYWORDS)
+
+_MEETING_SYSTEM_PROMPT = """You are an expert Aviation Meeting Room Management assistant specializing in conference room booking and meeting coordination for aviation organizations.
 
 Your expertise includes:
 - Meeting room booking and management
@@ -49,10 +56,16 @@ Available tools:
 
 Always use the appropriate tools to perform meeting management tasks. Provide clear, helpful responses for meeting coordination."""
 
+
+class MeetingAgentExecutor(BaseAgentExecutor):
+    """Meeting Agent executor following mas-a2a pattern with tool integration"""
+    
+    def __init__(self):
         super().__init__(
             agent_name="Aviation Meeting Agent",
             agent_type="meeting_coordinator", 
-            system_prompt=system_prompt
+            system_prompt=_MEETING_SYSTEM_PROMPT,
+            actions_header=_MEETING_HEADER
         )
     
     async def execute_task(self, context: RequestContext, task_updater: TaskUpdater) -> AsyncIterable[Any]:
@@ -61,11 +74,21 @@ Always use the appropriate tools to perform meeting management tasks. Provide cl
             # Update status
             task_updater.update_status(TaskState.WORKING, "Analyzing meeting request", 25.0)
             
-            # Get LLM response to understand the request
-            llm_response = await self._call_llm(context.user_message)
-            
-            # Check if we need to use tools
-            tool_results = await self._process_meeting_tools(context.user_message, context)
+            # Run the LLM call and any needed tools at the same time, yielding each part as it is ready
+            llm_response, tool_results = "", []
+            async for source, result in self._stream_llm_with_tools(
+                context.user_message,
+                self._process_meeting_tools(context.user_message, context)
+            ):
+                if source == "llm":
+                    llm_response = result
+                else:
+                    tool_results = result
+                yield Artifact(
+                    content=result,
+                    artifact_type="meeting_partial",
+                    metadata={"agent_type": "meeting", "source": source, "tenant_id": context.tenant_id}
+                )
             
             # Update progress
             task_updater.update_status(TaskState.WORKING, "Processing meeting data", 75.0)
@@ -90,19 +113,21 @@ Always use the appropriate tools to perform meeting management tasks. Provide cl
             yield task_updater.artifacts[-1]
             
         except Exception as e:
-            logger.error(f"Meeting Agent execution failed: {str(e)}")
+            logger.error("Meeting Agent execution failed: %s", e)
             task_updater.fail(f"Meeting task failed: {str(e)}")
             raise
     
-    async def _process_meeting_tools(self, user_message: str, context: RequestContext) -> List[Dict[str, Any]]:
+    async def _process_meeting_tools(self, user_message: str, context: RequestContext) -> List[ToolResult]:
         """Process meeting-related tool calls based on user message"""
-        tool_results = []
-        message_lower = user_message.lower()
+        pending = []
+        matched = context.detected_intents
+        if matched is None:
+            matched = _TOOL_MATCHER.match(user_message)
         
         try:
-            # Detect tool usage needs based on keywords
-            if any(keyword in message_lower for keyword in ["book", "reserve", "schedule meeting", "room booking"]):
-                result = await book_meeting_room({
+            # Detect tool usage needs based on keywords; matched tools run together below
+            if "book_meeting_room" in matched:
+                pending.append(("book_meeting_room", self._call_tool(book_meeting_room, {
                     "room_id": "CONF_A1",
                     "meeting_title": "Aviation Team Meeting",
                     "organizer": context.user_id,
@@ -110,63 +135,34 @@ Always use the appropriate tools to perform meeting management tasks. Provide cl
                     "end_time": "2024-02-01T11:00:00",
                     "attendees": ["team@aviation.com"],
                     "equipment_needed": ["projector", "conference_phone"]
-                })
-                tool_results.append({"tool": "book_meeting_room", "result": result})
+                })))
             
-            if any(keyword in message_lower for keyword in ["availability", "check", "available", "free"]):
-                result = await check_room_availability({
+            if "check_room_availability" in matched:
+                pending.append(("check_room_availability", self._call_tool(check_room_availability, {
                     "room_id": "CONF_A1",
                     "date": "2024-02-01",
                     "start_time": "09:00",
                     "end_time": "17:00"
-                })
-                tool_results.append({"tool": "check_room_availability", "result": result})
+                })))
             
-            if any(keyword in message_lower for keyword in ["cancel", "delete", "remove booking"]):
-                result = await cancel_booking({
+            if "cancel_booking" in matched:
+                pending.append(("cancel_booking", self._call_tool(cancel_booking, {
                     "booking_id": f"BOOK_{context.task_id[:8]}",
                     "reason": "User requested cancellation",
                     "cancelled_by": context.user_id
-                })
-                tool_results.append({"tool": "cancel_booking", "result": result})
+                })))
             
-            if any(keyword in message_lower for keyword in ["report", "summary", "meeting stats"]):
-                result = await generate_meeting_report({
+            if "generate_meeting_report" in matched:
+                pending.append(("generate_meeting_report", self._call_tool(generate_meeting_report, {
                     "report_type": "room_utilization",
                     "date_range": "2024-01-01_2024-01-31",
                     "room_filter": "all"
-                })
-                tool_results.append({"tool": "generate_meeting_report", "result": result})
+                })))
                 
         except Exception as e:
-            logger.error(f"Tool execution failed: {str(e)}")
-            tool_results.append({"tool": "error", "result": f"Tool execution failed: {str(e)}"})
-        
-        return tool_results
-    
-    async def _combine_responses(self, llm_response: str, tool_results: List[Dict[str, Any]], user_message: str) -> str:
-        """Combine LLM response with tool results"""
-        if not tool_results:
-            return llm_response
-        
-        # Create a comprehensive response
-        combined_response = f"{llm_response}\n\n"
-        
-        if tool_results:
-            combined_response += "## Meeting System Actions Performed:\n\n"
-            for tool_result in tool_results:
-                tool_name = tool_result.get("tool", "unknown")
-                result = tool_result.get("result", {})
-                
-                if tool_name != "error":
-                    combined_response += f"✅ **{tool_name.replace('_', ' ').title()}:**\n"
-                    if isinstance(result, dict):
-                        for key, value in result.items():
-                            combined_response += f"   - {key.replace('_', ' ').title()}: {value}\n"
-                    else:
-                        combined_response += f"   - Result: {result}\n"
-                    combined_response += "\n"
-                else:
-                    combined_response += f"❌ **Error:** {result}\n\n"
+            logger.error("Tool execution failed: %s", e)
+            for _, call in pending:
+                call.close()
+            return [ToolResult.failed(f"Tool execution failed: {str(e)}")]
         
-        return combined_response
\ No newline at end of file
+        return await self._run_tools(pending)
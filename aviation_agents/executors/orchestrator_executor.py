@@ -1,23 +1,30 @@
 # executors/orchestrator_executor.py
 import asyncio
 import logging
-from typing import Any, Dict, AsyncIterable, List
-import json
+import os
+import re
+from typing import Any, Dict, AsyncIterable, FrozenSet, List, Optional
 from uuid import uuid4
 
 from .base_executor import BaseAgentExecutor, RequestContext, TaskUpdater, TaskState, Artifact
-from .hr_executor import HRAgentExecutor
-from .meeting_executor import MeetingAgentExecutor  
-from .supply_chain_executor import SupplyChainAgentExecutor
+from .keywords import KeywordMatcher
+from .hr_executor import HR_TOOL_KEYWORDS
+from .meeting_executor import MEETING_TOOL_KEYWORDS
+from .supply_chain_executor import SUPPLY_CHAIN_TOOL_KEYWORDS
+from .registry import get_executor
 
 logger = logging.getLogger(__name__)
 
+# Requests that ask for the agents' answers to be merged, not just listed
+_SYNTHESIS_RE = re.compile(r"compar|summar|together|combine|overall|versus|\bvs\b", re.IGNORECASE)
 
-class OrchestratorAgentExecutor(BaseAgentExecutor):
-    """Orchestrator Agent executor that coordinates all sub-agents following mas-a2a pattern"""
-    
-    def __init__(self):
-        system_prompt = """You are the Aviation Multi-Agent System Orchestrator responsible for coordinating specialized aviation agents to fulfill user requests.
+# Combined agent output longer than this is condensed by the LLM
+SYNTHESIS_CHAR_THRESHOLD = 4000
+
+# Sub-agent executions running at once across all orchestrations in this process
+_SUBAGENT_SEM = asyncio.Semaphore(int(os.getenv("ORCH_MAX_PARALLEL", "16")))
+
+_ORCHESTRATOR_SYSTEM_PROMPT = """You are the Aviation Multi-Agent System Orchestrator responsible for coordinating specialized aviation agents to fulfill user requests.
 
 Your role is to:
 1. Analyze incoming user requests
@@ -40,23 +47,40 @@ Analysis guidelines:
 
 Always provide clear, professional responses that leverage the appropriate specialized capabilities."""
 
+
+class OrchestratorAgentExecutor(BaseAgentExecutor):
+    """Orchestrator Agent executor that coordinates all sub-agents following mas-a2a pattern"""
+    
+    def __init__(self):
         super().__init__(
             agent_name="Aviation Orchestrator Agent",
             agent_type="orchestrator", 
-            system_prompt=system_prompt
+            system_prompt=_ORCHESTRATOR_SYSTEM_PROMPT
         )
         
-        # Initialize sub-agent executors
-        self.hr_executor = HRAgentExecutor()
-        self.meeting_executor = MeetingAgentExecutor()
-        self.supply_chain_executor = SupplyChainAgentExecutor()
-        
         # Agent routing keywords
         self.agent_routing = {
             "hr": ["employee", "staff", "training", "certification", "hire", "onboard", "hr", "personnel"],
             "meeting": ["meeting", "room", "book", "schedule", "conference", "reservation", "calendar"],
             "supply_chain": ["inventory", "parts", "supplier", "order", "stock", "procurement", "purchase"]
         }
+        # Agent and sub-agent tool keywords in one matcher: one scan serves every executor
+        self._intent_matcher = KeywordMatcher(
+            {**self.agent_routing, **HR_TOOL_KEYWORDS, **MEETING_TOOL_KEYWORDS, **SUPPLY_CHAIN_TOOL_KEYWORDS}
+        )
+    
+    # Sub-agent executors are shared process-wide and created on first use
+    @property
+    def hr_executor(self) -> BaseAgentExecutor:
+        return get_executor("hr")
+    
+    @property
+    def meeting_executor(self) -> BaseAgentExecutor:
+        return get_executor("meeting")
+    
+    @property
+    def supply_chain_executor(self) -> BaseAgentExecutor:
+        return get_executor("supply_chain")
     
     async def execute_task(self, context: RequestContext, task_updater: TaskUpdater) -> AsyncIterable[Any]:
         """Execute orchestration - analyze request and delegate to appropriate agents"""
@@ -64,18 +88,40 @@ Always provide clear, professional responses that leverage the appropriate speci
             # Update status
             task_updater.update_status(TaskState.WORKING, "Analyzing request and routing to agents", 10.0)
             
+            # Scan the message once; sub-agents reuse the detected intents
+            if context.detected_intents is None:
+                context.detected_intents = self._intent_matcher.match(context.user_message)
+            
             # Determine which agents to use
-            required_agents = await self._determine_required_agents(context.user_message)
+            required_agents = await self._determine_required_agents(context.detected_intents)
             
             # Update status  
             task_updater.update_status(TaskState.WORKING, f"Delegating to {len(required_agents)} agent(s)", 25.0)
             
-            # Execute sub-agents in parallel if multiple
+            # Single agent: let it run this task directly, no sub-context or synthesis needed;
+            # artifacts go through a queue so a slow client never holds a sub-agent slot
+            if len(required_agents) == 1:
+                partials = asyncio.Queue()
+                agent_task = asyncio.create_task(
+                    self._run_single_agent(required_agents[0]["executor"], context, task_updater, partials)
+                )
+                try:
+                    while (artifact := await partials.get()) is not None:
+                        yield artifact
+                    await agent_task
+                finally:
+                    # No-op once finished; stops the agent if the consumer went away
+                    agent_task.cancel()
+                return
+            
+            # Execute sub-agents in parallel, passing on their artifacts as they arrive
             agent_responses = []
-            if len(required_agents) > 1:
-                agent_responses = await self._execute_agents_parallel(required_agents, context)
-            elif len(required_agents) == 1:
-                agent_responses = await self._execute_agents_sequential(required_agents, context)
+            if required_agents:
+                partials = asyncio.Queue()
+                agents_task = asyncio.create_task(self._execute_agents(required_agents, context, partials))
+                while (artifact := await partials.get()) is not None:
+                    yield artifact
+                agent_responses = await agents_task
             else:
                 # Handle directly if no specific agents needed
                 agent_responses = [await self._handle_general_query(context)]
@@ -103,28 +149,78 @@ Always provide clear, professional responses that leverage the appropriate speci
             yield task_updater.artifacts[-1]
             
         except Exception as e:
-            logger.error(f"Orchestrator execution failed: {str(e)}")
+            logger.error("Orchestrator execution failed: %s", e)
             task_updater.fail(f"Orchestration failed: {str(e)}")
             raise
     
-    async def _determine_required_agents(self, user_message: str) -> List[Dict[str, Any]]:
-        """Determine which agents are needed based on the user message"""
+    async def _determine_required_agents(self, detected_intents: FrozenSet[str]) -> List[Dict[str, Any]]:
+        """Determine which agents are needed based on the intents found in the user message"""
         required_agents = []
-        message_lower = user_message.lower()
         
-        # Check for each agent type
-        for agent_type, keywords in self.agent_routing.items():
-            if any(keyword in message_lower for keyword in keywords):
+        # Check for each agent type (in routing order)
+        for agent_type in self.agent_routing:
+            if agent_type in detected_intents:
                 required_agents.append({
                     "agent": agent_type,
-                    "executor": getattr(self, f"{agent_type}_executor"),
+                    "executor": get_executor(agent_type),
                     "priority": 1  # All agents have equal priority for now
                 })
         
         # If no specific agents identified, we'll handle it as a general query
         return required_agents
     
-    async def _execute_agents_parallel(self, required_agents: List[Dict[str, Any]], context: RequestContext) -> List[Dict[str, Any]]:
+    async def _execute_agents(
+        self,
+        required_agents: List[Dict[str, Any]],
+        context: RequestContext,
+        partials: asyncio.Queue
+    ) -> List[Dict[str, Any]]:
+        """Execute the agents, putting their artifacts on `partials` and None when done"""
+        try:
+            if len(required_agents) > 1:
+                return await self._execute_agents_parallel(required_agents, context, partials)
+            return await self._execute_agents_sequential(required_agents, context, partials)
+        finally:
+            partials.put_nowait(None)
+    
+    @staticmethod
+    async def _run_single_agent(
+        executor: BaseAgentExecutor,
+        context: RequestContext,
+        task_updater: TaskUpdater,
+        partials: asyncio.Queue
+    ):
+        """Run the only sub-agent on this task, putting its artifacts on `partials` and None when done"""
+        try:
+            async with _SUBAGENT_SEM:
+                async for artifact in executor.execute_task(context, task_updater):
+                    partials.put_nowait(artifact)
+        finally:
+            partials.put_nowait(None)
+    
+    @staticmethod
+    async def _run_agent(
+        executor: BaseAgentExecutor,
+        agent_context: RequestContext,
+        partials: Optional[asyncio.Queue]
+    ) -> Dict[str, Any]:
+        """Run one sub-agent, forwarding its artifacts to `partials` as they are produced"""
+        result = None
+        async with _SUBAGENT_SEM:
+            async for item in executor.execute_stream(agent_context):
+                if isinstance(item, Artifact):
+                    if partials is not None:
+                        partials.put_nowait(item)
+                else:
+                    result = item
+        return result
+    
+    async def _execute_agents_parallel(
+        self,
+        required_agents: List[Dict[str, Any]],
+        context: RequestContext,
+        partials: Optional[asyncio.Queue] = None
+    ) -> List[Dict[str, Any]]:
         """Execute multiple agents in parallel"""
         tasks = []
         
@@ -135,35 +231,45 @@ Always provide clear, professional responses that leverage the appropriate speci
                 context_id=context.context_id,
                 user_message=context.user_message,
                 tenant_id=context.tenant_id,
-                user_id=context.user_id
+                user_id=context.user_id,
+                detected_intents=context.detected_intents
             )
             
             task = asyncio.create_task(
-                agent_info["executor"].execute(agent_context)
+                self._run_agent(agent_info["executor"], agent_context, partials)
             )
             tasks.append((agent_info["agent"], task))
         
-        # Wait for all agents to complete
+        # Wait for all agents together; a failure doesn't affect its siblings
+        raw = await asyncio.gather(*(task for _, task in tasks), return_exceptions=True)
+        
         results = []
-        for agent_name, task in tasks:
-            try:
-                result = await task
+        for (agent_name, _), result in zip(tasks, raw):
+            if isinstance(result, Exception):
+                logger.error("Agent %s failed: %s", agent_name, result)
+                message = f"Agent execution failed: {str(result)}"
                 results.append({
                     "agent": agent_name,
-                    "result": result,
-                    "status": "success"
+                    "result": message,
+                    "content": message,
+                    "status": "error"
                 })
-            except Exception as e:
-                logger.error(f"Agent {agent_name} failed: {str(e)}")
+            else:
                 results.append({
                     "agent": agent_name,
-                    "result": f"Agent execution failed: {str(e)}",
-                    "status": "error"
+                    "result": result,
+                    "content": self._response_content(result),
+                    "status": "success"
                 })
         
         return results
     
-    async def _execute_agents_sequential(self, required_agents: List[Dict[str, Any]], context: RequestContext) -> List[Dict[str, Any]]:
+    async def _execute_agents_sequential(
+        self,
+        required_agents: List[Dict[str, Any]],
+        context: RequestContext,
+        partials: Optional[asyncio.Queue] = None
+    ) -> List[Dict[str, Any]]:
         """Execute agents sequentially"""
         results = []
         
@@ -175,21 +281,25 @@ Always provide clear, professional responses that leverage the appropriate speci
                     context_id=context.context_id,
                     user_message=context.user_message,
                     tenant_id=context.tenant_id,
-                    user_id=context.user_id
+                    user_id=context.user_id,
+                    detected_intents=context.detected_intents
                 )
                 
-                result = await agent_info["executor"].execute(agent_context)
+                result = await self._run_agent(agent_info["executor"], agent_context, partials)
                 results.append({
                     "agent": agent_info["agent"],
                     "result": result,
+                    "content": self._response_content(result),
                     "status": "success"
                 })
                 
             except Exception as e:
-                logger.error(f"Agent {agent_info['agent']} failed: {str(e)}")
+                logger.error("Agent %s failed: %s", agent_info['agent'], e)
+                message = f"Agent execution failed: {str(e)}"
                 results.append({
                     "agent": agent_info["agent"],
-                    "result": f"Agent execution failed: {str(e)}",
+                    "result": message,
+                    "content": message,
                     "status": "error"
                 })
         
@@ -207,24 +317,54 @@ Always provide clear, professional responses that leverage the appropriate speci
                     "status": "completed",
                     "artifacts": [{"content": response, "type": "general_response"}]
                 },
+                "content": response,
                 "status": "success"
             }
         except Exception as e:
+            message = f"General query failed: {str(e)}"
             return {
                 "agent": "orchestrator", 
-                "result": f"General query failed: {str(e)}",
+                "result": message,
+                "content": message,
                 "status": "error"
             }
     
+    @staticmethod
+    def _response_content(response_data: Any) -> str:
+        """Text of an agent's result, stored once as the response's content"""
+        if isinstance(response_data, dict) and "artifacts" in response_data:
+            return response_data["artifacts"][0]["content"]
+        return str(response_data)
+    
+    def _concatenate_responses(self, agent_responses: List[Dict[str, Any]]) -> str:
+        """Successful agent responses one after another, under a heading each"""
+        parts = ["Here are the responses from our specialized agents:\n\n"]
+        for agent_response in agent_responses:
+            if agent_response["status"] == "success":
+                parts.append(f"## {agent_response['agent'].title()} Agent:\n{agent_response['content']}\n\n")
+        return "".join(parts)
+    
+    def _needs_llm_synthesis(self, user_message: str, agent_responses: List[Dict[str, Any]]) -> bool:
+        """Whether the responses need an extra LLM call to merge, rather than concatenation"""
+        if _SYNTHESIS_RE.search(user_message):
+            return True
+        
+        total_chars = sum(
+            len(agent_response["content"])
+            for agent_response in agent_responses
+            if agent_response["status"] == "success"
+        )
+        return total_chars > SYNTHESIS_CHAR_THRESHOLD
+    
     async def _synthesize_responses(self, agent_responses: List[Dict[str, Any]], user_message: str) -> str:
         """Synthesize responses from multiple agents into a coherent response"""
         if len(agent_responses) == 1:
             # Single agent response
-            response_data = agent_responses[0]["result"]
-            if isinstance(response_data, dict) and "artifacts" in response_data:
-                return response_data["artifacts"][0]["content"]
-            else:
-                return str(response_data)
+            return agent_responses[0]["content"]
+        
+        # Already formatted per agent: skip the extra LLM round trip unless asked to combine them
+        if not self._needs_llm_synthesis(user_message, agent_responses):
+            return self._concatenate_responses(agent_responses)
         
         # Multiple agent responses - synthesize
         synthesis_prompt = f"""Based on the user query: "{user_message}"
@@ -236,12 +376,7 @@ The following specialized agents have provided responses:
         for agent_response in agent_responses:
             agent_name = agent_response["agent"]
             if agent_response["status"] == "success":
-                response_data = agent_response["result"]
-                if isinstance(response_data, dict) and "artifacts" in response_data:
-                    content = response_data["artifacts"][0]["content"]
-                else:
-                    content = str(response_data)
-                synthesis_prompt += f"**{agent_name.title()} Agent Response:**\n{content}\n\n"
+                synthesis_prompt += f"**{agent_name.title()} Agent Response:**\n{agent_response['content']}\n\n"
             else:
                 synthesis_prompt += f"**{agent_name.title()} Agent:** Failed to process request\n\n"
         
@@ -252,15 +387,5 @@ The following specialized agents have provided responses:
             return synthesized_response
         except Exception as e:
             # Fallback to concatenated responses
-            logger.error(f"Synthesis failed: {str(e)}")
-            fallback_response = "Here are the responses from our specialized agents:\n\n"
-            for agent_response in agent_responses:
-                agent_name = agent_response["agent"]
-                if agent_response["status"] == "success":
-                    response_data = agent_response["result"]
-                    if isinstance(response_data, dict) and "artifacts" in response_data:
-                        content = response_data["artifacts"][0]["content"]
-                    else:
-                        content = str(response_data)
-                    fallback_response += f"## {agent_name.title()} Agent:\n{content}\n\n"
-            return fallback_response
\ No newline at end of file
+            logger.error("Synthesis failed: %s", e)
+            return self._concatenate_responses(agent_responses)
\ No newline at end of file
@@ -0,0 +1,20 @@
+# executors/registry.py
+from functools import lru_cache
+
+from .base_executor import BaseAgentExecutor
+from .hr_executor import HRAgentExecutor
+from .meeting_executor import MeetingAgentExecutor
+from .supply_chain_executor import SupplyChainAgentExecutor
+
+# Specialist executors by agent type
+EXECUTOR_CLASSES = {
+    "hr": HRAgentExecutor,
+    "meeting": MeetingAgentExecutor,
+    "supply_chain": SupplyChainAgentExecutor
+}
+
+
+@lru_cache(maxsize=None)
+def get_executor(agent_type: str) -> BaseAgentExecutor:
+    """Process-wide specialist executor, created on first use"""
+    return EXECUTOR_CLASSES[agent_type]()
@@ -1,10 +1,11 @@
 # executors/supply_chain_executor.py
 import asyncio
 import logging
-from typing import Any, Dict, AsyncIterable, List
-import json
+from typing import Any, AsyncIterable, List
 
 from .base_executor import BaseAgentExecutor, RequestContext, TaskUpdater, TaskState, Artifact
+from .keywords import KeywordMatcher
+from .tool_result import ToolResult
 from mcp_servers.supply_chain_server.tools import (
     track_inventory,
     order_parts,
@@ -14,12 +15,16 @@ from mcp_servers.supply_chain_server.tools import (
 
 logger = logging.getLogger(__name__)
 
+# Keywords that trigger each supply chain tool
+SUPPLY_CHAIN_TOOL_KEYWORDS = {
+    "track_inventory": frozenset({"inventory", "stock", "check parts", "track"}),
+    "order_parts": frozenset({"order", "purchase", "buy parts", "procurement"}),
+    "check_supplier_status": frozenset({"supplier", "vendor", "check supplier"}),
+    "generate_inventory_report": frozenset({"report", "inventory report", "summary"})
+}
+_TOOL_MATCHER = KeywordMatcher(SUPPLY_CHAIN_TOOL_KEYWORDS)
 
-class SupplyChainAgentExecutor(BaseAgentExecutor):
-    """Supply Chain Agent executor following mas-a2a pattern with tool integration"""
-    
-    def __init__(self):
-        system_prompt = """You are an expert Aviation Supply Chain Management assistant specializing in inventory, procurement, and supplier management for aviation organizations.
+_SUPPLY_CHAIN_SYSTEM_PROMPT = """You are an expert Aviation Supply Chain Management assistant specializing in inventory, procurement, and supplier management for aviation organizations.
 
 Your expertise includes:
 - Aircraft parts and components inventory
@@ -49,10 +54,16 @@ Available tools:
 
 Always use the appropriate tools to perform supply chain tasks. Provide clear, detailed responses for procurement and inventory management."""
 
+
+class SupplyChainAgentExecutor(BaseAgentExecutor):
+    """Supply Chain Agent executor following mas-a2a pattern with tool integration"""
+    
+    def __init__(self):
         super().__init__(
             agent_name="Aviation Supply Chain Agent",
             agent_type="supply_chain_specialist", 
-            system_prompt=system_prompt
+            system_prompt=_SUPPLY_CHAIN_SYSTEM_PROMPT,
+            actions_header="## Supply Chain System Actions Performed:"
         )
     
     async def execute_task(self, context: RequestContext, task_updater: TaskUpdater) -> AsyncIterable[Any]:
@@ -61,11 +72,21 @@ Always use the appropriate tools to perform supply chain tasks. Provide clear, d
             # Update status
             task_updater.update_status(TaskState.WORKING, "Analyzing supply chain request", 25.0)
             
-            # Get LLM response to understand the request
-            llm_response = await self._call_llm(context.user_message)
-            
-            # Check if we need to use tools
-            tool_results = await self._process_supply_chain_tools(context.user_message, context)
+            # Run the LLM call and any needed tools at the same time, yielding each part as it is ready
+            llm_response, tool_results = "", []
+            async for source, result in self._stream_llm_with_tools(
+                context.user_message,
+                self._process_supply_chain_tools(context.user_message, context)
+            ):
+                if source == "llm":
+                    llm_response = result
+                else:
+                    tool_results = result
+                yield Artifact(
+                    content=result,
+                    artifact_type="supply_chain_partial",
+                    metadata={"agent_type": "supply_chain", "source": source, "tenant_id": context.tenant_id}
+                )
             
             # Update progress
             task_updater.update_status(TaskState.WORKING, "Processing supply chain data", 75.0)
@@ -90,80 +111,53 @@ Always use the appropriate tools to perform supply chain tasks. Provide clear, d
             yield task_updater.artifacts[-1]
             
         except Exception as e:
-            logger.error(f"Supply Chain Agent execution failed: {str(e)}")
+            logger.error("Supply Chain Agent execution failed: %s", e)
             task_updater.fail(f"Supply chain task failed: {str(e)}")
             raise
     
-    async def _process_supply_chain_tools(self, user_message: str, context: RequestContext) -> List[Dict[str, Any]]:
+    async def _process_supply_chain_tools(self, user_message: str, context: RequestContext) -> List[ToolResult]:
         """Process supply chain-related tool calls based on user message"""
-        tool_results = []
-        message_lower = user_message.lower()
+        pending = []
+        matched = context.detected_intents
+        if matched is None:
+            matched = _TOOL_MATCHER.match(user_message)
         
         try:
-            # Detect tool usage needs based on keywords
-            if any(keyword in message_lower for keyword in ["inventory", "stock", "check parts", "track"]):
-                result = await track_inventory({
+            # Detect tool usage needs based on keywords; matched tools run together below
+            if "track_inventory" in matched:
+                pending.append(("track_inventory", self._call_tool(track_inventory, {
                     "part_number": "ENG_PART_001",
                     "location": "Main Warehouse",
                     "check_type": "current_stock"
-                })
-                tool_results.append({"tool": "track_inventory", "result": result})
+                })))
             
-            if any(keyword in message_lower for keyword in ["order", "purchase", "buy parts", "procurement"]):
-                result = await order_parts({
+            if "order_parts" in matched:
+                pending.append(("order_parts", self._call_tool(order_parts, {
                     "part_number": "ENG_PART_001",
                     "quantity": 5,
                     "supplier_id": "SUP_001",
                     "priority": "normal",
                     "delivery_date": "2024-02-15",
                     "cost_center": "Maintenance"
-                })
-                tool_results.append({"tool": "order_parts", "result": result})
+                })))
             
-            if any(keyword in message_lower for keyword in ["supplier", "vendor", "check supplier"]):
-                result = await check_supplier_status({
+            if "check_supplier_status" in matched:
+                pending.append(("check_supplier_status", self._call_tool(check_supplier_status, {
                     "supplier_id": "SUP_001",
                     "check_type": "full_status"
-                })
-                tool_results.append({"tool": "check_supplier_status", "result": result})
+                })))
             
-            if any(keyword in message_lower for keyword in ["report", "inventory report", "summary"]):
-                result = await generate_inventory_report({
+            if "generate_inventory_report" in matched:
+                pending.append(("generate_inventory_report", self._call_tool(generate_inventory_report, {
                     "report_type": "low_stock_alert",
                     "date_range": "2024-01-01_2024-01-31",
                     "location_filter": "all"
-                })
-                tool_results.append({"tool": "generate_inventory_report", "result": result})
+                })))
                 
         except Exception as e:
-            logger.error(f"Tool execution failed: {str(e)}")
-            tool_results.append({"tool": "error", "result": f"Tool execution failed: {str(e)}"})
-        
-        return tool_results
-    
-    async def _combine_responses(self, llm_response: str, tool_results: List[Dict[str, Any]], user_message: str) -> str:
-        """Combine LLM response with tool results"""
-        if not tool_results:
-            return llm_response
-        
-        # Create a comprehensive response
-        combined_response = f"{llm_response}\n\n"
-        
-        if tool_results:
-            combined_response += "## Supply Chain System Actions Performed:\n\n"
-            for tool_result in tool_results:
-                tool_name = tool_result.get("tool", "unknown")
-                result = tool_result.get("result", {})
-                
-                if tool_name != "error":
-                    combined_response += f"✅ **{tool_name.replace('_', ' ').title()}:**\n"
-                    if isinstance(result, dict):
-                        for key, value in result.items():
-                            combined_response += f"   - {key.replace('_', ' ').title()}: {value}\n"
-                    else:
-                        combined_response += f"   - Result: {result}\n"
-                    combined_response += "\n"
-                else:
-                    combined_response += f"❌ **Error:** {result}\n\n"
+            logger.error("Tool execution failed: %s", e)
+            for _, call in pending:
+                call.close()
+            return [ToolResult.failed(f"Tool execution failed: {str(e)}")]
         
-        return combined_response
\ No newline at end of file
+        return await self._run_tools(pending)
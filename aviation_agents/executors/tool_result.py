@@ -0,0 +1,21 @@
+# executors/tool_result.py
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
+
+
+@dataclass(slots=True)
+class ToolResult:
+    """Outcome of one tool call, in one shape: `fields` on success, `error` on failure"""
+    tool: str
+    fields: Dict[str, Any] = field(default_factory=dict)
+    error: Optional[str] = None
+    
+    @classmethod
+    def from_result(cls, tool: str, result: Any) -> "ToolResult":
+        """Wrap a tool's return value; non-dict values become a single "result" field"""
+        return cls(tool, result if isinstance(result, dict) else {"result": result})
+    
+    @classmethod
+    def failed(cls, message: str) -> "ToolResult":
+        """A failed tool call (reported under the "error" tool name)"""
+        return cls("error", error=message)
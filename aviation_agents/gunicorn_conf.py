@@ -0,0 +1,21 @@
+# gunicorn_conf.py - production server settings for main.py
+#
+#   gunicorn -c gunicorn_conf.py main:app
+#
+# Each worker is a separate process with its own event loop, so a slow agent call
+# or a CPU-heavy stretch in one worker doesn't hold up requests on the others.
+# Executors, caches and the mock tool databases are per process.
+#
+# WEB_CONCURRENCY sets the number of workers. Every worker builds its own executors,
+# LLM response cache and HTTP connection pool, so the default of cpu*2+1 workers
+# multiplies the concurrent load on the Ollama backend; lower it to match what the
+# model server can take.
+import multiprocessing
+import os
+
+bind = os.getenv("BIND", "0.0.0.0:8000")
+worker_class = "uvicorn.workers.UvicornWorker"
+workers = int(os.getenv("WEB_CONCURRENCY", multiprocessing.cpu_count() * 2 + 1))
+keepalive = 5
+loglevel = "warning"
+accesslog = None
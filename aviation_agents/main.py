@@ -1,9 +1,10 @@
 # main.py - Aviation Multi-Agent System with mas-a2a executor pattern
 import asyncio
+import importlib.util
 import uvicorn
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, FileResponse
+from fastapi.responses import JSONResponse, ORJSONResponse, FileResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel
 from typing import Dict, List, Optional, Any
@@ -13,15 +14,26 @@ import json
 from datetime import datetime, date
 import os
 import logging
+from collections import OrderedDict
+from dataclasses import asdict, is_dataclass
+from functools import lru_cache
 
 # Local imports
 from config.settings import settings
 from config.tenant_config import get_tenant_config, list_tenants
-from executors import OrchestratorAgentExecutor, HRAgentExecutor, MeetingAgentExecutor, SupplyChainAgentExecutor
-from executors.base_executor import RequestContext
+from executors import OrchestratorAgentExecutor
+from executors.base_executor import Artifact, BaseAgentExecutor, RequestContext, TenantLogFilter
+from executors.registry import EXECUTOR_CLASSES, get_executor
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+try:
+    import orjson
+except ImportError:  # optional; the stdlib encoder is used instead
+    orjson = None
+
+# Configure logging; every record carries the tenant and task of its request
+logging.basicConfig(level=logging.INFO, format="%(levelname)s:%(name)s:[%(tenant_id)s %(task_id)s] %(message)s")
+for handler in logging.getLogger().handlers:
+    handler.addFilter(TenantLogFilter())
 logger = logging.getLogger(__name__)
 
 # Pydantic models for API
@@ -44,11 +56,15 @@ class AgentStatusResponse(BaseModel):
     available_tenants: List[str]
     system_status: str
 
+# Serialize responses with orjson when it is installed
+JSONResponseClass = ORJSONResponse if importlib.util.find_spec("orjson") else JSONResponse
+
 # Initialize FastAPI app
 app = FastAPI(
     title="Aviation Multi-Agent System",
     description="Multi-tenant aviation agent system with mas-a2a executor pattern",
-    version="2.0.0"
+    version="2.0.0",
+    default_response_class=JSONResponseClass
 )
 
 # Add CORS middleware
@@ -60,43 +76,89 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Initialize agent executors
-orchestrator = OrchestratorAgentExecutor()
-hr_agent = HRAgentExecutor()
-meeting_agent = MeetingAgentExecutor()
-supply_chain_agent = SupplyChainAgentExecutor()
-
-# Agent registry
-AGENT_REGISTRY = {
-    "orchestrator": orchestrator,
-    "hr": hr_agent, 
-    "meeting": meeting_agent,
-    "supply_chain": supply_chain_agent
+# Agent types served by the API; each worker builds an executor only when it is first requested
+AGENT_TYPES = ("orchestrator", *EXECUTOR_CLASSES)
+
+@lru_cache(maxsize=None)
+def get_agent(agent_type: str) -> BaseAgentExecutor:
+    """Executor for an agent type (the specialists are the same instances the orchestrator uses)"""
+    if agent_type == "orchestrator":
+        return OrchestratorAgentExecutor()
+    return get_executor(agent_type)
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Release the executors' shared HTTP connections"""
+    await BaseAgentExecutor.aclose()
+
+# What GET / serves, resolved once at startup rather than with a stat per request
+_INDEX_PATH = "web/index.html" if os.path.isfile("web/index.html") else None
+_API_INFO = {
+    "message": "Aviation Multi-Agent System API",
+    "version": "2.0.0",
+    "endpoints": {
+        "chat": "/chat",
+        "chat_stream": "/chat/stream",
+        "agents": "/agents",
+        "health": "/health"
+    },
+    "available_agents": list(AGENT_TYPES)
 }
 
 @app.get("/")
 async def read_root():
     """Serve the web interface"""
-    import os
-    if os.path.exists("web/index.html"):
-        return FileResponse("web/index.html")
-    else:
-        return JSONResponse(content={
-            "message": "Aviation Multi-Agent System API",
-            "version": "2.0.0",
-            "endpoints": {
-                "chat": "/chat",
-                "agents": "/agents",
-                "health": "/health"
-            },
-            "available_agents": list(AGENT_REGISTRY.keys())
-        })
+    if _INDEX_PATH:
+        return FileResponse(_INDEX_PATH)
+    return JSONResponseClass(content=_API_INFO)
 
 # Mount static files only if web directory exists
-import os
 if os.path.exists("web"):
     app.mount("/static", StaticFiles(directory="web"), name="static")
 
+def _json_default(value: Any) -> Any:
+    """Encode what json does not know natively (tool results, timestamps)"""
+    if is_dataclass(value):
+        return asdict(value)
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return str(value)
+
+def _ndjson_line(value: Dict[str, Any]) -> bytes:
+    """One newline-terminated JSON record for a streamed response"""
+    if orjson is not None:
+        return orjson.dumps(value, default=_json_default, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(value, default=_json_default) + "\n").encode()
+
+@app.post("/chat/stream")
+async def chat_stream_endpoint(request: ChatRequest):
+    """Chat endpoint that streams each artifact as NDJSON as soon as the agent produces it
+    
+    The last line (type "result") carries the same result dict /chat is built from.
+    """
+    agent_executor = get_agent(request.agent_type if request.agent_type in AGENT_TYPES else "orchestrator")
+    context = RequestContext(
+        task_id=str(uuid.uuid4()),
+        context_id=str(uuid.uuid4()),
+        user_message=request.message,
+        tenant_id=request.tenant_id,
+        user_id=request.user_id
+    )
+    
+    async def stream_lines():
+        async for item in agent_executor.execute_stream(context):
+            if isinstance(item, Artifact):
+                yield _ndjson_line({
+                    "type": "artifact",
+                    "artifact_type": item.artifact_type,
+                    "content": item.content,
+                    "metadata": item.metadata
+                })
+            else:
+                yield _ndjson_line({"type": "result", **item})
+    
+    return StreamingResponse(stream_lines(), media_type="application/x-ndjson")
+
 @app.post("/chat", response_model=ChatResponse)
 async def chat_endpoint(request: ChatRequest):
     """Main chat endpoint using executor pattern"""
@@ -104,7 +166,7 @@ async def chat_endpoint(request: ChatRequest):
         start_time = time.time()
         
         # Get the appropriate agent executor
-        agent_executor = AGENT_REGISTRY.get(request.agent_type, orchestrator)
+        agent_executor = get_agent(request.agent_type if request.agent_type in AGENT_TYPES else "orchestrator")
         
         # Create request context
         context = RequestContext(
@@ -149,8 +211,8 @@ async def get_agents_status():
     """Get available agents and system status"""
     try:
         return AgentStatusResponse(
-            available_agents=list(AGENT_REGISTRY.keys()),
-            available_tenants=list_tenants(),
+            available_agents=list(AGENT_TYPES),
+            available_tenants=_cached_tenant_lookup(("tenants",), list_tenants),
             system_status="operational"
         )
     except Exception as e:
@@ -160,10 +222,10 @@ async def get_agents_status():
 @app.get("/agents/{agent_type}/status")
 async def get_agent_status(agent_type: str):
     """Get specific agent status"""
-    if agent_type not in AGENT_REGISTRY:
+    if agent_type not in AGENT_TYPES:
         raise HTTPException(status_code=404, detail=f"Agent {agent_type} not found")
     
-    agent = AGENT_REGISTRY[agent_type]
+    agent = get_agent(agent_type)
     return {
         "agent_name": agent.agent_name,
         "agent_type": agent.agent_type,
@@ -174,18 +236,40 @@ async def get_agent_status(agent_type: str):
 @app.post("/agents/{agent_type}/chat")
 async def chat_with_specific_agent(agent_type: str, request: ChatRequest):
     """Chat with a specific agent directly"""
-    if agent_type not in AGENT_REGISTRY:
+    if agent_type not in AGENT_TYPES:
         raise HTTPException(status_code=404, detail=f"Agent {agent_type} not found")
     
     # Override the agent type in the request
     request.agent_type = agent_type
     return await chat_endpoint(request)
 
+# Tenant lookups rarely change, so repeat calls are served from memory (TTL 0 disables it)
+TENANT_CACHE_SIZE = 256
+TENANT_CACHE_TTL = float(os.getenv("TENANT_CACHE_TTL", "60"))
+_tenant_cache: "OrderedDict[tuple, tuple]" = OrderedDict()  # key -> (expires_at, value)
+
+def _cached_tenant_lookup(key: tuple, load):
+    """Return load() for key, reusing a result younger than TENANT_CACHE_TTL seconds"""
+    cached = _tenant_cache.get(key)
+    if cached is not None:
+        if cached[0] > time.monotonic():
+            _tenant_cache.move_to_end(key)
+            return cached[1]
+        del _tenant_cache[key]
+    
+    # Lookups that raise are not cached
+    value = load()
+    if TENANT_CACHE_TTL > 0:
+        _tenant_cache[key] = (time.monotonic() + TENANT_CACHE_TTL, value)
+        while len(_tenant_cache) > TENANT_CACHE_SIZE:
+            _tenant_cache.popitem(last=False)
+    return value
+
 @app.get("/tenants")
 async def get_tenants():
     """Get available tenants"""
     try:
-        tenants = list_tenants()
+        tenants = _cached_tenant_lookup(("tenants",), list_tenants)
         return {"tenants": tenants}
     except Exception as e:
         logger.error(f"Tenants endpoint error: {str(e)}")
@@ -195,7 +279,7 @@ async def get_tenants():
 async def get_tenant_config_endpoint(tenant_id: str):
     """Get tenant-specific configuration"""
     try:
-        config = get_tenant_config(tenant_id)
+        config = _cached_tenant_lookup(("config", tenant_id), lambda: get_tenant_config(tenant_id))
         return {"tenant_id": tenant_id, "config": config}
     except Exception as e:
         logger.error(f"Tenant config error: {str(e)}")
@@ -207,10 +291,12 @@ async def health_check():
     return {
         "status": "healthy",
         "timestamp": datetime.now().isoformat(),
-        "agents": len(AGENT_REGISTRY),
+        "agents": len(AGENT_TYPES),
         "model": settings.default_model
     }
 
+# Production: gunicorn -c gunicorn_conf.py main:app (several UvicornWorker processes).
+# Running this file starts a single development server.
 if __name__ == "__main__":
     print("🛫 Starting Aviation Multi-Agent System with mas-a2a executors...")
     print(f"🔧 Using Ollama model: {settings.default_model}")
@@ -218,9 +304,14 @@ if __name__ == "__main__":
     print("📱 Web interface: http://localhost:8000")
     print("ℹ️  System will work with or without Ollama running")
     
+    # uvloop/httptools come with uvicorn[standard]; fall back to the stdlib loop
+    # and h11 where they aren't installed (e.g. Windows dev machines)
     uvicorn.run(
         app, 
         host="0.0.0.0", 
         port=8000,
-        log_level="info"
+        log_level="warning",
+        loop="uvloop" if importlib.util.find_spec("uvloop") else "asyncio",
+        http="httptools" if importlib.util.find_spec("httptools") else "h11",
+        access_log=False
     )
\ No newline at end of file
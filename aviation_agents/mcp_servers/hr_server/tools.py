@@ -1,7 +1,9 @@
 # mcp_servers/hr_server/tools.py - Simplified tools without adk dependencies
 from typing import List, Optional, Dict, Any
 from datetime import datetime, date, timedelta
-import uuid
+from bisect import bisect_left, bisect_right
+from collections import Counter
+import secrets
 import asyncio
 
 # Aviation industry departments
@@ -16,23 +18,70 @@ employees_db: Dict[str, Dict[str, Any]] = {}
 certifications_db: Dict[str, List[Dict[str, Any]]] = {}
 trainings_db: Dict[str, List[Dict[str, Any]]] = {}
 
+# Report indexes over employees_db, kept up to date by create_employee_record
+_status_counts: Counter = Counter()
+_department_counts: Counter = Counter()
+# Only hire dates in YYYY-MM-DD form are indexed (other formats are stored as given)
+_hire_dates: List[date] = []  # sorted; _hire_ids[i] was hired on _hire_dates[i]
+_hire_ids: List[str] = []
+_hire_date_of: Dict[str, date] = {}
+# Running totals over certifications_db / trainings_db, bumped on every append
+_record_counts: Counter = Counter()
+
+def _index_employee(employee: Dict[str, Any], hired: Optional[date]) -> None:
+    """Add an employee record to the report indexes (hired is None for an unparsed hire date)"""
+    _status_counts[employee["status"]] += 1
+    _department_counts[employee["department"]] += 1
+    if hired is None:
+        return
+    i = bisect_right(_hire_dates, hired)
+    _hire_dates.insert(i, hired)
+    _hire_ids.insert(i, employee["employee_id"])
+    _hire_date_of[employee["employee_id"]] = hired
+
+def _unindex_employee(employee: Dict[str, Any]) -> None:
+    """Remove an employee record that is about to be replaced from the report indexes"""
+    for counts, key in ((_status_counts, employee.get("status")), (_department_counts, employee.get("department"))):
+        counts[key] -= 1
+        if counts[key] <= 0:
+            del counts[key]
+    employee_id = employee["employee_id"]
+    hired = _hire_date_of.pop(employee_id, None)
+    if hired is None:
+        return
+    i = bisect_left(_hire_dates, hired)
+    while _hire_ids[i] != employee_id:
+        i += 1
+    del _hire_dates[i], _hire_ids[i]
+
 async def create_employee_record(employee_data: Dict[str, Any]) -> Dict[str, Any]:
     """Create a new employee record"""
     try:
-        employee_id = employee_data.get("employee_id", f"EMP_{str(uuid.uuid4())[:8]}")
+        now = datetime.now()  # one clock read shared by every timestamp below
+        # Only mint an id when the caller did not supply one
+        employee_id = employee_data["employee_id"] if "employee_id" in employee_data else f"EMP_{secrets.token_hex(4)}"
         
         employee = {
             "employee_id": employee_id,
             "name": employee_data.get("name", "Unknown"),
             "position": employee_data.get("position", "Staff"),
             "department": employee_data.get("department", "General"),
-            "hire_date": employee_data.get("hire_date", datetime.now().strftime("%Y-%m-%d")),
+            "hire_date": employee_data.get("hire_date", now.strftime("%Y-%m-%d")),
             "certifications": employee_data.get("certifications", []),
             "status": "active",
-            "created_at": datetime.now().isoformat()
+            "created_at": now.isoformat()
         }
         
+        # Parse the hire date once here so reports never have to
+        try:
+            hired = datetime.strptime(employee["hire_date"], "%Y-%m-%d").date()
+        except (TypeError, ValueError):
+            hired = None
+        
+        if employee_id in employees_db:
+            _unindex_employee(employees_db[employee_id])
         employees_db[employee_id] = employee
+        _index_employee(employee, hired)
         
         return {
             "status": "success",
@@ -50,23 +99,25 @@ async def create_employee_record(employee_data: Dict[str, Any]) -> Dict[str, Any
 async def schedule_training(training_data: Dict[str, Any]) -> Dict[str, Any]:
     """Schedule training for an employee"""
     try:
-        training_id = f"TRN_{str(uuid.uuid4())[:8]}"
+        now = datetime.now()
+        training_id = f"TRN_{secrets.token_hex(4)}"
         employee_id = training_data.get("employee_id")
         
         training = {
             "training_id": training_id,
             "employee_id": employee_id,
             "training_type": training_data.get("training_type", "General Training"),
-            "scheduled_date": training_data.get("scheduled_date", datetime.now().strftime("%Y-%m-%d")),
+            "scheduled_date": training_data.get("scheduled_date", now.strftime("%Y-%m-%d")),
             "instructor": training_data.get("instructor", "TBD"),
             "duration_hours": training_data.get("duration_hours", 8),
             "status": "scheduled",
-            "created_at": datetime.now().isoformat()
+            "created_at": now.isoformat()
         }
         
         if employee_id not in trainings_db:
             trainings_db[employee_id] = []
         trainings_db[employee_id].append(training)
+        _record_counts["trainings"] += 1
         
         return {
             "status": "success",
@@ -84,7 +135,8 @@ async def schedule_training(training_data: Dict[str, Any]) -> Dict[str, Any]:
 async def track_certification(cert_data: Dict[str, Any]) -> Dict[str, Any]:
     """Track employee certification"""
     try:
-        cert_id = f"CERT_{str(uuid.uuid4())[:8]}"
+        now = datetime.now()
+        cert_id = f"CERT_{secrets.token_hex(4)}"
         employee_id = cert_data.get("employee_id")
         
         certification = {
@@ -92,15 +144,16 @@ async def track_certification(cert_data: Dict[str, Any]) -> Dict[str, Any]:
             "employee_id": employee_id,
             "certification_type": cert_data.get("certification_type", "Unknown"),
             "certification_number": cert_data.get("certification_number", ""),
-            "issue_date": cert_data.get("issue_date", datetime.now().strftime("%Y-%m-%d")),
+            "issue_date": cert_data.get("issue_date", now.strftime("%Y-%m-%d")),
             "expiry_date": cert_data.get("expiry_date", ""),
             "status": cert_data.get("status", "active"),
-            "created_at": datetime.now().isoformat()
+            "created_at": now.isoformat()
         }
         
         if employee_id not in certifications_db:
             certifications_db[employee_id] = []
         certifications_db[employee_id].append(certification)
+        _record_counts["certifications"] += 1
         
         return {
             "status": "success",
@@ -118,25 +171,26 @@ async def track_certification(cert_data: Dict[str, Any]) -> Dict[str, Any]:
 async def generate_hr_report(report_data: Dict[str, Any]) -> Dict[str, Any]:
     """Generate HR reports"""
     try:
+        now = datetime.now()
         report_type = report_data.get("report_type", "summary")
-        report_id = f"RPT_{str(uuid.uuid4())[:8]}"
+        report_id = f"RPT_{secrets.token_hex(4)}"
         
         if report_type == "employee_summary":
+            # Hired strictly after the cutoff day, as the old midnight-vs-now comparison did
+            cutoff = (now - timedelta(days=30)).date()
             report_content = {
                 "total_employees": len(employees_db),
-                "active_employees": len([e for e in employees_db.values() if e.get("status") == "active"]),
-                "departments": list(set([e.get("department") for e in employees_db.values()])),
-                "recent_hires": [e for e in employees_db.values() if 
-                               datetime.strptime(e.get("hire_date", "1900-01-01"), "%Y-%m-%d") > 
-                               datetime.now() - timedelta(days=30)]
+                "active_employees": _status_counts["active"],
+                "departments": list(_department_counts),
+                "recent_hires": [employees_db[employee_id] for employee_id in _hire_ids[bisect_right(_hire_dates, cutoff):]]
             }
         else:
             report_content = {
                 "message": f"Report type '{report_type}' generated",
                 "data": {
                     "employees": len(employees_db),
-                    "certifications": sum(len(certs) for certs in certifications_db.values()),
-                    "trainings": sum(len(trainings) for trainings in trainings_db.values())
+                    "certifications": _record_counts["certifications"],
+                    "trainings": _record_counts["trainings"]
                 }
             }
         
@@ -146,7 +200,7 @@ async def generate_hr_report(report_data: Dict[str, Any]) -> Dict[str, Any]:
             "report_id": report_id,
             "report_type": report_type,
             "content": report_content,
-            "generated_at": datetime.now().isoformat()
+            "generated_at": now.isoformat()
         }
         
     except Exception as e:
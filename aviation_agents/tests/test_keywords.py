@@ -0,0 +1,48 @@
+# tests/test_keywords.py
+from executors.keywords import KeywordMatcher
+
+
+def test_non_ascii_text_does_not_fold_into_keywords():
+    matcher = KeywordMatcher({"track_inventory": {"stock"}, "order_parts": {"order"}})
+    
+    assert matcher.match("check the ſtock level") == frozenset()
+    assert matcher.match("Ünïcödé ORDER ✈") == {"order_parts"}
+
+
+def _reference(groups, message):
+    lowered = message.lower()
+    return frozenset(g for g, keywords in groups.items() if any(k in lowered for k in keywords))
+
+
+def test_matches_substring_check_for_every_keyword_pair():
+    groups = {
+        "schedule_training": {"schedule", "training"},
+        "schedule_meeting": {"schedule meeting", "meeting"},
+        "track_inventory": {"inventory", "stock"},
+        "generate_inventory_report": {"inventory report", "report"},
+    }
+    matcher = KeywordMatcher(groups)
+    keywords = [k for ks in groups.values() for k in ks]
+    
+    for first in keywords:
+        for second in keywords:
+            for message in (f"{first} {second}", f"{first}{second}", f"Please {first.upper()} for {second}"):
+                assert matcher.match(message) == _reference(groups, message), message
+
+
+def test_shorter_keyword_at_same_start_is_not_shadowed():
+    matcher = KeywordMatcher({"schedule_training": {"schedule"}, "schedule_meeting": {"schedule meeting"}})
+    
+    assert matcher.match("Please schedule meeting for Monday") == {"schedule_training", "schedule_meeting"}
+
+
+def test_supply_chain_tool_matcher_keeps_overlapping_tools():
+    from executors.supply_chain_executor import SUPPLY_CHAIN_TOOL_KEYWORDS, _TOOL_MATCHER
+    
+    message = "Send me the inventory report"
+    assert _TOOL_MATCHER.match(message) == {"track_inventory", "generate_inventory_report"}
+    keywords = [k for ks in SUPPLY_CHAIN_TOOL_KEYWORDS.values() for k in ks]
+    for first in keywords:
+        for second in keywords:
+            message = f"{first} {second}"
+            assert _TOOL_MATCHER.match(message) == _reference(SUPPLY_CHAIN_TOOL_KEYWORDS, message), message